@@ -0,0 +1,58 @@
+"""
+Compares the per element cost of coercing lists of epoch timestamps one at
+a time and through the batch coercion method of `NaiveDateTime`, for lists
+of 10, 1k and 100k elements. The other scalars don't provide batch methods:
+they didn't beat the loop over their coercion methods, which `coerce_list`
+falls back to.
+
+Usage: python benchmarks/bench_batch.py [--sizes 10,1000,100000]
+"""
+import argparse
+import timeit
+
+from tartiflette_plugin_scalars.naive_datetime import NaiveDateTime
+
+_CASES = [
+    (
+        "NaiveDateTime.coerce_input",
+        NaiveDateTime(),
+        "input",
+        lambda index: 1568988000 + index * 60,
+    ),
+    (
+        "NaiveDateTime (ms)",
+        NaiveDateTime(epoch_unit="milliseconds"),
+        "input",
+        lambda index: 1568988000000 + index * 250,
+    ),
+]
+
+
+def _per_element(function, values):
+    number = max(1, 100000 // len(values))
+    best = min(
+        timeit.repeat(lambda: function(values), number=number, repeat=5)
+    )
+    return best / (number * len(values)) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="10,1000,100000")
+    args = parser.parse_args()
+
+    print(f"{'coercion':<28}{'size':>8}{'single (ns)':>14}{'many (ns)':>12}")
+    for name, scalar, direction, make in _CASES:
+        coerce = getattr(scalar, f"coerce_{direction}")
+        coerce_many = getattr(scalar, f"coerce_{direction}_many")
+        for size in (int(size) for size in args.sizes.split(",")):
+            values = [make(index) for index in range(size)]
+            single = _per_element(
+                lambda values: [coerce(value) for value in values], values
+            )
+            many = _per_element(coerce_many, values)
+            print(f"{name:<28}{size:>8}{single:>14.0f}{many:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
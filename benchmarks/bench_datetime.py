@@ -0,0 +1,92 @@
+"""
+Compares the cost of parsing ISO 8601 timestamps with
+`dateutil.parser.isoparse` and with the tiered parser used by the
+`DateTime` and `NaiveDateTime` scalars, per timestamp format and over a mix
+of formats weighted as in a typical API payload.
+
+Also reports the memory held by 100k parsed timestamps spread over 30 UTC
+offsets, and the number of distinct tzinfo objects they reference.
+
+Usage: python benchmarks/bench_datetime.py [--number N]
+"""
+import argparse
+import timeit
+import tracemalloc
+
+from dateutil.parser import isoparse
+from tartiflette_plugin_scalars.iso_datetime import parse_iso_datetime
+
+# format name, example, weight in the mix
+_FORMATS = [
+    ("UTC (Z)", "2019-09-09T16:42:07Z", 40),
+    ("offset", "2019-09-09T16:42:07+02:00", 20),
+    ("microseconds, UTC", "2019-09-09T16:42:07.123456Z", 15),
+    ("milliseconds, offset", "2019-09-09T16:42:07.123-05:00", 10),
+    ("space separator", "2019-09-09 16:42:07+00:00", 5),
+    ("naive", "2019-09-09T16:42:07", 5),
+    ("compact offset", "2019-09-09T16:42:07+0200", 2),
+    ("basic format", "20190909T164207Z", 2),
+    ("week date", "2019-W37-1T16:42:07Z", 1),
+]
+
+
+def _per_value(function, values, number):
+    def run():
+        for value in values:
+            function(value)
+
+    best = min(timeit.repeat(run, number=number, repeat=5))
+    return best / (number * len(values)) * 1e9
+
+
+def _memory(function, values):
+    tracemalloc.start()
+    results = [function(value) for value in values]
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return memory / 1024, len({id(result.tzinfo) for result in results})
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(
+        f"{'format':<24}{'isoparse (ns)':>15}{'tiered (ns)':>15}{'speedup':>10}"
+    )
+    mix = []
+    for name, example, weight in _FORMATS:
+        mix.extend([example] * weight)
+        values = [example] * 50
+        reference = _per_value(isoparse, values, args.number)
+        tiered = _per_value(parse_iso_datetime, values, args.number)
+        print(
+            f"{name:<24}{reference:>15.0f}{tiered:>15.0f}"
+            f"{reference / tiered:>9.1f}x"
+        )
+
+    reference = _per_value(isoparse, mix, args.number // 2)
+    tiered = _per_value(parse_iso_datetime, mix, args.number // 2)
+    print(
+        f"{'weighted mix':<24}{reference:>15.0f}{tiered:>15.0f}"
+        f"{reference / tiered:>9.1f}x"
+    )
+
+    values = [
+        f"2019-09-09T16:{index % 60:02}:07+{index % 30:02}:00"
+        if index % 30 < 24
+        else f"2019-09-09T16:{index % 60:02}:07-0{index % 30 - 23}00"
+        for index in range(100000)
+    ]
+    print(f"\n{'100k timestamps':<24}{'memory (KiB)':>15}{'tzinfos':>15}")
+    for name, function in (
+        ("isoparse", isoparse),
+        ("tiered", parse_iso_datetime),
+    ):
+        memory, tzinfos = _memory(function, values)
+        print(f"{name:<24}{memory:>15.0f}{tzinfos:>15}")
+
+
+if __name__ == "__main__":
+    main()
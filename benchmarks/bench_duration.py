@@ -0,0 +1,105 @@
+"""
+Compares the cost of parsing durations with the former `key=value` parser
+(splitting the value and calling `timedelta(**arguments)`) and with the
+scanner used by the `Duration` scalar, which accumulates the total number of
+microseconds in one pass, on `key=value` arguments and ISO 8601 durations.
+
+Usage: python benchmarks/bench_duration.py [--number N]
+"""
+import argparse
+import timeit
+
+from datetime import timedelta
+
+from tartiflette_plugin_scalars.duration import (
+    _format_iso_duration,
+    _parse_duration,
+)
+
+_ARGUMENTS = [
+    ("one argument", "seconds=30"),
+    ("three arguments", "days=1, hours=2, minutes=30"),
+    ("every argument", "weeks=1,days=1,hours=1,minutes=1,seconds=1"),
+]
+
+_ISO_DURATIONS = [
+    ("ISO, one unit", "PT30S"),
+    ("ISO, date and time", "P1DT2H30M"),
+    ("ISO, fraction", "PT1M0.25S"),
+]
+
+
+# the former parser of the Duration scalar
+_VALID_KEYS = (
+    "weeks",
+    "days",
+    "hours",
+    "minutes",
+    "seconds",
+    "milliseconds",
+    "microseconds",
+)
+
+
+def _get_kv(arg):
+    try:
+        key, value = arg.split("=")
+    except ValueError as err:
+        raise ValueError(
+            f"Duration argument has more or less than 2 elements: < {arg} >"
+        ) from err
+    if key in _VALID_KEYS:
+        try:
+            return {key: int(value)}
+        except ValueError as err:
+            raise ValueError(
+                f"Duration argument value is not an int: < {arg} >"
+            ) from err
+    raise ValueError(f"Duration argument has invalid key: < {arg} >")
+
+
+def _parse_arguments(value):
+    arg_dict = {}
+    for arg in value.replace(" ", "").split(","):
+        if "=" in arg:
+            arg_dict.update(_get_kv(arg))
+        else:
+            raise ValueError(f"Duration key missing '=': < {value} >")
+    return timedelta(**arg_dict)
+
+
+def _per_value(function, value, number):
+    best = min(timeit.repeat(lambda: function(value), number=number, repeat=5))
+    return best / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=50000)
+    args = parser.parse_args()
+
+    print(
+        f"{'duration':<24}{'former (ns)':>15}{'scanner (ns)':>15}{'speedup':>10}"
+    )
+    for name, value in _ARGUMENTS:
+        reference = _per_value(_parse_arguments, value, args.number)
+        scanner = _per_value(_parse_duration, value, args.number)
+        print(
+            f"{name:<24}{reference:>15.0f}{scanner:>15.0f}"
+            f"{reference / scanner:>9.1f}x"
+        )
+    for name, value in _ISO_DURATIONS:
+        scanner = _per_value(_parse_duration, value, args.number)
+        print(f"{name:<24}{'-':>15}{scanner:>15.0f}")
+
+    value = _parse_duration("P1DT2H30M0.25S")
+    print(f"\n{'output':<24}{'str (ns)':>15}{'iso8601 (ns)':>15}")
+    print(
+        f"{'P1DT2H30M0.25S':<24}"
+        f"{_per_value(str, value, args.number):>15.0f}"
+        f"{_per_value(_format_iso_duration, value, args.number):>15.0f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Compares, for the `coordinates` storages of the `GeoJSON` scalar ("list",
+"array" and "numpy"), the memory held by a decoded polygon of many vertices,
+the peak memory of its decoding and the time of its input and output
+coercions.
+
+It then compares the decoding followed by the validation of geojson (as a
+resolver would, with `is_valid`) to the decoding with the `validate`
+option, and the length of the output with and without the `precision`
+option.
+
+Usage: python benchmarks/bench_geo_json.py [--number N] [--vertices N]
+"""
+import argparse
+import json
+import math
+import random
+import timeit
+import tracemalloc
+
+from tartiflette_plugin_scalars.geo_json import GeoJSON
+
+
+def _ring(vertices, digits=6):
+    ring = [
+        [
+            round(2.35 + math.cos(2 * math.pi * index / vertices), digits),
+            round(48.85 + math.sin(2 * math.pi * index / vertices), digits),
+        ]
+        for index in range(vertices)
+    ]
+    ring.append(ring[0])
+    return ring
+
+
+def _polygon(vertices):
+    return json.dumps({"type": "Polygon", "coordinates": [_ring(vertices)]})
+
+
+def _feature_collection(vertices):
+    # polygons of 50 vertices, with coordinates of 15 digits as computed by
+    # the resolvers
+    random.seed(0)
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [
+                        [
+                            [x + random.random(), y + random.random()]
+                            for x, y in _ring(50, 15)
+                        ]
+                    ],
+                },
+                "properties": {"id": index},
+            }
+            for index in range(vertices // 50)
+        ],
+    }
+
+
+def _validation(args):
+    value = _feature_collection(args.vertices)
+    for feature in value["features"]:
+        ring = feature["geometry"]["coordinates"][0]
+        ring[-1] = ring[0]
+    document = json.dumps(value)
+    scalar = GeoJSON()
+    validating = GeoJSON(validate=True)
+
+    def decode_then_validate(document):
+        assert scalar.coerce_input(document).is_valid
+
+    print(f"\n{'validation':<28}{'input (ms)':>12}")
+    for label, function in (
+        ("decoding", scalar.coerce_input),
+        ("decoding, then is_valid", decode_then_validate),
+        ("validate=True", validating.coerce_input),
+    ):
+        print(
+            f"{label:<28}{_per_call(function, document, args.number):>12.0f}"
+        )
+
+    print(f"\n{'precision':<28}{'output (MiB)':>12}{'output (ms)':>13}")
+    for precision in (None, 6, 4):
+        scalar = GeoJSON(precision=precision)
+        output = scalar.coerce_output(value)
+        coerce_output = _per_call(scalar.coerce_output, value, args.number)
+        print(
+            f"{str(precision):<28}{len(output) / 2 ** 20:>12.1f}"
+            f"{coerce_output:>13.0f}"
+        )
+
+
+def _memory(scalar, document):
+    tracemalloc.start()
+    value = scalar.coerce_input(document)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del value
+    return current / 2 ** 20, peak / 2 ** 20
+
+
+def _per_call(function, value, number):
+    best = min(timeit.repeat(lambda: function(value), number=number, repeat=3))
+    return best / number * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=5)
+    parser.add_argument("--vertices", type=int, default=100000)
+    args = parser.parse_args()
+
+    document = _polygon(args.vertices)
+    print(
+        f"polygon: {args.vertices} vertices, "
+        f"{len(document) / 2 ** 20:.1f} MiB of JSON\n"
+    )
+    print(
+        f"{'coordinates':<14}{'held (MiB)':>12}{'peak (MiB)':>12}"
+        f"{'input (ms)':>12}{'output (ms)':>13}"
+    )
+    for storage in ("list", "array", "numpy"):
+        try:
+            scalar = GeoJSON(coordinates=storage)
+        except ValueError:
+            print(f"{storage:<14}{'not installed':>24}")
+            continue
+        # NumPy is imported by the first coercion
+        scalar.coerce_input(document)
+        held, peak = _memory(scalar, document)
+        value = scalar.coerce_input(document)
+        coerce_input = _per_call(scalar.coerce_input, document, args.number)
+        coerce_output = _per_call(scalar.coerce_output, value, args.number)
+        print(
+            f"{storage:<14}{held:>12.1f}{peak:>12.1f}"
+            f"{coerce_input:>12.0f}{coerce_output:>13.0f}"
+        )
+    _validation(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Compares the cost of coercing JSON values with each installed JSON backend
+of the `JSON` scalar, on a payload of a few tens of KB (a list of objects
+as returned by a typical API), for the input and the output coercion.
+
+The input coercion is also measured with the `max_bytes`, `max_depth` and
+`max_keys` limits, which are checked before decoding.
+
+Then compares, for `JSONObject`, the rejection of an array with a decoding
+of the whole document, and the peak memory of the input coercion with and
+without the `materialize` option.
+
+Finally compares, for a bulk import payload of which only a few members are
+read, the time and the peak memory of a full decoding with each backend and
+of the `lazy` option.
+
+And compares the output of JSON text read from a database, decoded then
+dumped again or passed through as `RawJSON` (with and without
+`validate_raw`).
+
+Usage: python benchmarks/bench_json.py [--number N] [--items N]
+"""
+import argparse
+import json
+import random
+import timeit
+import tracemalloc
+
+from tartiflette_plugin_scalars.json import JSON
+from tartiflette_plugin_scalars.json_backend import RawJSON
+from tartiflette_plugin_scalars.json_object import JSONObject
+
+_BACKENDS = ("json", "orjson", "ujson", "simdjson")
+
+
+def _payload(items):
+    random.seed(0)
+    return [
+        {
+            "id": random.randint(0, 10 ** 9),
+            "name": f"item {index}",
+            "price": round(random.random() * 100, 2),
+            "tags": ["new", "sale", "été"][: index % 4],
+            "stock": {"available": index % 3 != 0, "count": index % 50},
+        }
+        for index in range(items)
+    ]
+
+
+def _per_call(function, value, number):
+    best = min(timeit.repeat(lambda: function(value), number=number, repeat=5))
+    return best / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--items", type=int, default=300)
+    args = parser.parse_args()
+
+    payload = _payload(args.items)
+    document = JSON(backend="json").coerce_output(payload)
+    print(f"payload: {len(document) / 1024:.0f} KiB\n")
+
+    print(
+        f"{'backend':<12}{'input (µs)':>14}{'with limits':>14}"
+        f"{'output (µs)':>14}"
+    )
+    for backend in _BACKENDS:
+        try:
+            scalar = JSON(backend=backend)
+        except ValueError:
+            print(f"{backend:<12}{'not installed':>28}")
+            continue
+        limited = JSON(
+            backend=backend, max_bytes=2 ** 20, max_depth=64, max_keys=10 ** 5
+        )
+        coerce_input = _per_call(scalar.coerce_input, document, args.number)
+        limited_input = _per_call(limited.coerce_input, document, args.number)
+        coerce_output = _per_call(scalar.coerce_output, payload, args.number)
+        print(
+            f"{backend:<12}{coerce_input:>14.0f}{limited_input:>14.0f}"
+            f"{coerce_output:>14.0f}"
+        )
+
+    _json_object(payload, args.number)
+    _lazy(payload, args.number)
+    _raw(document, args.number)
+
+
+def _rejects(scalar, value):
+    try:
+        scalar.coerce_input(value)
+    except ValueError:
+        return True
+    return False
+
+
+def _peak_memory(function, value):
+    tracemalloc.start()
+    function(value)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def _json_object(payload, number):
+    array = JSON(backend="json").coerce_output(payload * 10)
+    decoded = _per_call(
+        lambda value: isinstance(json.loads(value), dict), array, number
+    )
+    scalar = JSONObject()
+    rejected = _per_call(lambda value: _rejects(scalar, value), array, number)
+    print(f"\nJSONObject, {len(array) / 1024:.0f} KiB array")
+    print(f"{'full decoding (µs)':<28}{decoded:>10.0f}")
+    print(f"{'rejection (µs)':<28}{rejected:>10.1f}")
+
+    document = JSON(backend="json").coerce_output({"items": payload * 10})
+    print(f"\nJSONObject, {len(document) / 1024:.0f} KiB object")
+    for materialize in (True, False):
+        scalar = JSONObject(materialize=materialize)
+        print(
+            f"{f'materialize={materialize}':<28}"
+            f"{_per_call(scalar.coerce_input, document, number // 10):>10.0f} µs"
+            f"{_peak_memory(scalar.coerce_input, document):>10.0f} KiB peak"
+        )
+
+
+def _read_few_members(scalar):
+    def read(value):
+        result = scalar.coerce_input(value)
+        return result["mode"], len(result["items"]), result["items"][0]["id"]
+
+    return read
+
+
+def _lazy(payload, number):
+    document = JSON(backend="json").coerce_output(
+        {"mode": "upsert", "items": payload * 20}
+    )
+    print(f"\nJSON, {len(document) / 1024:.0f} KiB bulk import, few reads")
+    scalars = [(backend, {"backend": backend}) for backend in _BACKENDS]
+    scalars.append(("lazy", {"lazy": True}))
+    for name, options in scalars:
+        try:
+            read = _read_few_members(JSON(**options))
+        except ValueError:
+            continue
+        print(
+            f"{name:<28}"
+            f"{_per_call(read, document, number // 20):>10.0f} µs"
+            f"{_peak_memory(read, document):>10.0f} KiB peak"
+        )
+
+
+def _raw(document, number):
+    print(f"\nJSON output of {len(document) / 1024:.0f} KiB of JSON text")
+    scalar = JSON()
+    validating = JSON(validate_raw=True)
+    round_trip = lambda value: scalar.coerce_output(scalar.coerce_input(value))
+    for name, function in (
+        ("decoded and dumped", round_trip),
+        ("RawJSON", lambda value: scalar.coerce_output(RawJSON(value))),
+        (
+            "RawJSON, validate_raw",
+            lambda value: validating.coerce_output(RawJSON(value)),
+        ),
+    ):
+        print(f"{name:<28}{_per_call(function, document, number):>10.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
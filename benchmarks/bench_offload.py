@@ -0,0 +1,136 @@
+"""
+Measures how long the event loop is blocked while large JSON and GeoJSON
+values (a few MB) are coerced, on the event loop as tartiflette does and
+through `OffloadedScalar` with a thread pool and with a process pool.
+
+A ticker task sleeps 1 ms in a loop during the coercions, the block time is
+how late it wakes up: the longest and the total delay are reported, along
+with the wall time of the coercions.
+
+The C decoders and encoders of the JSON libraries hold the GIL while they
+run, a thread pool only frees the event loop during the Python parts of the
+coercions (e.g. the construction of the GeoJSON objects). A process pool
+frees it during the whole coercion, except for the pickling of the values
+and the results.
+
+Usage: python benchmarks/bench_offload.py [--number N] [--features N]
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from tartiflette_plugin_scalars.geo_json import GeoJSON
+from tartiflette_plugin_scalars.json import JSON
+from tartiflette_plugin_scalars.offload import OffloadedScalar
+
+_TICK = 0.001
+
+
+def _feature_collection(features):
+    random.seed(0)
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "LineString",
+                    "coordinates": [
+                        [random.uniform(-180, 180), random.uniform(-90, 90)]
+                        for _ in range(50)
+                    ],
+                },
+                "properties": {"id": index, "name": f"road {index}"},
+            }
+            for index in range(features)
+        ],
+    }
+
+
+async def _ticker(delays, stop):
+    loop = asyncio.get_event_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(_TICK)
+        delays.append(max(loop.time() - start - _TICK, 0.0))
+
+
+async def _measure(coerce, value, number):
+    delays = []
+    stop = asyncio.Event()
+    ticker = asyncio.ensure_future(_ticker(delays, stop))
+    await asyncio.sleep(_TICK * 5)
+    delays.clear()
+    start = time.perf_counter()
+    for _ in range(number):
+        await coerce(value)
+        # as between two requests
+        await asyncio.sleep(_TICK * 5)
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    return elapsed / number * 1e3, max(delays) * 1e3, sum(delays) * 1e3
+
+
+def _inline(method):
+    async def coerce(value):
+        return method(value)
+
+    return coerce
+
+
+async def _main(args):
+    document = JSON(backend="json").coerce_output(
+        _feature_collection(args.features)
+    )
+    print(f"payload: {len(document) / 2 ** 20:.1f} MiB, {args.number} runs\n")
+    print(
+        f"{'coercion':<32}{'wall (ms)':>12}{'longest block':>16}"
+        f"{'total block':>14}"
+    )
+    for name, implementation in (
+        ("JSON", JSON(backend="json")),
+        ("GeoJSON", GeoJSON()),
+    ):
+        value = implementation.coerce_input(document)
+        for label, coerce, argument in (
+            ("input", _inline(implementation.coerce_input), document),
+            ("output", _inline(implementation.coerce_output), value),
+        ):
+            await _report(f"{name} {label}", coerce, argument, args.number)
+        for executor_name, executor_class in (
+            ("threads", ThreadPoolExecutor),
+            ("processes", ProcessPoolExecutor),
+        ):
+            with executor_class(2) as executor:
+                offloaded = OffloadedScalar(implementation, 2 ** 16, executor)
+                for label, coerce, argument in (
+                    ("input", offloaded.coerce_input_async, document),
+                    ("output", offloaded.coerce_output_async, value),
+                ):
+                    await _report(
+                        f"{name} {label}, {executor_name}",
+                        coerce,
+                        argument,
+                        args.number,
+                    )
+
+
+async def _report(label, coerce, value, number):
+    wall, longest, total = await _measure(coerce, value, number)
+    print(f"{label:<32}{wall:>12.1f}{longest:>13.1f} ms{total:>11.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=5)
+    parser.add_argument("--features", type=int, default=3000)
+    args = parser.parse_args()
+    asyncio.get_event_loop().run_until_complete(_main(args))
+
+
+if __name__ == "__main__":
+    main()
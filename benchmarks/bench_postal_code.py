@@ -0,0 +1,89 @@
+"""
+Compares the former linear scan of the PostalCode patterns with the indexed
+engine, on accepted and rejected values, for every country and for the
+countries given through --countries.
+
+Usage: python benchmarks/bench_postal_code.py [--number N] [--countries FR,DE]
+"""
+import argparse
+import re
+import timeit
+
+from tartiflette_plugin_scalars.postal_code import (
+    _POSTAL_CODE_PATTERNS,
+    PostalCode,
+)
+
+_ACCEPTED = [
+    "75017",
+    "K1N 9N1",
+    "SW1A 1AA",
+    "10115",
+    "100-0001",
+    "1017 XN",
+    "01310-200",
+    "AD100",
+    "BBND 1ZZ",
+]
+
+_REJECTED = [
+    "nope",
+    "7501",
+    "K1N-9N1",
+    "ABCDEFGH",
+    "1234-56",
+    "postal code",
+    "#75017",
+    "12-3456-789-1",
+]
+
+_LINEAR_REGEXES = [
+    re.compile(pattern) for pattern in _POSTAL_CODE_PATTERNS.values()
+]
+
+
+def _check_postal_code_linear(value):
+    match = False
+    if value != "":
+        for postal_code_regex in _LINEAR_REGEXES:
+            if postal_code_regex.search(value):
+                match = True
+                break
+    if not match:
+        raise ValueError(f"Value is not a valid postal code: < {value} >")
+    return value
+
+
+def _run(check, values, number):
+    def _loop():
+        for value in values:
+            try:
+                check(value)
+            except ValueError:
+                pass
+
+    best = min(timeit.repeat(_loop, number=number, repeat=5))
+    return best / (number * len(values)) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2000)
+    parser.add_argument("--countries", default="FR,DE,GB")
+    args = parser.parse_args()
+
+    scalar = PostalCode()
+    countries_scalar = PostalCode(countries=args.countries.split(","))
+    print(
+        f"{'inputs':<10}{'linear (ns)':>14}{'indexed (ns)':>14}"
+        f"{args.countries + ' (ns)':>18}"
+    )
+    for label, values in (("accepted", _ACCEPTED), ("rejected", _REJECTED)):
+        linear = _run(_check_postal_code_linear, values, args.number)
+        indexed = _run(scalar.coerce_input, values, args.number)
+        countries = _run(countries_scalar.coerce_input, values, args.number)
+        print(f"{label:<10}{linear:>14.0f}{indexed:>14.0f}{countries:>18.0f}")
+
+
+if __name__ == "__main__":
+    main()
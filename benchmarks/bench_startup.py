@@ -0,0 +1,212 @@
+"""
+Measures the time and memory spent importing the plugin and baking the
+scalars, in aggregate and per scalar module.
+
+Every measurement runs in a fresh interpreter, once `tartiflette` is already
+imported, so that only the cost of the plugin is reported. Times are the
+median of several runs, memory is the size of the objects still allocated
+after the measured step (as reported by tracemalloc, in a separate run).
+
+Times are also reported as a percentage of the time spent importing
+`tartiflette` itself, measured the same way, which doesn't depend on the
+speed of the machine as much as the wall-clock times do.
+
+Usage: python benchmarks/bench_startup.py [--runs N] [--check] [--importtime]
+
+With --check, the relative times and the memory are compared to the
+thresholds of benchmarks/startup_thresholds.json and the script exits with a
+non zero status if one of them is exceeded: the wall-clock times aren't
+checked.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from tartiflette_plugin_scalars import AVAILABLE_SCALARS
+
+_THRESHOLDS_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "startup_thresholds.json"
+)
+
+_SNIPPET = """
+import json
+import sys
+import time
+import tracemalloc
+
+{setup}
+trace = {trace}
+if trace:
+    tracemalloc.start()
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+memory = tracemalloc.get_traced_memory()[0] if trace else 0
+sys.stdout.write(json.dumps({{"time": elapsed, "memory": memory}}))
+"""
+
+# the reference the times are compared to
+_REFERENCE = ("import tartiflette (reference)", "", "import tartiflette")
+
+_TARTIFLETTE_SETUP = """
+import tartiflette
+"""
+
+_BAKE_SETUP = """
+import asyncio
+
+import tartiflette
+
+from tartiflette_plugin_scalars import bake
+"""
+
+_BAKE_STATEMENT = """
+asyncio.get_event_loop().run_until_complete(bake("bench", {config!r}))
+"""
+
+_IMPORTTIME_MARKER = "--- measured ---"
+
+
+def _only(module):
+    return {name: {"enabled": name == module} for name, _ in AVAILABLE_SCALARS}
+
+
+def _measurements():
+    yield (
+        "import tartiflette_plugin_scalars",
+        _TARTIFLETTE_SETUP,
+        "import tartiflette_plugin_scalars",
+    )
+    yield (
+        "bake (all scalars)",
+        _BAKE_SETUP,
+        _BAKE_STATEMENT.format(config={}),
+    )
+    for module, _ in AVAILABLE_SCALARS:
+        yield (
+            f"import {module}",
+            _TARTIFLETTE_SETUP + "import tartiflette_plugin_scalars",
+            f"import tartiflette_plugin_scalars.{module}",
+        )
+        yield (
+            f"bake {module}",
+            _BAKE_SETUP,
+            _BAKE_STATEMENT.format(config=_only(module)),
+        )
+
+
+def _run(setup, statement, trace):
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            _SNIPPET.format(setup=setup, statement=statement, trace=trace),
+        ],
+        check=True,
+        stdout=subprocess.PIPE,
+    ).stdout
+    return json.loads(output)
+
+
+def _measure(setup, statement, runs):
+    time_ms = statistics.median(
+        _run(setup, statement, False)["time"] * 1000 for _ in range(runs)
+    )
+    memory_kib = _run(setup, statement, True)["memory"] / 1024
+    return {"time_ms": time_ms, "memory_kib": memory_kib}
+
+
+def _dominant_imports(limit=10):
+    """
+    Runs the aggregate bake under `python -X importtime` and returns the
+    top level imports it triggers, by cumulative time.
+    """
+    code = (
+        "import sys\n"
+        "import tartiflette\n"
+        f"sys.stderr.write({_IMPORTTIME_MARKER!r} + '\\n')\n"
+        + _BAKE_SETUP
+        + _BAKE_STATEMENT.format(config={})
+    )
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        check=True,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    ).stderr
+    imports = []
+    measured = False
+    for line in stderr.splitlines():
+        if line == _IMPORTTIME_MARKER:
+            measured = True
+            continue
+        if not measured or not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # nested imports are indented below the import which triggered them
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            imports.append((int(cumulative) / 1000, name.strip()))
+    return sorted(imports, reverse=True)[:limit]
+
+
+def _check(results):
+    with open(_THRESHOLDS_FILE) as thresholds_file:
+        thresholds = json.load(thresholds_file)
+    failures = []
+    for name, result in results.items():
+        # the thresholds of a measurement override the default ones
+        threshold = {**thresholds["default"], **thresholds.get(name, {})}
+        for key, limit in threshold.items():
+            if result[key] > limit:
+                failures.append(
+                    f"{name}: {key} {result[key]:.1f} above threshold {limit}"
+                )
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--importtime", action="store_true")
+    args = parser.parse_args()
+
+    print(
+        f"{'measurement':<40}{'time (ms)':>12}{'time (%)':>10}"
+        f"{'memory (KiB)':>15}"
+    )
+    name, setup, statement = _REFERENCE
+    reference = _measure(setup, statement, args.runs)
+    print(
+        f"{name:<40}{reference['time_ms']:>12.2f}{100:>10.2f}"
+        f"{reference['memory_kib']:>15.1f}"
+    )
+    results = {}
+    for name, setup, statement in _measurements():
+        result = _measure(setup, statement, args.runs)
+        result["time_percent"] = result["time_ms"] / reference["time_ms"] * 100
+        results[name] = result
+        print(
+            f"{name:<40}{result['time_ms']:>12.2f}"
+            f"{result['time_percent']:>10.2f}{result['memory_kib']:>15.1f}"
+        )
+
+    if args.importtime:
+        print("\ndominant imports of the aggregate bake:")
+        for cumulative, name in _dominant_imports():
+            print(f"  {name:<38}{cumulative:>12.2f}")
+
+    if args.check:
+        failures = _check(results)
+        for failure in failures:
+            print(failure, file=sys.stderr)
+        sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
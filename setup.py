@@ -43,6 +43,10 @@ setup(
         "geojson==2.5.0",
     ],
     tests_require=_TEST_REQUIRE,
-    extras_require={"test": _TEST_REQUIRE},
+    extras_require={
+        "test": _TEST_REQUIRE,
+        "numpy": ["numpy"],
+        "orjson": ["orjson"],
+    },
     include_package_data=True,
 )
@@ -1,8 +1,13 @@
+import re
+
 from importlib import import_module
 
-from tartiflette import Scalar
+from tartiflette import Directive, Scalar
 
 _SCALAR_TEMPLATE = "scalar {0}"
+_OFFLOADED_SCALAR_TEMPLATE = 'scalar {0} @{1}(scalar: "{0}")'
+_SDL_NAME_REGEX = re.compile(r"[_A-Za-z][_0-9A-Za-z]*")
+_CACHED_SCALARS = {}
 AVAILABLE_SCALARS = [
     ("email_address", "EmailAddress"),
     ("datetime", "DateTime"),
@@ -41,25 +46,136 @@ AVAILABLE_SCALARS = [
 ]
 
 
+def _is_enabled(scalar_config, scalar_name, used_names):
+    enabled = scalar_config.get("enabled")
+    if enabled is None and used_names is not None:
+        return scalar_name in used_names
+    return enabled is not False
+
+
+def _register_scalar(
+    schema_name, scalar_name, scalar_class, options, offloaded_scalars
+):
+    options = dict(options)
+    cache_size = options.pop("cache_size", None)
+    cache_methods = options.pop(
+        "cache_methods", ("coerce_input", "coerce_output")
+    )
+    offload_threshold = options.pop("offload_threshold", None)
+    offload_executor = options.pop("offload_executor", None)
+    implementation = scalar_class(**options)
+    if offload_threshold is not None:
+        # the offload module is only imported by the schemas which use it;
+        # the cache (if any) wraps the offloaded scalar, so that it's only
+        # used from the event loop
+        offload_mod = import_module("tartiflette_plugin_scalars.offload")
+        implementation = offload_mod.OffloadedScalar(
+            implementation, offload_threshold, offload_executor
+        )
+        offloaded_scalars[scalar_name] = implementation
+    if cache_size:
+        # the cache module is only imported by the schemas which use it
+        cache_mod = import_module("tartiflette_plugin_scalars.cache")
+        implementation = cache_mod.CachedScalar(
+            implementation, cache_size, cache_methods
+        )
+        _CACHED_SCALARS.setdefault(schema_name, {})[
+            scalar_name
+        ] = implementation
+
+    Scalar(name=scalar_name, schema_name=schema_name)(implementation)
+    if offload_threshold is not None:
+        return _OFFLOADED_SCALAR_TEMPLATE.format(
+            scalar_name, offload_mod.OFFLOAD_DIRECTIVE
+        )
+    return _SCALAR_TEMPLATE.format(scalar_name)
+
+
 def _generate_scalars(schema_name, config):
     scalars = []
+    offloaded_scalars = {}
+
+    # when the SDL of the schema is provided, only the scalars it references
+    # (or explicitly enabled) are imported and registered
+    used_names = None
+    if config.get("sdl") is not None:
+        used_names = set(_SDL_NAME_REGEX.findall(config["sdl"]))
 
     for scalar in AVAILABLE_SCALARS:
         scalar_config = config.get(scalar[0], {})
-        if scalar_config.get("enabled") is not False:
+        scalar_name = scalar_config.get("name") or scalar[1]
+        if _is_enabled(scalar_config, scalar_name, used_names):
             scalar_mod = import_module(
-                f"tartiflette_plugin_scalars.{scalar[0]}"
+                "tartiflette_plugin_scalars." + scalar[0]
             )
             scalar_class = getattr(scalar_mod, scalar[1])
+            scalars.append(
+                _register_scalar(
+                    schema_name,
+                    scalar_name,
+                    scalar_class,
+                    scalar_config.get("options", {}),
+                    offloaded_scalars,
+                )
+            )
 
-            scalar_name = scalar_config.get("name") or scalar[1]
-            Scalar(name=scalar_name, schema_name=schema_name)(
-                scalar_class(**scalar_config.get("options", {}))
+    # custom bounded number scalars, declared by their name and bounds
+    for scalar_name, scalar_config in config.get(
+        "bounded_numbers", {}
+    ).items():
+        if _is_enabled(scalar_config, scalar_name, used_names):
+            scalar_mod = import_module(
+                "tartiflette_plugin_scalars.bounded_number"
+            )
+            scalars.append(
+                _register_scalar(
+                    schema_name,
+                    scalar_name,
+                    scalar_mod.BoundedNumber,
+                    {"name": scalar_name, **scalar_config.get("options", {})},
+                    offloaded_scalars,
+                )
             )
-            scalars.append(_SCALAR_TEMPLATE.format(scalar_name))
+
+    # the large values of the offloaded scalars are coerced by a directive,
+    # as tartiflette awaits the directives but not the scalar methods
+    if offloaded_scalars:
+        offload_mod = import_module("tartiflette_plugin_scalars.offload")
+        Directive(offload_mod.OFFLOAD_DIRECTIVE, schema_name=schema_name)(
+            offload_mod.OffloadCoercion(offloaded_scalars)
+        )
+        scalars.append(offload_mod.OFFLOAD_DIRECTIVE_SDL)
 
     return scalars
 
 
+def warmup():
+    """
+    Eagerly compiles the regular expressions of the scalars imported so far,
+    for deployments which prefer to pay the compilation cost up front rather
+    than on first use
+    """
+    # the patterns are registered by the modules of the scalars, which
+    # import the lazy_pattern module themselves
+    import_module("tartiflette_plugin_scalars.lazy_pattern").warmup()
+
+
+def cache_info(schema_name):
+    """
+    Reports the statistics of the caches of the scalars of a schema
+    configured with a `cache_size` option
+    :param schema_name: name of the schema
+    :type schema_name: str
+    :return: the statistics of each method of each cached scalar
+    :rtype: Dict[str, Dict[str, CacheInfo]]
+    """
+    return {
+        scalar_name: implementation.cache_info()
+        for scalar_name, implementation in _CACHED_SCALARS.get(
+            schema_name, {}
+        ).items()
+    }
+
+
 async def bake(schema_name, config):
     return "\n".join(_generate_scalars(schema_name, config))
@@ -0,0 +1,41 @@
+from typing import Any, Iterable, List, Optional
+
+
+def coerce_list(
+    scalar: Any, values: Optional[Iterable[Any]], output: bool = True
+) -> Optional[List[Any]]:
+    """
+    Coerces a list of values through a scalar implementation, keeping null
+    elements, for callers outside of the execution of the queries (e.g. a
+    bulk import or export): tartiflette already coerces each element of the
+    lists returned by the resolvers, which mustn't coerce them beforehand.
+
+    The values are coerced at once by the `coerce_output_many` (or
+    `coerce_input_many`) method of the scalars which provide one, such as
+    `NaiveDateTime`, and one at a time otherwise
+    :param scalar: the scalar implementation
+    :type scalar: Any
+    :param values: the values to coerce
+    :type values: Optional[Iterable[Any]]
+    :param output: whether to dump output values (or load input values)
+    :type output: bool
+    :return: the coerced values
+    :rtype: Optional[List[Any]]
+    :raises TypeError: if a value has an invalid type
+    :raises ValueError: if a value is invalid
+    """
+    if values is None:
+        return None
+    values = list(values)
+    coerce_many = getattr(
+        scalar, "coerce_output_many" if output else "coerce_input_many", None
+    )
+    if coerce_many is None:
+        coerce = scalar.coerce_output if output else scalar.coerce_input
+        return [None if value is None else coerce(value) for value in values]
+    if all(value is not None for value in values):
+        return coerce_many(values)
+    coerced = iter(
+        coerce_many([value for value in values if value is not None])
+    )
+    return [None if value is None else next(coerced) for value in values]
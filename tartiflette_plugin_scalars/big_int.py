@@ -7,6 +7,8 @@ from tartiflette.language.ast import (
     StringValueNode,
 )
 
+from tartiflette_plugin_scalars.conversion import to_int
+
 
 def _parse_big_int(value: Union[str, int, float]) -> int:
     if isinstance(value, (str, float)):
@@ -33,10 +35,7 @@ class BigInt:
         :rtype: Union[int, UNDEFINED_VALUE]
         """
         if isinstance(ast, (FloatValueNode, StringValueNode, IntValueNode)):
-            try:
-                return _parse_big_int(ast.value)
-            except (TypeError, ValueError):
-                return UNDEFINED_VALUE
+            return to_int(ast.value)
         return UNDEFINED_VALUE
 
     @staticmethod
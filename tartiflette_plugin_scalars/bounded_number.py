@@ -0,0 +1,271 @@
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Union
+
+from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.language.ast import (
+    FloatValueNode,
+    IntValueNode,
+    StringValueNode,
+)
+
+_NUMBER_TYPES = {"int": int, "float": float}
+
+
+@lru_cache(maxsize=None)
+def _literal_conversions() -> Dict[type, Callable[[Any], Any]]:
+    # the conversion module (and its regular expressions) is only imported
+    # once a literal has to be parsed, importing a scalar doesn't pay for it
+    # pylint: disable=import-outside-toplevel
+    from tartiflette_plugin_scalars.conversion import to_float, to_int
+
+    return {int: to_int, float: to_float}
+
+
+def _format_bound(bound: Union[int, float]) -> str:
+    if isinstance(bound, float) and bound.is_integer() and abs(bound) < 1e16:
+        bound = int(bound)
+    # large powers of two (the bounds of fixed size integers) read better as
+    # such
+    magnitude = abs(bound)
+    if (
+        isinstance(bound, int)
+        and magnitude > 65536
+        and magnitude & (magnitude - 1) == 0
+    ):
+        return f"{'-' if bound < 0 else ''}2^{magnitude.bit_length() - 1}"
+    return str(bound)
+
+
+def _convert_bound(
+    bound: Union[int, float], number_type: type, option: str
+) -> Union[int, float]:
+    if (
+        number_type is int
+        and isinstance(bound, float)
+        and not bound.is_integer()
+    ):
+        raise ValueError(f"Integer bound isn't integral: < {option}={bound} >")
+    return number_type(bound)
+
+
+class BoundedNumber:
+    """
+    Scalar which handles integers or floating point numbers contained in a
+    range
+    """
+
+    __slots__ = (
+        "name",
+        "_number_type",
+        "_is_too_low",
+        "_is_too_high",
+        "_too_low_message",
+        "_too_high_message",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        number_type: str = "int",
+        minimum: Optional[Union[int, float]] = None,
+        maximum: Optional[Union[int, float]] = None,
+        exclusive_minimum: bool = False,
+        exclusive_maximum: bool = False,
+    ) -> None:
+        """
+        :param name: the name of the scalar, used in the error messages
+        :type name: str
+        :param number_type: "int" or "float"
+        :type number_type: str
+        :param minimum: the lower bound of the values, if any
+        :type minimum: Optional[Union[int, float]]
+        :param maximum: the upper bound of the values, if any
+        :type maximum: Optional[Union[int, float]]
+        :param exclusive_minimum: whether the lower bound is rejected
+        :type exclusive_minimum: bool
+        :param exclusive_maximum: whether the upper bound is rejected
+        :type exclusive_maximum: bool
+        :raises ValueError: if the number type or a bound is invalid
+        """
+        if number_type not in _NUMBER_TYPES:
+            raise ValueError(
+                f"{name} has an unknown number type: < {number_type} >"
+            )
+        self.name = name
+        self._number_type = _NUMBER_TYPES[number_type]
+
+        # the bound checks are bound methods of the bounds, values being
+        # converted to the type of the bounds first; like the comparisons
+        # they replace, they don't reject NaN
+        self._is_too_low: Optional[Callable] = None
+        self._too_low_message = ""
+        if minimum is not None:
+            minimum = _convert_bound(minimum, self._number_type, "minimum")
+            self._is_too_low = (
+                minimum.__ge__ if exclusive_minimum else minimum.__gt__
+            )
+            self._too_low_message = (
+                f"{name} cannot represent values below "
+                f"{'or equal to ' if exclusive_minimum else ''}"
+                f"{_format_bound(minimum)}"
+            )
+
+        self._is_too_high: Optional[Callable] = None
+        self._too_high_message = ""
+        if maximum is not None:
+            maximum = _convert_bound(maximum, self._number_type, "maximum")
+            self._is_too_high = (
+                maximum.__le__ if exclusive_maximum else maximum.__lt__
+            )
+            self._too_high_message = (
+                f"{name} cannot represent values above "
+                f"{'or equal to ' if exclusive_maximum else ''}"
+                f"{_format_bound(maximum)}"
+            )
+
+    def _parse(self, value: Union[str, int, float]) -> Union[int, float]:
+        if self._number_type is int:
+            if isinstance(value, (str, float)):
+                value = int(value)
+        elif isinstance(value, (str, int)) and not isinstance(value, bool):
+            value = float(value)
+        if not isinstance(value, self._number_type) or isinstance(value, bool):
+            raise TypeError(
+                f"{self.name} cannot represent values other than strings and numbers: < {value} >"
+            )
+        if self._is_too_low is not None and self._is_too_low(value):
+            raise ValueError(f"{self._too_low_message}: < {value} >")
+        if self._is_too_high is not None and self._is_too_high(value):
+            raise ValueError(f"{self._too_high_message}: < {value} >")
+        return value
+
+    def parse_literal(
+        self, ast: "ValueNode"
+    ) -> Union[int, float, "UNDEFINED_VALUE"]:
+        """
+        Loads the input value from an AST node
+        :param ast: ast node to coerce
+        :type ast: ValueNode
+        :return: the value if it can be parsed as a number within the bounds, UNDEFINED_VALUE otherwise
+        :rtype: Union[int, float, UNDEFINED_VALUE]
+        """
+        if not isinstance(
+            ast, (FloatValueNode, StringValueNode, IntValueNode)
+        ):
+            return UNDEFINED_VALUE
+        value = _literal_conversions()[self._number_type](ast.value)
+        if (
+            value is UNDEFINED_VALUE
+            or (self._is_too_low is not None and self._is_too_low(value))
+            or (self._is_too_high is not None and self._is_too_high(value))
+        ):
+            return UNDEFINED_VALUE
+        return value
+
+    def coerce_input(self, value: Union[str, int, float]) -> Union[int, float]:
+        """
+        Loads the input value
+        :param value: the value to coerce
+        :type value: Union[str, int, float]
+        :return: the value if it's a number within the bounds
+        :rtype: Union[int, float]
+        :raises TypeError: if the value isn't parseable as a number
+        :raises ValueError: if the value is out of the bounds
+        """
+        return self._parse(value)
+
+    def coerce_output(
+        self, value: Union[str, int, float]
+    ) -> Union[int, float]:
+        """
+        Dumps the output value
+        :param value: the value to coerce
+        :type value: Union[str, int, float]
+        :return: the value if it's a number within the bounds
+        :rtype: Union[int, float]
+        :raises TypeError: if the value isn't parseable as a number
+        :raises ValueError: if the value is out of the bounds
+        """
+        return self._parse(value)
+
+
+# the bounds of the bounded number scalars of the plugin, each of them being
+# generated by its own module so that only the scalars imported are built
+BOUNDED_NUMBERS = {
+    "NegativeFloat": (
+        "Scalar which handles negative floating point numbers",
+        {"number_type": "float", "maximum": 0, "exclusive_maximum": True},
+    ),
+    "NegativeInt": (
+        "Scalar which handles negative integers",
+        {"maximum": 0, "exclusive_maximum": True},
+    ),
+    "NonNegativeFloat": (
+        "Scalar which handles positive or 0 floating point numbers",
+        {"number_type": "float", "minimum": 0},
+    ),
+    "NonNegativeInt": (
+        "Scalar which handles positive or 0 integers",
+        {"minimum": 0},
+    ),
+    "NonPositiveFloat": (
+        "Scalar which handles non positive floating point numbers",
+        {"number_type": "float", "maximum": 0},
+    ),
+    "NonPositiveInt": (
+        "Scalar which handles non positive integers",
+        {"maximum": 0},
+    ),
+    "PositiveFloat": (
+        "Scalar which handles positive floating point numbers",
+        {"number_type": "float", "minimum": 0, "exclusive_minimum": True},
+    ),
+    "PositiveInt": (
+        "Scalar which handles positive integers",
+        {"minimum": 0, "exclusive_minimum": True},
+    ),
+    "Long": (
+        "Scalar which handles integers between 2^63 (excluded) and -2^63 (included)",
+        {
+            "minimum": -(2 ** 63),
+            "maximum": 2 ** 63,
+            "exclusive_maximum": True,
+        },
+    ),
+    "UnsignedInt": (
+        "Scalar which handles integers between 0 (included) and 2^32 (excluded)",
+        {"minimum": 0, "maximum": 2 ** 32, "exclusive_maximum": True},
+    ),
+    "Port": (
+        "Scalar which handles integers usable as TCP/UDP port (in range ]0, 65535])",
+        {"minimum": 0, "maximum": 65535, "exclusive_minimum": True},
+    ),
+}
+
+
+def bounded_number_class(name: str, module: str) -> type:
+    """
+    Generates the class of a bounded number scalar of the plugin from its
+    bounds
+    :param name: the name of the scalar, a key of `BOUNDED_NUMBERS`
+    :type name: str
+    :param module: the name of the module defining the class
+    :type module: str
+    :return: the `BoundedNumber` subclass of the scalar
+    :rtype: type
+    """
+    description, bounds = BOUNDED_NUMBERS[name]
+
+    def __init__(self) -> None:
+        BoundedNumber.__init__(self, name, **bounds)
+
+    return type(
+        name,
+        (BoundedNumber,),
+        {
+            "__slots__": (),
+            "__init__": __init__,
+            "__doc__": description,
+            "__module__": module,
+        },
+    )
@@ -0,0 +1,257 @@
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+_COERCION_METHODS = ("coerce_input", "coerce_output")
+
+
+class CacheInfo(
+    namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+):
+    """
+    Statistics of a cache
+    """
+
+    __slots__ = ()
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Ratio of the lookups answered from the cache
+        :return: the hits over the lookups, 0.0 before the first lookup
+        :rtype: float
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _CachedTypes(NamedTuple):
+    # values of the exact key types are equal only if they are identical,
+    # they can be used as is in a cache key; results of the immutable types
+    # can't be mutated by a resolver, they can be shared
+    exact_key_types: FrozenSet[type]
+    immutable_result_types: FrozenSet[type]
+    datetime: type
+
+
+@lru_cache(maxsize=None)
+def _cached_types() -> _CachedTypes:
+    # the modules of the types are only imported once a cache is created,
+    # importing the plugin doesn't pay for them
+    # pylint: disable=import-outside-toplevel
+    from datetime import datetime, timedelta
+    from ipaddress import IPv4Address, IPv6Address
+    from urllib.parse import ParseResult
+    from uuid import UUID
+
+    return _CachedTypes(
+        frozenset((str, int, bool, bytes, timedelta, UUID, ParseResult)),
+        frozenset(
+            (
+                str,
+                int,
+                float,
+                bool,
+                type(None),
+                datetime,
+                timedelta,
+                UUID,
+                ParseResult,
+                IPv4Address,
+                IPv6Address,
+            )
+        ),
+        datetime,
+    )
+
+
+_VALIDATION_ERRORS = (TypeError, ValueError, OverflowError)
+
+
+def _cache_key(value: Any, types: _CachedTypes) -> Optional[Hashable]:
+    """
+    Computes the cache key of a value, so that values sharing a key are
+    coerced to the same result
+    :param value: the value to coerce
+    :type value: Any
+    :param types: the types of the values and the results which are cached
+    :type types: _CachedTypes
+    :return: the cache key, None if the value can't be cached
+    :rtype: Optional[Hashable]
+    """
+    value_type = type(value)
+    if value_type in types.exact_key_types:
+        return value_type, value
+    if value_type is float:
+        # 0.0 == -0.0
+        return value_type, value.hex()
+    if value_type is types.datetime:
+        # aware datetimes are equal when they represent the same instant
+        return value_type, value, value.utcoffset()
+    return None
+
+
+class LRUCache:
+    """
+    Bounded cache of the results (and validation errors) of a coercion
+    function, evicting the least recently used values first.
+
+    Results which could be mutated (dicts, lists...) aren't cached.
+    """
+
+    __slots__ = (
+        "_function",
+        "_maxsize",
+        "_entries",
+        "_hits",
+        "_misses",
+        "_types",
+    )
+
+    def __init__(self, function: Callable[[Any], Any], maxsize: int) -> None:
+        """
+        :param function: the coercion function
+        :type function: Callable[[Any], Any]
+        :param maxsize: the maximum number of cached values
+        :type maxsize: int
+        """
+        self._function = function
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._types = _cached_types()
+
+    def __call__(self, value: Any) -> Any:
+        key = _cache_key(value, self._types)
+        if key is None:
+            return self._function(value)
+
+        try:
+            is_error, result = self._entries[key]
+        except KeyError:
+            pass
+        else:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            if is_error:
+                raise result[0](*result[1])
+            return result
+
+        self._misses += 1
+        try:
+            result = self._function(value)
+        except _VALIDATION_ERRORS as err:
+            self._store(key, (True, (type(err), err.args)))
+            raise
+        if type(result) in self._types.immutable_result_types:
+            self._store(key, (False, result))
+        return result
+
+    def _store(self, key: Hashable, entry: tuple) -> None:
+        self._entries[key] = entry
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Reports the statistics of the cache
+        :return: the hits, misses, maximum and current size of the cache
+        :rtype: CacheInfo
+        """
+        return CacheInfo(
+            self._hits, self._misses, self._maxsize, len(self._entries)
+        )
+
+    def cache_clear(self) -> None:
+        """
+        Empties the cache and resets its statistics
+        """
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+class CachedScalar:
+    """
+    Wraps a scalar implementation, memoizing its `coerce_input` and/or
+    `coerce_output` methods
+    """
+
+    def __init__(
+        self,
+        implementation: Any,
+        cache_size: int,
+        methods: Iterable[str] = _COERCION_METHODS,
+    ) -> None:
+        """
+        :param implementation: the scalar implementation to wrap
+        :type implementation: Any
+        :param cache_size: the maximum number of values cached per method
+        :type cache_size: int
+        :param methods: the memoized methods
+        :type methods: Iterable[str]
+        :raises ValueError: if a method isn't a coercion method
+        """
+        self.implementation = implementation
+        self._caches = {}
+        for method in methods:
+            if method not in _COERCION_METHODS:
+                raise ValueError(
+                    f"Only coercion methods can be cached: < {method} >"
+                )
+            self._caches[method] = LRUCache(
+                getattr(implementation, method), cache_size
+            )
+        self.coerce_input = self._caches.get(
+            "coerce_input", implementation.coerce_input
+        )
+        self.coerce_output = self._caches.get(
+            "coerce_output", implementation.coerce_output
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.implementation, name)
+
+    def coerce_input_many(self, values: Iterable[Any]) -> List[Any]:
+        """
+        Loads a list of input values through the cache
+        :param values: the values to coerce
+        :type values: Iterable[Any]
+        :return: the coerced values
+        :rtype: List[Any]
+        """
+        coerce_input = self.coerce_input
+        return [coerce_input(value) for value in values]
+
+    def coerce_output_many(self, values: Iterable[Any]) -> List[Any]:
+        """
+        Dumps a list of output values through the cache
+        :param values: the values to coerce
+        :type values: Iterable[Any]
+        :return: the coerced values
+        :rtype: List[Any]
+        """
+        coerce_output = self.coerce_output
+        return [coerce_output(value) for value in values]
+
+    def cache_info(self) -> Dict[str, CacheInfo]:
+        """
+        Reports the statistics of the caches
+        :return: the statistics of each memoized method
+        :rtype: Dict[str, CacheInfo]
+        """
+        return {
+            method: cache.cache_info()
+            for method, cache in self._caches.items()
+        }
@@ -0,0 +1,62 @@
+import re
+
+from math import isfinite
+from typing import Any, Union
+
+from tartiflette.constants import UNDEFINED_VALUE
+
+from tartiflette_plugin_scalars.lazy_pattern import LazyPattern
+
+# strings accepted by int() and float(), so that invalid literals can be
+# rejected without raising (and formatting) an exception
+_INT_REGEX = LazyPattern(r"""\A\s*[+-]?\d(?:_?\d)*\s*\Z""")
+_FLOAT_REGEX = LazyPattern(
+    r"""\A\s*[+-]?(?:"""
+    r"""(?:(?:\d(?:_?\d)*)?\.\d(?:_?\d)*|\d(?:_?\d)*\.?)(?:e[+-]?\d(?:_?\d)*)?"""
+    r"""|inf|infinity|nan)\s*\Z""",
+    re.IGNORECASE,
+)
+
+
+def to_int(value: Any) -> Union[int, "UNDEFINED_VALUE"]:
+    """
+    Converts a value to an integer as int() does, without raising
+    :param value: the string or number to convert
+    :type value: Any
+    :return: the integer, UNDEFINED_VALUE if the value can't be converted
+    :rtype: Union[int, UNDEFINED_VALUE]
+    """
+    if isinstance(value, str):
+        if _INT_REGEX.search(value) is None:
+            return UNDEFINED_VALUE
+        try:
+            return int(value)
+        except ValueError:  # e.g. above the max number of digits
+            return UNDEFINED_VALUE
+    if isinstance(value, float):
+        return int(value) if isfinite(value) else UNDEFINED_VALUE
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    return UNDEFINED_VALUE
+
+
+def to_float(value: Any) -> Union[float, "UNDEFINED_VALUE"]:
+    """
+    Converts a value to a float as float() does, without raising
+    :param value: the string or number to convert
+    :type value: Any
+    :return: the float, UNDEFINED_VALUE if the value can't be converted
+    :rtype: Union[float, UNDEFINED_VALUE]
+    """
+    if isinstance(value, str):
+        if _FLOAT_REGEX.search(value) is None:
+            return UNDEFINED_VALUE
+        return float(value)
+    if isinstance(value, int) and not isinstance(value, bool):
+        try:
+            return float(value)
+        except OverflowError:
+            return UNDEFINED_VALUE
+    if isinstance(value, float):
+        return value
+    return UNDEFINED_VALUE
@@ -1,17 +1,40 @@
+import re
+
 from datetime import datetime
 from typing import Union
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import StringValueNode
 
-from dateutil.parser import isoparse
+from tartiflette_plugin_scalars.iso_datetime import parse_iso_datetime
+from tartiflette_plugin_scalars.lazy_pattern import LazyPattern
+
+# the output of datetime.isoformat() (without "-00:00", parsed as UTC, nor
+# zero microseconds, which aren't formatted)
+_CANONICAL_REGEX = LazyPattern(
+    r"""\A\d{4}-\d\d-\d\dT(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d"""
+    r"""(?:\.(?!000000)\d{6})?(?:(?!-00:00)[+-](?:[01]\d|2[0-3]):[0-5]\d)?\Z""",
+    re.ASCII,
+)
+
+
+def _is_canonical(value: str) -> bool:
+    # the ISO 8601 strings formatted as isoformat() does are returned as is
+    # by coerce_output, fromisoformat only checks the ranges of the fields
+    if not _CANONICAL_REGEX.search(value):
+        return False
+    try:
+        datetime.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
 
 
 def _get_datetime(value: str) -> datetime:
     if isinstance(value, datetime):
         return value
     if isinstance(value, str):
-        return isoparse(value)
+        return parse_iso_datetime(value)
     raise TypeError(
         f"DateTime cannot represent values other than strings: < {value} >"
     )
@@ -73,8 +96,10 @@ class DateTime:
         if isinstance(value, datetime):
             return value.isoformat()
         if isinstance(value, str):
+            if _is_canonical(value):
+                return value
             try:
-                return isoparse(value).isoformat()
+                return parse_iso_datetime(value).isoformat()
             except ValueError as err:
                 raise ValueError(
                     f"DateTime cannot represent value: < {value} >"
@@ -1,72 +1,177 @@
+import re
+
 from datetime import timedelta
-from typing import Union
+from typing import Callable, Dict, Optional, Union
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import StringValueNode
 
-_VALID_KEYS = (
-    "days",
-    "seconds",
-    "microseconds",
-    "milliseconds",
-    "minutes",
-    "hours",
-    "weeks",
+from tartiflette_plugin_scalars.lazy_pattern import LazyPattern
+
+# microseconds per unit of each argument
+_UNITS = {
+    "weeks": 604800000000,
+    "days": 86400000000,
+    "hours": 3600000000,
+    "minutes": 60000000,
+    "seconds": 1000000,
+    "milliseconds": 1000,
+    "microseconds": 1,
+}
+
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_ONE_MILLISECOND = timedelta(milliseconds=1)
+
+# ISO 8601 durations in days and time units (years and months don't have a
+# fixed length), optionally negative
+_ISO_DURATION_REGEX = LazyPattern(
+    r"""\A(-?)P(?!\Z)(?:([0-9]+)W)?(?:([0-9]+)D)?"""
+    r"""(?:T(?!\Z)(?:([0-9]+)H)?(?:([0-9]+)M)?"""
+    r"""(?:([0-9]+)(?:[.,]([0-9]{1,6}))?S)?)?\Z""",
+    re.ASCII,
 )
 
 
-def _get_kv(arg: str) -> dict:
+def _scan_iso_duration(value: str) -> Optional[int]:
+    match = _ISO_DURATION_REGEX.search(value)
+    if match is None:
+        return None
+    sign, weeks, days, hours, minutes, seconds, fraction = match.groups()
+    total = (
+        int(weeks or 0) * 604800000000
+        + int(days or 0) * 86400000000
+        + int(hours or 0) * 3600000000
+        + int(minutes or 0) * 60000000
+        + int(seconds or 0) * 1000000
+    )
+    if fraction:
+        total += int(fraction.ljust(6, "0"))
+    return -total if sign else total
 
-    try:
-        key, value = arg.split("=")
-    except ValueError as err:
-        raise ValueError(
-            f"Duration argument has more or less than 2 elements: < {arg} >"
-        ) from err
-    else:
-        if key in _VALID_KEYS:
+
+def _scan_arguments(value: str) -> Union[int, str]:
+    # the keyword arguments of timedelta, a repeated key overriding the
+    # previous one, the error messages being only built for invalid values
+    total = 0
+    numbers = {}
+    for argument in value.replace(" ", "").split(","):
+        key, separator, number = argument.partition("=")
+        unit = _UNITS.get(key)
+        if unit is not None:
             try:
-                return {key: int(value)}
-            except ValueError as err:
-                raise ValueError(
-                    f"Duration argument value is not an int: < {arg} >"
-                ) from err
-        else:
-            raise ValueError(f"Duration argument has invalid key: < {arg} >")
+                # rejects the missing and the extra "=" as well
+                number = int(number)
+            except ValueError:
+                unit = None
+        if unit is None:
+            if not separator:
+                return f"Duration key missing '=': < {value} >"
+            if "=" in number:
+                return f"Duration argument has more or less than 2 elements: < {argument} >"
+            if key not in _UNITS:
+                return f"Duration argument has invalid key: < {argument} >"
+            return f"Duration argument value is not an int: < {argument} >"
+        if key in numbers:
+            total -= numbers[key] * unit
+        numbers[key] = number
+        total += number * unit
+    return total
+
+
+def _scan_duration(value: str) -> Union[int, str]:
+    """
+    Scans an ISO 8601 duration (e.g. "P1DT2H") or comma separated
+    `key=value` arguments (e.g. "days=1, hours=2"), without raising
+    :param value: the duration to scan
+    :type value: str
+    :return: the total number of microseconds, or why the value isn't a
+    duration
+    :rtype: Union[int, str]
+    """
+    if value[:1] == "P" or value[:2] == "-P":
+        microseconds = _scan_iso_duration(value)
+        if microseconds is None:
+            return f"Duration isn't a valid ISO 8601 duration: < {value} >"
+        return microseconds
+    return _scan_arguments(value)
 
 
 def _parse_duration(value: str) -> timedelta:
     if not isinstance(value, str):
         raise TypeError(f"<{value}> is not a string!")
 
-    # make a timedelta from a comma separated string
-    # remove whitespace and split by comma
-    arg_list = value.replace(" ", "").split(",")
-    arg_dict = {}
-    for arg in arg_list:
-        if "=" in arg:
-            arg_dict.update(_get_kv(arg))
-        else:
-            raise ValueError(f"Duration key missing '=': < {value} >")
-    return timedelta(**arg_dict)
+    microseconds = _scan_duration(value)
+    if isinstance(microseconds, str):
+        raise ValueError(microseconds)
+    return timedelta(0, 0, microseconds)
+
+
+def _format_iso_duration(value: timedelta) -> str:
+    microseconds = value // _ONE_MICROSECOND
+    sign = "-" if microseconds < 0 else ""
+    seconds, microseconds = divmod(abs(microseconds), 1000000)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+
+    date = f"{days}D" if days else ""
+    time = ""
+    if hours:
+        time += f"{hours}H"
+    if minutes:
+        time += f"{minutes}M"
+    if microseconds:
+        fraction = f"{microseconds:06}".rstrip("0")
+        time += f"{seconds}.{fraction}S"
+    elif seconds or not (date or time):
+        time += f"{seconds}S"
+    return f"{sign}P{date}T{time}" if time else f"{sign}P{date}"
+
+
+_OUTPUT_FORMATS: Dict[str, Callable[[timedelta], Union[str, int, float]]] = {
+    "str": timedelta.__str__,
+    "iso8601": _format_iso_duration,
+    # `value // _ONE_MILLISECOND`, rounded down, without a function call
+    "milliseconds": _ONE_MILLISECOND.__rfloordiv__,
+    "seconds": timedelta.total_seconds,
+}
 
 
 class Duration:
+    """
+    Scalar which handles durations, as ISO 8601 durations (e.g. "P1DT2H")
+    or comma separated `timedelta` arguments (e.g. "days=1, hours=2")
+    """
+
+    def __init__(self, output_format: str = "str") -> None:
+        """
+        :param output_format: "str" (the default, formatted as str() does),
+        "iso8601", "milliseconds" (an int) or "seconds" (a float)
+        :type output_format: str
+        :raises ValueError: if the output format is unknown
+        """
+        if output_format not in _OUTPUT_FORMATS:
+            raise ValueError(
+                f"Duration has an unknown output format: < {output_format} >"
+            )
+        self._format = _OUTPUT_FORMATS[output_format]
+
     @staticmethod
     def parse_literal(ast: "ValueNode") -> Union[timedelta, "UNDEFINED_VALUE"]:
-        if isinstance(ast, StringValueNode):
-            try:
-                return _parse_duration(ast.value)
-            except (ValueError, TypeError, OverflowError):
-                return UNDEFINED_VALUE
+        if isinstance(ast, StringValueNode) and isinstance(ast.value, str):
+            microseconds = _scan_duration(ast.value)
+            if not isinstance(microseconds, str):
+                try:
+                    return timedelta(0, 0, microseconds)
+                except OverflowError:
+                    pass
         return UNDEFINED_VALUE
 
     @staticmethod
     def coerce_input(value: str) -> timedelta:
         return _parse_duration(value)
 
-    @staticmethod
-    def coerce_output(value: timedelta) -> str:
+    def coerce_output(self, value: timedelta) -> Union[str, int, float]:
         if isinstance(value, timedelta):
-            return value.__str__()
+            return self._format(value)
         raise TypeError(f"Duration cannot represent value: < {value} >")
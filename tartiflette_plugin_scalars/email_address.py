@@ -1,11 +1,11 @@
-import re
-
 from typing import Union
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import StringValueNode
 
-_EMAIL_ADDRESS_REGEX = re.compile(
+from tartiflette_plugin_scalars.lazy_pattern import LazyPattern
+
+_EMAIL_ADDRESS_REGEX = LazyPattern(
     r"""^(([^<>()\[\]\\.,;:\s@"]+(\.[^<>()\[\]\\.,;:\s@"]+)*)|(".+"))@((\[[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}\.[0-9]{1,3}])|(([a-zA-Z\-0-9]+\.)+[a-zA-Z]{2,}))$"""
 )
 
@@ -34,11 +34,12 @@ class EmailAddress:
         :return: the value if it's an email, UNDEFINED_VALUE otherwise
         :rtype: Union[str, UNDEFINED_VALUE]
         """
-        if isinstance(ast, StringValueNode):
-            try:
-                return _check_email_address(ast.value)
-            except (ValueError, TypeError):
-                return UNDEFINED_VALUE
+        if (
+            isinstance(ast, StringValueNode)
+            and isinstance(ast.value, str)
+            and _EMAIL_ADDRESS_REGEX.search(ast.value)
+        ):
+            return ast.value
         return UNDEFINED_VALUE
 
     @staticmethod
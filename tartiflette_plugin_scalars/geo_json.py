@@ -1,21 +1,58 @@
 import json
 
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterable, Optional
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import StringValueNode
 
-import geojson
 
+def _geojson() -> "ModuleType":
+    # geojson is only imported once a value has to be coerced
+    # pylint: disable=import-outside-toplevel
+    import geojson
 
-def _parse_json(value: str) -> Any:
+    return geojson
+
+
+@lru_cache(maxsize=None)
+def _encoder() -> "Type[json.JSONEncoder]":
+    # pylint: disable=import-outside-toplevel
+    from tartiflette_plugin_scalars.geo_json_coordinates import (
+        unpack_coordinates,
+    )
+
+    geojson = _geojson()
+
+    class PackedGeoJSONEncoder(geojson.GeoJSONEncoder):
+        """
+        Encoder serializing the packed coordinates from their buffers
+        """
+
+        def default(self, obj: Any) -> Any:
+            coordinates = unpack_coordinates(obj)
+            if coordinates is not None:
+                return coordinates
+            return super().default(obj)
+
+    return PackedGeoJSONEncoder
+
+
+def _parse_json(value: str, decoding: Optional["GeoJSONDecoding"]) -> Any:
     if isinstance(value, str):
+        geojson = _geojson()
         try:
-            return geojson.loads(value)
+            if decoding is None:
+                return geojson.loads(value)
+            result = geojson.loads(
+                value, object_hook=decoding.object_hook(geojson)
+            )
         except json.decoder.JSONDecodeError as err:
             raise ValueError(
                 f"Value is not a valid GeoJSON value: < {value} >"
             ) from err
+        decoding.check(result)
+        return result
     raise TypeError(
         f"GeoJSON cannot represent values other than strings: < {value} >"
     )
@@ -26,8 +63,61 @@ class GeoJSON:
     Scalar which handles GeoJSON values
     """
 
-    @staticmethod
-    def parse_literal(ast: "ValueNode") -> Any:
+    def __init__(
+        self,
+        coordinates: str = "list",
+        precision: Optional[int] = None,
+        validate: bool = False,
+        allowed_types: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        :param coordinates: how the coordinates of the input geometries are
+        stored: "list" (nested lists of floats, as decoded by geojson),
+        "array" (an `array("d")` per geometry) or "numpy" (a NumPy array
+        per geometry), see `pack_coordinates`
+        :type coordinates: str
+        :param precision: the number of decimal places to which the
+        coordinates of the input and the output values are rounded, the
+        input ones being rounded to 6 and the output ones dumped as is if
+        None
+        :type precision: Optional[int]
+        :param validate: whether the input geometries are validated, see
+        `GeoJSONDecoding`
+        :type validate: bool
+        :param allowed_types: the types of the GeoJSON objects accepted as
+        input, nested ones included, any type if None
+        :type allowed_types: Optional[Iterable[str]]
+        :raises ValueError: if the storage is unknown or NumPy isn't
+        installed, if the precision isn't a non negative integer or if a
+        type is unknown
+        """
+        if coordinates != "list":
+            # the packed storages are only imported by the scalars using them
+            # pylint: disable=import-outside-toplevel
+            from tartiflette_plugin_scalars.geo_json_coordinates import (
+                check_coordinates_storage,
+            )
+
+            check_coordinates_storage(coordinates)
+        # the decoding is only imported by the scalars with options
+        self._decoding = None
+        if (precision, validate, allowed_types, coordinates) != (
+            None,
+            False,
+            None,
+            "list",
+        ):
+            # pylint: disable=import-outside-toplevel
+            from tartiflette_plugin_scalars.geo_json_decoding import (
+                GeoJSONDecoding,
+            )
+
+            self._decoding = GeoJSONDecoding.from_options(
+                precision, validate, allowed_types, coordinates
+            )
+        self._precision = precision
+
+    def parse_literal(self, ast: "ValueNode") -> Any:
         """
         Dumps the input value from an AST node
         :param ast: ast node to coerce
@@ -37,13 +127,12 @@ class GeoJSON:
         """
         if isinstance(ast, StringValueNode):
             try:
-                return _parse_json(ast.value)
+                return _parse_json(ast.value, self._decoding)
             except (ValueError, TypeError):
                 return UNDEFINED_VALUE
         return UNDEFINED_VALUE
 
-    @staticmethod
-    def coerce_input(value: str) -> Any:
+    def coerce_input(self, value: str) -> Any:
         """
         Dumps the input value
         :param value: the value to coerce
@@ -51,11 +140,12 @@ class GeoJSON:
         :return: the value parsed from GeoJSON
         :rtype: int
         :raises TypeError: if the value isn't a string
+        :raises ValueError: if the value isn't valid JSON, or isn't valid
+        GeoJSON or has a type which isn't allowed
         """
-        return _parse_json(value)
+        return _parse_json(value, self._decoding)
 
-    @staticmethod
-    def coerce_output(value: Any) -> str:
+    def coerce_output(self, value: Any) -> str:
         """
         Loads the output value
         :param value: the value to coerce
@@ -63,8 +153,18 @@ class GeoJSON:
         :return: the value dumped to GeoJSON
         :rtype: str
         """
+        geojson = _geojson()
         try:
-            return geojson.dumps(value, sort_keys=True)
+            if self._precision is not None:
+                # pylint: disable=import-outside-toplevel
+                from tartiflette_plugin_scalars.geo_json_decoding import (
+                    round_coordinates,
+                )
+
+                value = round_coordinates(
+                    geojson.mapping.to_mapping(value), self._precision
+                )
+            return geojson.dumps(value, cls=_encoder(), sort_keys=True)
         except TypeError as err:
             raise ValueError(
                 f"Object of type {type(value).__name__} is not GeoJSON serializable"
@@ -0,0 +1,237 @@
+from array import array
+from collections.abc import Sequence
+from importlib.util import find_spec
+from itertools import chain
+from typing import Any, Iterator, List, Union
+
+# the nesting level of the positions in the coordinates of each type of
+# geometry: a Point has one position, a LineString a list of positions...
+POSITIONS_DEPTHS = {
+    "Point": 0,
+    "MultiPoint": 1,
+    "LineString": 1,
+    "MultiLineString": 2,
+    "Polygon": 2,
+    "MultiPolygon": 3,
+}
+
+COORDINATES_STORAGES = ("list", "array", "numpy")
+
+
+def check_coordinates_storage(storage: str) -> None:
+    """
+    Checks that a coordinates storage exists and that NumPy is installed if
+    it's required, without importing it
+    :param storage: "list", "array" or "numpy"
+    :type storage: str
+    :raises ValueError: if the storage is unknown or NumPy isn't installed
+    """
+    if storage not in COORDINATES_STORAGES:
+        raise ValueError(f"Unknown GeoJSON coordinates storage: < {storage} >")
+    if storage == "numpy" and find_spec("numpy") is None:
+        raise ValueError(
+            "GeoJSON coordinates storage requires NumPy: < numpy >"
+        )
+
+
+class Positions(Sequence):
+    """
+    Read-only sequence of the positions of a LineString, a ring of a Polygon
+    or a MultiPoint, viewing a slice of the `array("d")` buffer which holds
+    all the positions of its geometry
+    """
+
+    __slots__ = ("_buffer", "_start", "_stop", "_dimension")
+
+    def __init__(
+        self, buffer: array, start: int, stop: int, dimension: int
+    ) -> None:
+        """
+        :param buffer: the coordinates of the positions of the geometry
+        :type buffer: array
+        :param start: the index of the first coordinate of the positions
+        :type start: int
+        :param stop: the index following the last coordinate of the positions
+        :type stop: int
+        :param dimension: the number of coordinates of a position
+        :type dimension: int
+        """
+        self._buffer = buffer
+        self._start = start
+        self._stop = stop
+        self._dimension = dimension
+
+    def __len__(self) -> int:
+        return (self._stop - self._start) // self._dimension
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[List[float], "Positions"]:
+        length = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(length)
+            if step != 1:
+                return [self[item] for item in range(start, stop, step)]
+            stop = max(start, stop)
+            return Positions(
+                self._buffer,
+                self._start + start * self._dimension,
+                self._start + stop * self._dimension,
+                self._dimension,
+            )
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("position index out of range")
+        start = self._start + index * self._dimension
+        return self._buffer[start : start + self._dimension].tolist()
+
+    def __iter__(self) -> Iterator[List[float]]:
+        return iter(self.tolist())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Positions):
+            return self.tolist() == other.tolist()
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return self.tolist() == [list(position) for position in other]
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.tolist()!r})"
+
+    @property
+    def dimension(self) -> int:
+        """
+        :return: the number of coordinates of a position (2 or 3)
+        :rtype: int
+        """
+        return self._dimension
+
+    @property
+    def memoryview(self) -> memoryview:
+        """
+        :return: the coordinates of the positions, one after the other,
+        without copying them
+        :rtype: memoryview
+        """
+        return memoryview(self._buffer)[self._start : self._stop]
+
+    def tolist(self) -> List[List[float]]:
+        """
+        :return: the positions, as lists of coordinates
+        :rtype: List[List[float]]
+        """
+        if self._start == self._stop:
+            return []
+        return (
+            self.memoryview.cast("B")
+            .cast("d", [len(self), self._dimension])
+            .tolist()
+        )
+
+
+def _numpy() -> Any:
+    # pylint: disable=import-outside-toplevel
+    import numpy
+
+    return numpy
+
+
+def _lines(coordinates: list, depth: int) -> List[list]:
+    # the lists of positions, in order
+    if depth == 1:
+        return [coordinates]
+    return [line for child in coordinates for line in _lines(child, depth - 1)]
+
+
+def _nest(coordinates: list, depth: int, views: Iterator[Any]) -> Any:
+    # the coordinates, with their lists of positions replaced by views
+    if depth == 1:
+        return next(views)
+    return [_nest(child, depth - 1, views) for child in coordinates]
+
+
+def _pack(coordinates: list, depth: int, storage: str) -> Any:
+    if depth == 0:
+        if storage == "numpy":
+            return _numpy().array(coordinates, dtype="float64")
+        return array("d", coordinates)
+
+    lines = _lines(coordinates, depth)
+    first_line = next((line for line in lines if line), None)
+    if first_line is None:
+        return coordinates
+    dimension = len(first_line[0])
+    for line in lines:
+        if line and set(map(len, line)) != {dimension}:
+            return coordinates
+
+    # the coordinates are copied one after the other, without an
+    # intermediate list
+    count = sum(map(len, lines))
+    flat = chain.from_iterable(chain.from_iterable(lines))
+    views = []
+    start = 0
+    if storage == "numpy":
+        numpy = _numpy()
+        buffer = numpy.fromiter(
+            flat, dtype=numpy.float64, count=count * dimension
+        ).reshape(count, dimension)
+        for line in lines:
+            views.append(buffer[start : start + len(line)])
+            start += len(line)
+    else:
+        buffer = array("d", flat)
+        for line in lines:
+            stop = start + len(line) * dimension
+            views.append(Positions(buffer, start, stop, dimension))
+            start = stop
+    return _nest(coordinates, depth, iter(views))
+
+
+def pack_coordinates(
+    coordinates: list, geometry_type: str, storage: str
+) -> Any:
+    """
+    Stores the coordinates of a geometry in a single buffer of doubles, the
+    lists of positions being replaced by views of this buffer: `Positions`
+    for the "array" storage, NumPy arrays of shape (positions, dimension)
+    for the "numpy" storage. The position of a Point is stored in its own
+    `array("d")` or NumPy array.
+    :param coordinates: the coordinates, as decoded by geojson
+    :type coordinates: list
+    :param geometry_type: the type of the geometry (e.g. "Polygon")
+    :type geometry_type: str
+    :param storage: "array" or "numpy"
+    :type storage: str
+    :return: the packed coordinates, or the coordinates as is when they
+    aren't nested as the type of the geometry requires or their positions
+    don't all have the same number of coordinates
+    :rtype: Any
+    """
+    depth = POSITIONS_DEPTHS.get(geometry_type)
+    if depth is None or not coordinates:
+        return coordinates
+    try:
+        return _pack(coordinates, depth, storage)
+    except (TypeError, ValueError):
+        return coordinates
+
+
+def unpack_coordinates(value: Any) -> Any:
+    """
+    Converts packed coordinates to lists, for the JSON encoder
+    :param value: a value the JSON encoder can't serialize
+    :type value: Any
+    :return: the lists of coordinates, None if the value isn't packed
+    coordinates
+    :rtype: Any
+    """
+    value_type = type(value)
+    if value_type is Positions or value_type is array:
+        return value.tolist()
+    if value_type.__name__ == "ndarray" and value_type.__module__ == "numpy":
+        return value.tolist()
+    return None
@@ -0,0 +1,333 @@
+from typing import (
+    Any,
+    Callable,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+)
+
+from tartiflette_plugin_scalars.geo_json_coordinates import (
+    POSITIONS_DEPTHS,
+    pack_coordinates,
+    unpack_coordinates,
+)
+
+_GEOMETRY_TYPES = frozenset(POSITIONS_DEPTHS) | {"GeometryCollection"}
+_FEATURE_TYPES = frozenset({"Feature"})
+GEOJSON_TYPES = _GEOMETRY_TYPES | _FEATURE_TYPES | {"FeatureCollection"}
+
+# the number of decimal places to which geojson rounds the coordinates
+_DEFAULT_PRECISION = 6
+
+
+def _round(coordinates: Any, precision: int) -> list:
+    # as geojson does, without checking how the coordinates are nested
+    if type(coordinates) is not list:  # pylint: disable=unidiomatic-typecheck
+        raise ValueError("coordinates must be nested lists of numbers")
+    return [
+        _round(coordinate, precision)
+        if type(coordinate) is list  # pylint: disable=unidiomatic-typecheck
+        else round(coordinate, precision)
+        for coordinate in coordinates
+    ]
+
+
+def _positions(positions: Any, precision: int, minimum: int) -> List[list]:
+    if type(positions) is not list:  # pylint: disable=unidiomatic-typecheck
+        raise ValueError("positions must be in a list")
+    if len(positions) < minimum:
+        raise ValueError(f"a line must have at least {minimum} positions")
+    rounded = []
+    for position in positions:
+        if (
+            type(position) is not list  # pylint: disable=unidiomatic-typecheck
+            or not 2 <= len(position) <= 3
+        ):
+            raise ValueError("a position must have exactly 2 or 3 values")
+        rounded.append(
+            [round(coordinate, precision) for coordinate in position]
+        )
+    return rounded
+
+
+def _rings(rings: Any, precision: int) -> List[List[list]]:
+    if type(rings) is not list:  # pylint: disable=unidiomatic-typecheck
+        raise ValueError("linear rings must be in a list")
+    rounded = []
+    for ring in rings:
+        if type(ring) is list and len(ring) < 4:
+            raise ValueError(
+                "each linear ring must contain at least 4 positions"
+            )
+        ring = _positions(ring, precision, 4)
+        if ring[0] != ring[-1]:
+            raise ValueError("each linear ring must end where it started")
+        rounded.append(ring)
+    return rounded
+
+
+def _children(children: Any) -> list:
+    if type(children) is not list:  # pylint: disable=unidiomatic-typecheck
+        raise ValueError("the geometries must be in a list")
+    return children
+
+
+# validates and rounds the coordinates of each type of geometry, walking
+# them once
+_VALIDATORS = {
+    "Point": lambda coordinates, precision: _positions(
+        [coordinates], precision, 1
+    )[0],
+    "MultiPoint": lambda coordinates, precision: _positions(
+        coordinates, precision, 0
+    ),
+    "LineString": lambda coordinates, precision: _positions(
+        coordinates, precision, 2
+    ),
+    "MultiLineString": lambda coordinates, precision: [
+        _positions(line, precision, 2) for line in _children(coordinates)
+    ],
+    "Polygon": _rings,
+    "MultiPolygon": lambda coordinates, precision: [
+        _rings(polygon, precision) for polygon in _children(coordinates)
+    ],
+}
+
+
+def _rounded_coordinates(coordinates: Any, precision: int) -> Any:
+    unpacked = unpack_coordinates(coordinates)
+    if unpacked is not None:
+        coordinates = unpacked
+    if isinstance(coordinates, (list, tuple)):
+        if coordinates and type(coordinates[0]) in (int, float):
+            # a position, rounded without a call per coordinate
+            try:
+                return [
+                    round(coordinate, precision) for coordinate in coordinates
+                ]
+            except TypeError:
+                pass
+        return [
+            _rounded_coordinates(coordinate, precision)
+            for coordinate in coordinates
+        ]
+    if isinstance(coordinates, (int, float)) and not isinstance(
+        coordinates, bool
+    ):
+        return round(coordinates, precision)
+    return coordinates
+
+
+def round_coordinates(value: Any, precision: int) -> Any:
+    """
+    Rounds the coordinates of the geometries of a GeoJSON value, before
+    dumping it
+    :param value: the GeoJSON objects, as mappings
+    :type value: Any
+    :param precision: the number of decimal places of the coordinates
+    :type precision: int
+    :return: copies of the GeoJSON objects with rounded coordinates, the
+    other values as is
+    :rtype: Any
+    """
+    if not isinstance(value, dict):
+        return value
+    value_type = value.get("type")
+    if not isinstance(value_type, str):
+        return value
+    if value_type in POSITIONS_DEPTHS and "coordinates" in value:
+        key = "coordinates"
+        rounded = _rounded_coordinates(value[key], precision)
+    elif value_type == "Feature" and value.get("geometry") is not None:
+        key = "geometry"
+        rounded = round_coordinates(value[key], precision)
+    elif value_type in ("FeatureCollection", "GeometryCollection"):
+        key = "features" if value_type == "FeatureCollection" else "geometries"
+        children = value.get(key)
+        if not isinstance(children, (list, tuple)):
+            return value
+        rounded = [round_coordinates(child, precision) for child in children]
+    else:
+        return value
+    value = dict(value)
+    value[key] = rounded
+    return value
+
+
+class GeoJSONDecoding(NamedTuple):
+    """
+    Options of the decoding of the GeoJSON input values: the coordinates of
+    each geometry are validated, rounded and packed in a single walk, while
+    the document is decoded
+    """
+
+    precision: Optional[int] = None
+    validate: bool = False
+    allowed_types: Optional[FrozenSet[str]] = None
+    coordinates: str = "list"
+
+    @classmethod
+    def from_options(
+        cls,
+        precision: Optional[int] = None,
+        validate: bool = False,
+        allowed_types: Optional[Iterable[str]] = None,
+        coordinates: str = "list",
+    ) -> Optional["GeoJSONDecoding"]:
+        """
+        Builds the decoding options of a scalar from its options
+        :param precision: the number of decimal places to which the
+        coordinates are rounded, 6 (as geojson does) if None
+        :type precision: Optional[int]
+        :param validate: whether the geometries are validated: the positions
+        have 2 or 3 coordinates, the lines at least 2 positions, and the
+        linear rings at least 4 positions and end where they start
+        :type validate: bool
+        :param allowed_types: the types of the GeoJSON objects accepted,
+        nested ones included (e.g. "FeatureCollection", "Feature" and
+        "Polygon"), any type if None
+        :type allowed_types: Optional[Iterable[str]]
+        :param coordinates: the storage of the coordinates, see
+        `pack_coordinates`
+        :type coordinates: str
+        :return: the decoding options, None if geojson decodes the values
+        as is
+        :rtype: Optional[GeoJSONDecoding]
+        :raises ValueError: if the precision isn't a non negative integer or
+        if a type is unknown
+        """
+        if precision is not None and (
+            not isinstance(precision, int)
+            or isinstance(precision, bool)
+            or precision < 0
+        ):
+            raise ValueError(
+                f"GeoJSON precision isn't a non negative integer: < {precision} >"
+            )
+        if allowed_types is not None:
+            if isinstance(allowed_types, str):
+                allowed_types = (allowed_types,)
+            allowed_types = frozenset(allowed_types)
+            unknown_types = allowed_types - GEOJSON_TYPES
+            if unknown_types:
+                raise ValueError(
+                    f"Unknown GeoJSON type: < {', '.join(sorted(unknown_types))} >"
+                )
+        decoding = cls(precision, bool(validate), allowed_types, coordinates)
+        if decoding == cls():
+            return None
+        return decoding
+
+    def object_hook(self, geojson: "ModuleType") -> Callable[[dict], Any]:
+        """
+        Replaces the object hook of geojson: the geometries are built from
+        their validated, rounded and packed coordinates, the lists of floats
+        of a geometry being released before the next one is decoded
+        :param geojson: the geojson module
+        :type geojson: ModuleType
+        :return: the object hook
+        :rtype: Callable[[dict], Any]
+        """
+        to_instance = geojson.GeoJSON.to_instance
+        precision = (
+            _DEFAULT_PRECISION if self.precision is None else self.precision
+        )
+        validate = self.validate
+        storage = self.coordinates
+
+        def hook(value: dict) -> Any:
+            geometry_type = value.get("type")
+            if (
+                not isinstance(geometry_type, str)
+                or geometry_type not in POSITIONS_DEPTHS
+            ):
+                return to_instance(value)
+            try:
+                if validate:
+                    coordinates = _VALIDATORS[geometry_type](
+                        value.get("coordinates"), precision
+                    )
+                else:
+                    coordinates = _round(
+                        value.get("coordinates") or [], precision
+                    )
+            except TypeError as err:
+                raise ValueError(
+                    f"GeoJSON {geometry_type} is invalid: "
+                    "coordinates must be numbers"
+                ) from err
+            except ValueError as err:
+                raise ValueError(
+                    f"GeoJSON {geometry_type} is invalid: {err}"
+                ) from err
+            extra = {
+                str(key): member
+                for key, member in value.items()
+                if key not in ("type", "coordinates")
+            }
+            instance = getattr(geojson, geometry_type)(**extra)
+            if storage != "list":
+                coordinates = pack_coordinates(
+                    coordinates, geometry_type, storage
+                )
+            instance["coordinates"] = coordinates
+            return instance
+
+        return hook
+
+    def check(self, value: Any) -> None:
+        """
+        Checks the types of the GeoJSON objects of a decoded value, walking
+        the objects but not their coordinates (already validated by the
+        object hook)
+        :param value: the decoded value
+        :type value: Any
+        :raises ValueError: if an object has a type which isn't allowed, or
+        isn't the GeoJSON object expected when the values are validated
+        """
+        if self.validate or self.allowed_types is not None:
+            self._check(value, GEOJSON_TYPES, "GeoJSON object")
+
+    def _check(
+        self, value: Any, expected: FrozenSet[str], expected_name: str
+    ) -> None:
+        value_type = value.get("type") if isinstance(value, dict) else None
+        if not isinstance(value_type, str):
+            value_type = None
+        if self.allowed_types is not None and (
+            value_type not in self.allowed_types
+        ):
+            raise ValueError(f"GeoJSON type isn't allowed: < {value_type} >")
+        if self.validate and value_type not in expected:
+            raise ValueError(
+                f"Value isn't a {expected_name}: < {value_type} >"
+            )
+
+        if value_type == "Feature":
+            geometry = value.get("geometry")
+            if geometry is not None:
+                self._check(geometry, _GEOMETRY_TYPES, "GeoJSON geometry")
+            return
+        if value_type == "FeatureCollection":
+            key, expected, expected_name = (
+                "features",
+                _FEATURE_TYPES,
+                "GeoJSON Feature",
+            )
+        elif value_type == "GeometryCollection":
+            key, expected, expected_name = (
+                "geometries",
+                _GEOMETRY_TYPES,
+                "GeoJSON geometry",
+            )
+        else:
+            return
+        children = value.get(key)
+        if not isinstance(children, list):
+            if self.validate:
+                raise ValueError(f"GeoJSON {value_type} has no list of {key}")
+            return
+        for child in children:
+            self._check(child, expected, expected_name)
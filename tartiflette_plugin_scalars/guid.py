@@ -1,11 +1,11 @@
-import re
-
 from typing import Union
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import StringValueNode
 
-_GUID_REGEX = re.compile(
+from tartiflette_plugin_scalars.lazy_pattern import LazyPattern
+
+_GUID_REGEX = LazyPattern(
     r"""[0-9a-f]{8}-?[0-9a-f]{4}-?[1-5][0-9a-f]{3}-?[89ab][0-9a-f]{3}-?[0-9a-f]{12}$"""
 )
 
@@ -34,11 +34,12 @@ class GUID:
         :return: the value if it's a GUID, UNDEFINED_VALUE otherwise
         :rtype: Union[str, UNDEFINED_VALUE]
         """
-        if isinstance(ast, StringValueNode):
-            try:
-                return _check_guid(ast.value)
-            except (ValueError, TypeError):
-                return UNDEFINED_VALUE
+        if (
+            isinstance(ast, StringValueNode)
+            and isinstance(ast.value, str)
+            and _GUID_REGEX.search(ast.value)
+        ):
+            return ast.value
         return UNDEFINED_VALUE
 
     @staticmethod
@@ -1,11 +1,11 @@
-import re
-
 from typing import Union
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import StringValueNode
 
-_HEX_COLOR_CODE_REGEX = re.compile(
+from tartiflette_plugin_scalars.lazy_pattern import LazyPattern
+
+_HEX_COLOR_CODE_REGEX = LazyPattern(
     r"""^#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3}|[A-Fa-f0-9]{8})$"""
 )
 
@@ -34,11 +34,12 @@ class HexColorCode:
         :return: the value if it's a HexColorCode, UNDEFINED_VALUE otherwise
         :rtype: Union[str, UNDEFINED_VALUE]
         """
-        if isinstance(ast, StringValueNode):
-            try:
-                return _check_hex_color_code(ast.value)
-            except (ValueError, TypeError):
-                return UNDEFINED_VALUE
+        if (
+            isinstance(ast, StringValueNode)
+            and isinstance(ast.value, str)
+            and _HEX_COLOR_CODE_REGEX.search(ast.value)
+        ):
+            return ast.value
         return UNDEFINED_VALUE
 
     @staticmethod
@@ -1,11 +1,11 @@
-import re
-
 from typing import Union
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import StringValueNode
 
-_HSL_REGEX = re.compile(
+from tartiflette_plugin_scalars.lazy_pattern import LazyPattern
+
+_HSL_REGEX = LazyPattern(
     r"""^hsl\(\s*(-?\d+|-?\d*.\d+)(turn|rad|deg|)\s*,\s*(-?\d+|-?\d*.\d+)%\s*,\s*(-?\d+|-?\d*.\d+)%\s*\)$"""
 )
 
@@ -34,11 +34,12 @@ class HSL:
         :return: the value if it's a HSL, UNDEFINED_VALUE otherwise
         :rtype: Union[str, UNDEFINED_VALUE]
         """
-        if isinstance(ast, StringValueNode):
-            try:
-                return _check_hsl(ast.value)
-            except (ValueError, TypeError):
-                return UNDEFINED_VALUE
+        if (
+            isinstance(ast, StringValueNode)
+            and isinstance(ast.value, str)
+            and _HSL_REGEX.search(ast.value)
+        ):
+            return ast.value
         return UNDEFINED_VALUE
 
     @staticmethod
@@ -1,11 +1,11 @@
-import re
-
 from typing import Union
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import StringValueNode
 
-_HSLA_REGEX = re.compile(
+from tartiflette_plugin_scalars.lazy_pattern import LazyPattern
+
+_HSLA_REGEX = LazyPattern(
     r"""^hsla\(\s*(-?\d+|-?\d*.\d+)(turn|rad|deg|)\s*,\s*(-?\d+|-?\d*.\d+)%\s*,\s*(-?\d+|-?\d*.\d+)%\s*,\s*(-?\d+|-?\d*.\d+)\s*\)$"""
 )
 
@@ -34,11 +34,12 @@ class HSLA:
         :return: the value if it's a HSLA, UNDEFINED_VALUE otherwise
         :rtype: Union[str, UNDEFINED_VALUE]
         """
-        if isinstance(ast, StringValueNode):
-            try:
-                return _check_hsla(ast.value)
-            except (ValueError, TypeError):
-                return UNDEFINED_VALUE
+        if (
+            isinstance(ast, StringValueNode)
+            and isinstance(ast.value, str)
+            and _HSLA_REGEX.search(ast.value)
+        ):
+            return ast.value
         return UNDEFINED_VALUE
 
     @staticmethod
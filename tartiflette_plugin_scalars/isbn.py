@@ -1,32 +1,32 @@
-import re
-
 from typing import Union
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import StringValueNode
 
+from tartiflette_plugin_scalars.lazy_pattern import LazyPattern
+
 _ISBN_REGEXES = [
-    re.compile(
+    LazyPattern(
         r"""^(?:ISBN(?:-10)?:? *((?=\d{1,5}([ -]?)\d{1,7}\2?\d{1,6}\2?\d)(?:\d\2*){9}[\dX]))$"""
     ),
-    re.compile(
+    LazyPattern(
         r"""^(?:ISBN(?:-13)?:? *(97(?:8|9)([ -]?)(?=\d{1,5}\2?\d{1,7}\2?\d{1,6}\2?\d)(?:\d\2*){9}\d))$"""
     ),
 ]
 
 
+def _is_isbn(value: str) -> bool:
+    return value != "" and any(
+        isbn_regex.search(value) for isbn_regex in _ISBN_REGEXES
+    )
+
+
 def _check_isbn(value: str) -> str:
     if not isinstance(value, str):
         raise TypeError(
             f"ISBN cannot represent a non string value: < {value} >"
         )
-    match = False
-    if value != "":
-        for isbn_regex in _ISBN_REGEXES:
-            if isbn_regex.search(value):
-                match = True
-                break
-    if not match:
+    if not _is_isbn(value):
         raise ValueError(f"Value is not a valid ISBN: < {value} >")
     return value
 
@@ -45,11 +45,12 @@ class ISBN:
         :return: the value if it's an ISBN, UNDEFINED_VALUE otherwise
         :rtype: Union[str, UNDEFINED_VALUE]
         """
-        if isinstance(ast, StringValueNode):
-            try:
-                return _check_isbn(ast.value)
-            except (ValueError, TypeError):
-                return UNDEFINED_VALUE
+        if (
+            isinstance(ast, StringValueNode)
+            and isinstance(ast.value, str)
+            and _is_isbn(ast.value)
+        ):
+            return ast.value
         return UNDEFINED_VALUE
 
     @staticmethod
@@ -0,0 +1,104 @@
+import re
+
+from datetime import datetime, timedelta, tzinfo
+from typing import Dict, Optional
+
+from tartiflette_plugin_scalars.lazy_pattern import LazyPattern
+
+_COMMON_LAYOUT_REGEX = LazyPattern(
+    r"""\A(?P<naive>\d{4}-\d\d-\d\d[T ](?P<hour>\d\d):\d\d:\d\d"""
+    r"""(?:\.(?P<fraction>\d{1,6}))?)"""
+    r"""(?:(?P<utc>[Zz])|(?P<sign>[+-])(?P<hours>\d\d):(?P<minutes>\d\d))?\Z""",
+    re.ASCII,
+)
+
+_ONE_SECOND = timedelta(seconds=1)
+
+# time zones of the parsed datetimes, by UTC offset in seconds
+_TZINFOS: Dict[int, tzinfo] = {}
+
+
+def _isoparse(value: str) -> datetime:
+    # dateutil is only imported once a value has to be parsed
+    # pylint: disable=import-outside-toplevel
+    from dateutil.parser import isoparse
+
+    return isoparse(value)
+
+
+def _offset_tzinfo(offset: int) -> tzinfo:
+    """
+    Returns the time zone of a UTC offset, parsed datetimes sharing the
+    same instance per offset
+    :param offset: the UTC offset, in seconds
+    :type offset: int
+    :return: the time zone, the same as the one isoparse would build
+    :rtype: tzinfo
+    """
+    timezone = _TZINFOS.get(offset)
+    if timezone is None:
+        # pylint: disable=import-outside-toplevel
+        from dateutil.tz import UTC, tzoffset
+
+        # offsets are whole minutes within a day, the cache is bounded
+        timezone = _TZINFOS[offset] = (
+            UTC if offset == 0 else tzoffset(None, offset)
+        )
+    return timezone
+
+
+def _parse_common_layout(value: str) -> Optional[datetime]:
+    """
+    Parses the common `YYYY-MM-DDTHH:MM:SS[.ffffff][Z|±HH:MM]` layout (with
+    a "T" or a space between the date and the time)
+    :param value: the value to parse
+    :type value: str
+    :return: the datetime, None if the value doesn't have this layout
+    :rtype: Optional[datetime]
+    :raises ValueError: if a field is out of its range
+    """
+    match = _COMMON_LAYOUT_REGEX.search(value)
+    if match is None or match["hour"] == "24":
+        # isoparse handles the midnight of the next day
+        return None
+
+    naive = match["naive"]
+    fraction = match["fraction"]
+    if fraction is not None and len(fraction) not in (3, 6):
+        # before Python 3.11, fromisoformat only parses milliseconds and
+        # microseconds
+        naive = naive[:20] + fraction.ljust(6, "0")
+    result = datetime.fromisoformat(naive)
+
+    if match["utc"] is not None:
+        return result.replace(tzinfo=_offset_tzinfo(0))
+    if match["sign"] is not None:
+        hours, minutes = int(match["hours"]), int(match["minutes"])
+        if hours > 23 or minutes > 59:
+            return None
+        offset = (hours * 60 + minutes) * 60
+        return result.replace(
+            tzinfo=_offset_tzinfo(-offset if match["sign"] == "-" else offset)
+        )
+    return result
+
+
+def parse_iso_datetime(value: str) -> datetime:
+    """
+    Parses an ISO 8601 datetime as `dateutil.parser.isoparse` does, the
+    common layouts being parsed without it
+    :param value: the value to parse
+    :type value: str
+    :return: the datetime
+    :rtype: datetime
+    :raises ValueError: if the value isn't an ISO 8601 datetime
+    """
+    result = _parse_common_layout(value)
+    if result is not None:
+        return result
+    result = _isoparse(value)
+    if result.tzinfo is not None:
+        timezone = _offset_tzinfo(result.tzinfo.utcoffset(None) // _ONE_SECOND)
+        if timezone is not result.tzinfo:
+            result = result.replace(tzinfo=timezone)
+    return result
@@ -1,16 +1,36 @@
-import json
-
-from typing import Any  # pylint: disable=unused-import
+from typing import Any, Optional
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import StringValueNode
 
 
-def _parse_json(value: str) -> Any:
+def _json_backend() -> "ModuleType":
+    # the backends (and RawJSON) are only imported once a value has to be
+    # coerced
+    # pylint: disable=import-outside-toplevel
+    from tartiflette_plugin_scalars import json_backend
+
+    return json_backend
+
+
+def _lazy_json(value: str) -> Any:
+    # pylint: disable=import-outside-toplevel
+    from tartiflette_plugin_scalars.json_lazy import lazy_json
+
+    return lazy_json(value)
+
+
+def _parse_json(
+    value: str, backend: str, limits: Optional["JSONLimits"], lazy: bool
+) -> Any:
     if isinstance(value, str):
+        if limits is not None:
+            limits.check(value)
         try:
-            return json.loads(value)
-        except json.decoder.JSONDecodeError as err:
+            if lazy:
+                return _lazy_json(value)
+            return _json_backend().get_json_backend(backend).loads(value)
+        except ValueError as err:
             raise ValueError(
                 f"Value is not a valid JSON value: < {value} >"
             ) from err
@@ -24,8 +44,51 @@ class JSON:
     Scalar which handles JSON values
     """
 
-    @staticmethod
-    def parse_literal(ast: "ValueNode") -> Any:
+    def __init__(
+        self,
+        backend: str = "json",
+        max_bytes: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        max_keys: Optional[int] = None,
+        lazy: bool = False,
+        validate_raw: bool = False,
+    ) -> None:
+        """
+        :param backend: the JSON library, see `get_json_backend`
+        :type backend: str
+        :param max_bytes: the maximum length of the input values, in bytes
+        :type max_bytes: Optional[int]
+        :param max_depth: the maximum nesting level of the input values
+        :type max_depth: Optional[int]
+        :param max_keys: the maximum number of keys of the input values
+        :type max_keys: Optional[int]
+        :param lazy: whether the input objects and arrays are decoded on
+        access, see `lazy_json`: they're then decoded by the standard
+        library whatever the backend, which only dumps the output values
+        :type lazy: bool
+        :param validate_raw: whether the syntax of the `RawJSON` output
+        values is checked
+        :type validate_raw: bool
+        :raises ValueError: if the backend is unknown or isn't installed, or
+        if a limit is invalid
+        """
+        # the library is only imported once a value has to be coerced, the
+        # standard library (the default) doesn't have to be checked
+        if backend != "json":
+            _json_backend().check_json_backend(backend)
+        self._backend = backend
+        self._limits = None
+        if (max_bytes, max_depth, max_keys) != (None, None, None):
+            # pylint: disable=import-outside-toplevel
+            from tartiflette_plugin_scalars.json_limits import JSONLimits
+
+            self._limits = JSONLimits.from_options(
+                max_bytes, max_depth, max_keys
+            )
+        self._lazy = lazy
+        self._validate_raw = validate_raw
+
+    def parse_literal(self, ast: "ValueNode") -> Any:
         """
         Dumps the input value from an AST node
         :param ast: ast node to coerce
@@ -35,13 +98,14 @@ class JSON:
         """
         if isinstance(ast, StringValueNode):
             try:
-                return _parse_json(ast.value)
+                return _parse_json(
+                    ast.value, self._backend, self._limits, self._lazy
+                )
             except (ValueError, TypeError):
                 return UNDEFINED_VALUE
         return UNDEFINED_VALUE
 
-    @staticmethod
-    def coerce_input(value: str) -> Any:
+    def coerce_input(self, value: str) -> Any:
         """
         Dumps the input value
         :param value: the value to coerce
@@ -49,16 +113,37 @@ class JSON:
         :return: the value parsed from JSON
         :rtype: int
         :raises TypeError: if the value isn't a string
+        :raises ValueError: if the value isn't valid JSON or exceeds a limit
         """
-        return _parse_json(value)
+        return _parse_json(value, self._backend, self._limits, self._lazy)
 
-    @staticmethod
-    def coerce_output(value: Any) -> str:
+    def coerce_output(self, value: Any) -> str:
         """
         Loads the output value
         :param value: the value to coerce
         :type value: Any
         :return: the value dumped to JSON
         :rtype: str
+        :raises ValueError: if the value is `RawJSON` which isn't valid JSON,
+        when `validate_raw` is set
         """
-        return json.dumps(value)
+        json_backend = _json_backend()
+        if isinstance(value, json_backend.RawJSON):
+            # the libraries only accept exact strings
+            value = str(value)
+            if self._validate_raw:
+                try:
+                    json_backend.get_json_backend(self._backend).validate(
+                        value
+                    )
+                except ValueError as err:
+                    raise ValueError(
+                        f"Value is not a valid JSON value: < {value} >"
+                    ) from err
+            return value
+        if isinstance(value, json_backend.LazyJSON):
+            # a lazy proxy, e.g. a lazy input value returned as is
+            return value.raw
+        return json_backend.get_json_backend(self._backend).dumps(
+            value, default=json_backend.serialize_lazy_json
+        )
@@ -0,0 +1,292 @@
+import json
+
+from importlib.util import find_spec
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, Type
+
+# backends tried, in this order, by the "auto" backend before the standard
+# library
+_AUTO_BACKENDS = ("orjson", "ujson", "simdjson")
+
+# backends already loaded, by name
+_BACKENDS: Dict[str, "JSONBackend"] = {}
+
+
+class JSONBackend(NamedTuple):
+    """
+    Functions decoding and encoding JSON values with a JSON library
+    """
+
+    name: str
+    loads: Callable[[str], Any]
+    # takes the value and, as the `default` keyword argument, the function
+    # returning a serializable version of the objects it can't serialize
+    dumps: Callable[..., str]
+    # checks the syntax of a document, whatever it returns: the libraries
+    # decode it faster than the standard library only checks it
+    validate: Callable[[str], Any]
+
+
+def _loads_with_fallback(
+    loads: Callable[[str], Any],
+    errors: Tuple[Type[Exception], ...],
+    is_suspect: Optional[Callable[[str], bool]] = None,
+) -> Callable[[str], Any]:
+    def _loads(value: str) -> Any:
+        if is_suspect is None or not is_suspect(value):
+            try:
+                return loads(value)
+            except errors:
+                pass
+        # the standard library decides on the values rejected by the
+        # library: it accepts some of them (e.g. NaN, too deeply nested
+        # values) and raises its own error on the other ones. It also
+        # decodes the suspect values, which the library could accept while
+        # the standard library rejects them, or decode differently
+        return json.loads(value)
+
+    return _loads
+
+
+# the runs of digits of this length can be integers beyond 64 bits, which
+# orjson decodes as floats
+_LONG_DIGITS = b"0" * 19
+_DIGITS = bytes(
+    ord("0") if character in b"0123456789" else ord(" ")
+    for character in range(256)
+)
+
+
+def _has_long_integers(value: str) -> bool:
+    """
+    Tells whether a document could contain integers beyond 64 bits
+    :param value: the document
+    :type value: str
+    :return: whether the document contains a run of 19 digits or more
+    :rtype: bool
+    """
+    return _LONG_DIGITS in value.encode("utf-8", "surrogatepass").translate(
+        _DIGITS
+    )
+
+
+def _has_byte_order_mark(value: str) -> bool:
+    # which simdjson skips, while the standard library rejects it
+    return value.startswith("\ufeff")
+
+
+def _dumps_with_fallback(
+    dumps: Callable[..., str], errors: Tuple[Type[Exception], ...]
+) -> Callable[..., str]:
+    def _dumps(
+        value: Any, default: Optional[Callable[[Any], Any]] = None
+    ) -> str:
+        try:
+            return dumps(value, default=default)
+        except errors:
+            # e.g. keys other than strings, integers beyond 64 bits or NaN,
+            # which the standard library handles (or rejects)
+            return json.dumps(value, default=default)
+
+    return _dumps
+
+
+def _orjson_backend() -> JSONBackend:
+    # pylint: disable=import-outside-toplevel
+    import orjson
+
+    orjson_dumps = orjson.dumps
+    # datetimes, dataclasses and subclasses of the builtin types raise, for
+    # the standard library to handle (or reject) them as before
+    options = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+    def dumps(
+        value: Any, default: Optional[Callable[[Any], Any]] = None
+    ) -> str:
+        return orjson_dumps(value, default=default, option=options).decode()
+
+    loads = _loads_with_fallback(
+        orjson.loads, (ValueError,), _has_long_integers
+    )
+    return JSONBackend(
+        "orjson", loads, _dumps_with_fallback(dumps, (TypeError,)), loads
+    )
+
+
+def _ujson_backend() -> JSONBackend:
+    # pylint: disable=import-outside-toplevel
+    import ujson
+
+    def dumps(
+        value: Any, default: Optional[Callable[[Any], Any]] = None
+    ) -> str:
+        return ujson.dumps(
+            value, default=default, escape_forward_slashes=False
+        )
+
+    # ujson accepts invalid documents (e.g. `01`, `1.`, control characters
+    # in strings), and checking them costs more than it saves: the values
+    # are decoded by the standard library
+    return JSONBackend(
+        "ujson",
+        json.loads,
+        _dumps_with_fallback(dumps, (TypeError, OverflowError)),
+        validate_json,
+    )
+
+
+def _simdjson_backend() -> JSONBackend:
+    # pylint: disable=import-outside-toplevel
+    import simdjson
+
+    # integers beyond 64 bits raise a RuntimeError
+    loads = _loads_with_fallback(
+        simdjson.loads, (ValueError, RuntimeError), _has_byte_order_mark
+    )
+    return JSONBackend("simdjson", loads, simdjson.dumps, loads)
+
+
+def _json_backend() -> JSONBackend:
+    return JSONBackend("json", json.loads, json.dumps, validate_json)
+
+
+def _discard(_value: Any) -> None:
+    return None
+
+
+# decodes documents without building their objects and numbers: only their
+# arrays (of None values and strings) are built, until the enclosing object
+# is decoded
+_VALIDATOR = json.JSONDecoder(
+    object_pairs_hook=_discard,
+    parse_float=_discard,
+    parse_int=_discard,
+    parse_constant=_discard,
+)
+
+
+def validate_json(value: str) -> None:
+    """
+    Checks the syntax of a JSON document without materializing it, with the
+    standard library
+    :param value: the document
+    :type value: str
+    :raises ValueError: if the document isn't valid JSON
+    """
+    _VALIDATOR.decode(value)
+
+
+def skip_json_value(value: str, position: int) -> int:
+    """
+    Checks the syntax of the JSON value starting at a position of a
+    document, without materializing it
+    :param value: the document
+    :type value: str
+    :param position: the position of the first character of the value
+    :type position: int
+    :return: the position following the value
+    :rtype: int
+    :raises ValueError: if there isn't a valid JSON value at this position
+    """
+    return _VALIDATOR.raw_decode(value, position)[1]
+
+
+class RawJSON(str):
+    """
+    JSON text already serialized (e.g. by a database), which the JSON
+    scalars output as is instead of dumping it as a string:
+
+        return RawJSON(row["payload"])
+    """
+
+    __slots__ = ()
+
+
+class LazyJSON:
+    """
+    Base class of the lazy proxies of a decoded input value (see
+    `lazy_json`), which have the `raw` JSON text of their value and
+    `materialize` it
+    """
+
+    __slots__ = ()
+
+
+def serialize_lazy_json(value: Any) -> Any:
+    """
+    `default` function of the backends dumping the output values: the lazy
+    proxies of a decoded input value (see `lazy_json`), e.g. returned by a
+    resolver in a dict, are serialized from their decoded value
+    :param value: a value which the JSON library can't serialize
+    :type value: Any
+    :return: the decoded value of the proxy
+    :rtype: Any
+    :raises TypeError: if the value isn't a lazy proxy
+    """
+    if isinstance(value, LazyJSON):
+        return value.materialize()
+    raise TypeError(
+        f"Object of type {type(value).__name__} is not JSON serializable"
+    )
+
+
+_BACKEND_FACTORIES: Dict[str, Callable[[], JSONBackend]] = {
+    "orjson": _orjson_backend,
+    "ujson": _ujson_backend,
+    "simdjson": _simdjson_backend,
+    "json": _json_backend,
+}
+
+
+def check_json_backend(name: str) -> None:
+    """
+    Checks that a JSON backend exists and that its library is installed,
+    without importing it
+    :param name: the name of the backend, see `get_json_backend`
+    :type name: str
+    :raises ValueError: if the backend is unknown or its library isn't
+    installed
+    """
+    if name == "auto":
+        return
+    if name not in _BACKEND_FACTORIES:
+        raise ValueError(f"Unknown JSON backend: < {name} >")
+    if find_spec(name) is None:
+        raise ValueError(f"JSON backend isn't installed: < {name} >")
+
+
+def get_json_backend(name: str = "json") -> JSONBackend:
+    """
+    Returns a JSON backend, its library being imported on first use
+    :param name: "orjson", "ujson", "simdjson", "json" (the standard
+    library) or "auto", the first of these libraries which is installed
+    :type name: str
+    :return: the backend
+    :rtype: JSONBackend
+    :raises ValueError: if the backend is unknown or its library isn't
+    installed
+    """
+    backend = _BACKENDS.get(name)
+    if backend is not None:
+        return backend
+    if name == "auto":
+        for auto_name in _AUTO_BACKENDS:
+            factory = _BACKEND_FACTORIES[auto_name]
+            try:
+                backend = _BACKENDS[auto_name] = factory()
+                break
+            except ImportError:
+                continue
+        else:
+            backend = _BACKENDS["json"] = _json_backend()
+        _BACKENDS["auto"] = backend
+        return backend
+    check_json_backend(name)
+    try:
+        backend = _BACKENDS[name] = _BACKEND_FACTORIES[name]()
+    except ImportError as err:
+        raise ValueError(f"JSON backend isn't installed: < {name} >") from err
+    return backend
@@ -0,0 +1,289 @@
+import json
+
+from collections.abc import Mapping, Sequence
+from json.decoder import JSONDecodeError, scanstring
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from tartiflette_plugin_scalars.json_backend import LazyJSON, skip_json_value
+from tartiflette_plugin_scalars.lazy_pattern import LazyPattern
+
+_WHITESPACE = " \t\n\r"
+_WHITESPACE_REGEX = LazyPattern(r"""[ \t\n\r]*""")
+
+# decodes the value at a position of a document, without copying it
+_DECODER = json.JSONDecoder()
+
+
+def _skip_whitespace(value: str, position: int) -> int:
+    # most documents have at most one space between tokens, if any
+    if value[position : position + 1] in _WHITESPACE:
+        return _WHITESPACE_REGEX.compile().match(value, position).end()
+    return position
+
+
+def _index_object(
+    value: str, position: int
+) -> Tuple[Dict[str, Tuple[int, int]], int]:
+    """
+    Locates the members of an object, checking their syntax without
+    materializing their values
+    :param value: the document
+    :type value: str
+    :param position: the position of the "{" opening the object
+    :type position: int
+    :return: the start and end positions of the value of each key, and the
+    position following the object
+    :rtype: Tuple[Dict[str, Tuple[int, int]], int]
+    :raises JSONDecodeError: if the object isn't valid JSON
+    """
+    members = {}
+    position = _skip_whitespace(value, position + 1)
+    if value[position : position + 1] == "}":
+        return members, position + 1
+    while True:
+        if value[position : position + 1] != '"':
+            raise JSONDecodeError(
+                "Expecting property name enclosed in double quotes",
+                value,
+                position,
+            )
+        key, position = scanstring(value, position + 1)
+        position = _skip_whitespace(value, position)
+        if value[position : position + 1] != ":":
+            raise JSONDecodeError("Expecting ':' delimiter", value, position)
+        start = _skip_whitespace(value, position + 1)
+        position = skip_json_value(value, start)
+        # like for dicts, a repeated key keeps its place and its last value
+        members[key] = (start, position)
+        position = _skip_whitespace(value, position)
+        separator = value[position : position + 1]
+        if separator == "}":
+            return members, position + 1
+        if separator != ",":
+            raise JSONDecodeError("Expecting ',' delimiter", value, position)
+        position = _skip_whitespace(value, position + 1)
+
+
+def _index_array(
+    value: str, position: int
+) -> Tuple[List[Tuple[int, int]], int]:
+    """
+    Locates the items of an array, checking their syntax without
+    materializing them
+    :param value: the document
+    :type value: str
+    :param position: the position of the "[" opening the array
+    :type position: int
+    :return: the start and end positions of each item, and the position
+    following the array
+    :rtype: Tuple[List[Tuple[int, int]], int]
+    :raises JSONDecodeError: if the array isn't valid JSON
+    """
+    items = []
+    position = _skip_whitespace(value, position + 1)
+    if value[position : position + 1] == "]":
+        return items, position + 1
+    while True:
+        start = position
+        position = skip_json_value(value, start)
+        items.append((start, position))
+        position = _skip_whitespace(value, position)
+        separator = value[position : position + 1]
+        if separator == "]":
+            return items, position + 1
+        if separator != ",":
+            raise JSONDecodeError("Expecting ',' delimiter", value, position)
+        position = _skip_whitespace(value, position + 1)
+
+
+def _decode(value: str, start: int, end: int) -> Any:
+    character = value[start]
+    if character == "{":
+        return LazyJSONObject(value, start, end)
+    if character == "[":
+        return LazyJSONArray(value, start, end)
+    return _DECODER.raw_decode(value, start)[0]
+
+
+class LazyJSONObject(LazyJSON, Mapping):
+    """
+    Read-only mapping over a JSON object of a document: its members are
+    located on first access, and their values decoded once accessed
+    """
+
+    __slots__ = ("_document", "_start", "_end", "_members", "_values")
+
+    def __init__(
+        self,
+        document: str,
+        start: int,
+        end: int,
+        members: Optional[Dict[str, Tuple[int, int]]] = None,
+    ) -> None:
+        """
+        :param document: the JSON document, already validated
+        :type document: str
+        :param start: the position of the "{" opening the object
+        :type start: int
+        :param end: the position following the object
+        :type end: int
+        :param members: the positions of the values of the members, if
+        they are already located
+        :type members: Optional[Dict[str, Tuple[int, int]]]
+        """
+        self._document = document
+        self._start = start
+        self._end = end
+        self._members = members
+        self._values: Dict[str, Any] = {}
+
+    def _index(self) -> Dict[str, Tuple[int, int]]:
+        if self._members is None:
+            self._members = _index_object(self._document, self._start)[0]
+        return self._members
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            start, end = self._index()[key]
+            value = self._values[key] = _decode(self._document, start, end)
+            return value
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._index()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index())
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.raw!r})"
+
+    @property
+    def raw(self) -> str:
+        """
+        :return: the JSON text of the object, as it is in the document
+        :rtype: str
+        """
+        return self._document[self._start : self._end]
+
+    def materialize(self) -> dict:
+        """
+        :return: the object, fully decoded
+        :rtype: dict
+        """
+        return _DECODER.raw_decode(self._document, self._start)[0]
+
+
+class LazyJSONArray(LazyJSON, Sequence):
+    """
+    Read-only sequence over a JSON array of a document: its items are
+    located on first access, and decoded once accessed
+    """
+
+    __slots__ = ("_document", "_start", "_end", "_items", "_values")
+
+    def __init__(
+        self,
+        document: str,
+        start: int,
+        end: int,
+        items: Optional[List[Tuple[int, int]]] = None,
+    ) -> None:
+        """
+        :param document: the JSON document, already validated
+        :type document: str
+        :param start: the position of the "[" opening the array
+        :type start: int
+        :param end: the position following the array
+        :type end: int
+        :param items: the positions of the items, if they are already
+        located
+        :type items: Optional[List[Tuple[int, int]]]
+        """
+        self._document = document
+        self._start = start
+        self._end = end
+        self._items = items
+        self._values: Dict[int, Any] = {}
+
+    def _index(self) -> List[Tuple[int, int]]:
+        if self._items is None:
+            self._items = _index_array(self._document, self._start)[0]
+        return self._items
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self[item] for item in range(*index.indices(len(self)))]
+        items = self._index()
+        length = len(items)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("array index out of range")
+        try:
+            return self._values[index]
+        except KeyError:
+            start, end = items[index]
+            value = self._values[index] = _decode(self._document, start, end)
+            return value
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return len(self) == len(other) and all(
+                item == other_item for item, other_item in zip(self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.raw!r})"
+
+    @property
+    def raw(self) -> str:
+        """
+        :return: the JSON text of the array, as it is in the document
+        :rtype: str
+        """
+        return self._document[self._start : self._end]
+
+    def materialize(self) -> list:
+        """
+        :return: the array, fully decoded
+        :rtype: list
+        """
+        return _DECODER.raw_decode(self._document, self._start)[0]
+
+
+def lazy_json(value: str) -> Any:
+    """
+    Decodes a JSON document lazily: its syntax is checked and its top-level
+    members located without materializing them, objects and arrays being
+    returned as read-only proxies which decode their members on access
+    :param value: the document
+    :type value: str
+    :return: the `LazyJSONObject` or `LazyJSONArray` over the document, or
+    its value if it's a string, a number or a constant
+    :rtype: Any
+    :raises ValueError: if the document isn't valid JSON
+    """
+    start = _skip_whitespace(value, 0)
+    character = value[start : start + 1]
+    if character == "{":
+        members, end = _index_object(value, start)
+        result = LazyJSONObject(value, start, end, members)
+    elif character == "[":
+        items, end = _index_array(value, start)
+        result = LazyJSONArray(value, start, end, items)
+    else:
+        result, end = _DECODER.raw_decode(value, start)
+    if _skip_whitespace(value, end) != len(value):
+        raise JSONDecodeError("Extra data", value, end)
+    return result
@@ -0,0 +1,127 @@
+from typing import NamedTuple, Optional
+
+# every opening (closing) bracket is mapped to "[" ("]"), the characters other
+# than brackets, colons and quotes are deleted
+_BRACKETS = bytes.maketrans(b"{}", b"[]")
+_NON_STRUCTURAL = bytes(
+    character for character in range(256) if character not in b'[]{}:"'
+)
+
+
+def _structure(data: bytes) -> bytes:
+    """
+    Extracts the brackets and the colons of a JSON document which aren't
+    part of a string, with bytes operations only
+    :param data: the UTF-8 encoded document
+    :type data: bytes
+    :return: the brackets (all of them mapped to "[" and "]") and the colons
+    :rtype: bytes
+    """
+    if b"\\" in data:
+        # escaped backslashes first, then escaped quotes, the other escape
+        # sequences don't contain quotes
+        data = data.replace(b"\\\\", b"").replace(b'\\"', b"")
+    structure = data.translate(_BRACKETS, _NON_STRUCTURAL)
+    if b'"' in structure:
+        # strings without brackets or colons are pairs of adjacent quotes
+        structure = structure.replace(b'""', b"")
+        if b'"' in structure:
+            structure = b"".join(structure.split(b'"')[::2])
+    return structure
+
+
+def _is_deeper(brackets: bytes, max_depth: int) -> bool:
+    # each pass removes the innermost arrays and objects, the ones which
+    # don't contain any other one
+    for _ in range(max_depth):
+        if not brackets:
+            return False
+        inner = brackets.replace(b"[]", b"")
+        if len(inner) == len(brackets):
+            # unbalanced brackets, the decoder rejects the document
+            return False
+        brackets = inner
+    return b"[]" in brackets
+
+
+class JSONLimits(NamedTuple):
+    """
+    Limits of the size and the shape of the JSON documents accepted by the
+    JSON scalars, checked before decoding them
+    """
+
+    max_bytes: Optional[int] = None
+    max_depth: Optional[int] = None
+    max_keys: Optional[int] = None
+
+    @classmethod
+    def from_options(
+        cls,
+        max_bytes: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        max_keys: Optional[int] = None,
+    ) -> Optional["JSONLimits"]:
+        """
+        Builds the limits of a scalar from its options
+        :param max_bytes: the maximum length of a document, in UTF-8 bytes
+        :type max_bytes: Optional[int]
+        :param max_depth: the maximum nesting level of the arrays and the
+        objects of a document (1 for `[1, 2]`, 2 for `{"a": [1, 2]}`)
+        :type max_depth: Optional[int]
+        :param max_keys: the maximum number of keys of the objects of a
+        document, in total
+        :type max_keys: Optional[int]
+        :return: the limits, None if there isn't any
+        :rtype: Optional[JSONLimits]
+        :raises ValueError: if a limit isn't a non negative integer
+        """
+        limits = cls(max_bytes, max_depth, max_keys)
+        for option, limit in zip(cls._fields, limits):
+            if limit is not None and (
+                not isinstance(limit, int)
+                or isinstance(limit, bool)
+                or limit < 0
+            ):
+                raise ValueError(
+                    f"JSON limit isn't a non negative integer: < {option}={limit} >"
+                )
+        if limits == cls():
+            return None
+        return limits
+
+    def check(self, value: str) -> None:
+        """
+        Checks a JSON document against the limits, before decoding it
+        :param value: the document
+        :type value: str
+        :raises ValueError: if the document exceeds a limit
+        """
+        data = None
+        if self.max_bytes is not None:
+            # a character is encoded in one to four bytes, values are only
+            # encoded when their length doesn't tell
+            if len(value) > self.max_bytes:
+                raise ValueError(
+                    f"JSON value is larger than {self.max_bytes} bytes"
+                )
+            if len(value) * 4 > self.max_bytes:
+                data = value.encode("utf-8", "surrogatepass")
+                if len(data) > self.max_bytes:
+                    raise ValueError(
+                        f"JSON value is larger than {self.max_bytes} bytes"
+                    )
+        if self.max_depth is None and self.max_keys is None:
+            return
+
+        if data is None:
+            data = value.encode("utf-8", "surrogatepass")
+        structure = _structure(data)
+        # outside of strings, colons only separate keys from values
+        if self.max_keys is not None and structure.count(b":") > self.max_keys:
+            raise ValueError(f"JSON value has more than {self.max_keys} keys")
+        if self.max_depth is not None and _is_deeper(
+            structure.replace(b":", b""), self.max_depth
+        ):
+            raise ValueError(
+                f"JSON value is nested deeper than {self.max_depth} levels"
+            )
@@ -1,16 +1,53 @@
-import json
-
-from typing import Any  # pylint: disable=unused-import
+from typing import Optional, Union
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import StringValueNode
 
+from tartiflette_plugin_scalars.lazy_pattern import LazyPattern
+
+# the start of the JSON objects, and of the other JSON values, after the
+# whitespace the decoders skip
+_OBJECT_START_REGEX = LazyPattern(r"""\A[ \t\n\r]*\{""")
+_VALUE_START_REGEX = LazyPattern(r"""\A[ \t\n\r]*[\["0-9tfn-]""")
+
+
+def _json_backend() -> "ModuleType":
+    # the backends (and RawJSON) are only imported once a value has to be
+    # coerced
+    # pylint: disable=import-outside-toplevel
+    from tartiflette_plugin_scalars import json_backend
+
+    return json_backend
+
+
+def _not_an_object_error(value: str) -> ValueError:
+    # the values rejected without decoding them get the error the decoding
+    # would have raised: only the ones starting as another JSON value are
+    # reported as not being objects
+    if _VALUE_START_REGEX.search(value) is None:
+        return ValueError(f"Value is not a valid JSON value: < {value} >")
+    return ValueError(f"Value is not a valid JSON object: < {value} >")
 
-def _parse_json_object(value: str) -> Any:
+
+def _parse_json_object(
+    value: str,
+    backend: str,
+    limits: Optional["JSONLimits"],
+    materialize: bool,
+) -> Union[dict, str]:
     if isinstance(value, str):
+        # other JSON values are rejected without decoding them
+        if value[:1] != "{" and _OBJECT_START_REGEX.search(value) is None:
+            raise _not_an_object_error(value)
+        if limits is not None:
+            limits.check(value)
+        json_backend = _json_backend()
         try:
-            result = json.loads(value)
-        except json.decoder.JSONDecodeError as err:
+            if not materialize:
+                json_backend.validate_json(value)
+                return value
+            result = json_backend.get_json_backend(backend).loads(value)
+        except ValueError as err:
             raise ValueError(
                 f"Value is not a valid JSON value: < {value} >"
             ) from err
@@ -22,49 +59,116 @@ def _parse_json_object(value: str) -> Any:
     )
 
 
+def _check_raw_json_object(value: str, backend: str) -> None:
+    if value[:1] != "{" and _OBJECT_START_REGEX.search(value) is None:
+        raise _not_an_object_error(value)
+    try:
+        _json_backend().get_json_backend(backend).validate(value)
+    except ValueError as err:
+        raise ValueError(
+            f"Value is not a valid JSON value: < {value} >"
+        ) from err
+
+
 class JSONObject:
     """
     Scalar which handles JSON objects
     """
 
-    @staticmethod
-    def parse_literal(ast: "ValueNode") -> dict:
+    def __init__(
+        self,
+        backend: str = "json",
+        max_bytes: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        max_keys: Optional[int] = None,
+        materialize: bool = True,
+        validate_raw: bool = False,
+    ) -> None:
+        """
+        :param backend: the JSON library, see `get_json_backend`
+        :type backend: str
+        :param max_bytes: the maximum length of the input values, in bytes
+        :type max_bytes: Optional[int]
+        :param max_depth: the maximum nesting level of the input values
+        :type max_depth: Optional[int]
+        :param max_keys: the maximum number of keys of the input values
+        :type max_keys: Optional[int]
+        :param materialize: whether the input values are decoded, otherwise
+        their syntax is only checked and they are returned as is
+        :type materialize: bool
+        :param validate_raw: whether the `RawJSON` output values are checked
+        to be JSON objects
+        :type validate_raw: bool
+        :raises ValueError: if the backend is unknown or isn't installed, or
+        if a limit is invalid
+        """
+        # the library is only imported once a value has to be coerced, the
+        # standard library (the default) doesn't have to be checked
+        if backend != "json":
+            _json_backend().check_json_backend(backend)
+        self._backend = backend
+        self._limits = None
+        if (max_bytes, max_depth, max_keys) != (None, None, None):
+            # pylint: disable=import-outside-toplevel
+            from tartiflette_plugin_scalars.json_limits import JSONLimits
+
+            self._limits = JSONLimits.from_options(
+                max_bytes, max_depth, max_keys
+            )
+        self._materialize = materialize
+        self._validate_raw = validate_raw
+
+    def parse_literal(self, ast: "ValueNode") -> Union[dict, str]:
         """
         Loads the input value from an AST node
         :param ast: ast node to coerce
         :type ast: ValueNode
-        :return: the value parsed from JSON if it's an object, UNDEFINED_VALUE otherwise
-        :rtype: dict
+        :return: the value parsed from JSON (or as is, if it isn't materialized) if it's an object, UNDEFINED_VALUE otherwise
+        :rtype: Union[dict, str]
         """
         if isinstance(ast, StringValueNode):
             try:
-                return _parse_json_object(ast.value)
+                return _parse_json_object(
+                    ast.value, self._backend, self._limits, self._materialize
+                )
             except (ValueError, TypeError):
                 return UNDEFINED_VALUE
         return UNDEFINED_VALUE
 
-    @staticmethod
-    def coerce_input(value: str) -> dict:
+    def coerce_input(self, value: str) -> Union[dict, str]:
         """
         Loads the input value
         :param value: the value to coerce
         :type value: str
-        :return: the value parsed from JSON if it's an object
-        :rtype: dict
+        :return: the value parsed from JSON (or as is, if it isn't materialized) if it's an object
+        :rtype: Union[dict, str]
         :raises TypeError: if the value isn't a string
+        :raises ValueError: if the value isn't a JSON object or exceeds a limit
         """
-        return _parse_json_object(value)
+        return _parse_json_object(
+            value, self._backend, self._limits, self._materialize
+        )
 
-    @staticmethod
-    def coerce_output(value: dict) -> str:
+    def coerce_output(self, value: Union[dict, "RawJSON"]) -> str:
         """
         Dumps the output value
         :param value: the value to coerce
-        :type value: Any
+        :type value: Union[dict, RawJSON]
         :return: the value dumped to JSON
         :rtype: str
-        :raises TypeError: if the value isn't a dict
+        :raises TypeError: if the value isn't a dict or `RawJSON`
+        :raises ValueError: if the value is `RawJSON` which isn't a JSON
+        object, when `validate_raw` is set
         """
+        json_backend = _json_backend()
+        if isinstance(value, json_backend.RawJSON):
+            # the libraries only accept exact strings
+            value = str(value)
+            if self._validate_raw:
+                _check_raw_json_object(value, self._backend)
+            return value
         if isinstance(value, dict):
-            return json.dumps(value)
+            return json_backend.get_json_backend(self._backend).dumps(
+                value, default=json_backend.serialize_lazy_json
+            )
         raise TypeError(f"JSONObject cannot represent value: < {value} >")
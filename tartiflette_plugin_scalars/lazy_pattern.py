@@ -0,0 +1,69 @@
+import re
+
+from typing import Any, List, Optional, Pattern
+
+_LAZY_PATTERNS: List[Any] = []
+
+
+def register(lazy: Any) -> Any:
+    """
+    Registers an object compiled on first use, so that it is compiled by
+    `warmup`
+    :param lazy: an object with a `compile` method
+    :type lazy: Any
+    :return: the registered object
+    :rtype: Any
+    """
+    _LAZY_PATTERNS.append(lazy)
+    return lazy
+
+
+def warmup() -> None:
+    """
+    Eagerly compiles every registered pattern, for deployments which prefer
+    to pay the compilation cost up front rather than on first use
+    """
+    index = 0
+    # compiling can register new patterns, which are compiled as well
+    while index < len(_LAZY_PATTERNS):
+        _LAZY_PATTERNS[index].compile()
+        index += 1
+
+
+class LazyPattern:
+    """
+    Regular expression compiled on first use.
+
+    Once compiled, `search` is the `search` method of the compiled pattern
+    itself, so that using a lazy pattern doesn't cost more than using a
+    compiled one.
+    """
+
+    __slots__ = ("pattern", "flags", "search", "_compiled")
+
+    def __init__(self, pattern: str, flags: int = 0) -> None:
+        """
+        :param pattern: the regular expression
+        :type pattern: str
+        :param flags: the flags of the regular expression
+        :type flags: int
+        """
+        self.pattern = pattern
+        self.flags = flags
+        self.search = self._search
+        self._compiled: Optional[Pattern] = None
+        register(self)
+
+    def compile(self) -> Pattern:
+        """
+        Compiles the pattern if it isn't already
+        :return: the compiled pattern
+        :rtype: Pattern
+        """
+        if self._compiled is None:
+            self._compiled = re.compile(self.pattern, self.flags)
+            self.search = self._compiled.search
+        return self._compiled
+
+    def _search(self, string: str, *args: int) -> Optional[Any]:
+        return self.compile().search(string, *args)
@@ -1,19 +1,89 @@
-from datetime import datetime
-from typing import Union
+from datetime import datetime, timedelta
+from typing import Any, Iterable, List, Optional, Union
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import IntValueNode, StringValueNode
 
-from dateutil.parser import isoparse
+from tartiflette_plugin_scalars.iso_datetime import parse_iso_datetime
 
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UNITS = {"seconds": 1, "milliseconds": 1000}
 
-def _parse_naive(value: Union[int, str]) -> datetime:
+# range of the timestamps representable as datetimes (from 0001-01-01 to
+# 9999-12-31T23:59:59)
+_MIN_TIMESTAMP = -62135596800
+_MAX_TIMESTAMP = 253402300799
+
+# below 2^31 seconds, timestamps in milliseconds divided by 1000 are rounded
+# to the right microsecond by utcfromtimestamp
+_MAX_FLOAT_EXACT_MILLISECONDS = 2 ** 31 * 1000
+
+# NumPy is only worth importing for large lists of timestamps
+_NUMPY_MIN_VALUES = 64
+
+
+def _numpy() -> Optional[Any]:
+    # pylint: disable=import-outside-toplevel
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _from_timestamp(value: int, unit: int) -> datetime:
+    if unit == 1:
+        return datetime.utcfromtimestamp(value)
+    return _EPOCH + timedelta(milliseconds=value)
+
+
+def _from_timestamps(values: List[int], unit: int) -> List[datetime]:
+    """
+    Converts a list of timestamps to the same datetimes as
+    `_from_timestamp` does, at once
+    :param values: the timestamps
+    :type values: List[int]
+    :param unit: the number of timestamp units per second
+    :type unit: int
+    :return: the datetimes
+    :rtype: List[datetime]
+    :raises ValueError: if a timestamp is out of the range of datetimes
+    :raises OverflowError: if a timestamp is out of the range of datetimes
+    """
+    if not values:
+        return []
+    minimum, maximum = min(values), max(values)
+
+    numpy = _numpy() if len(values) >= _NUMPY_MIN_VALUES else None
+    if (
+        numpy is not None
+        and minimum >= _MIN_TIMESTAMP * unit
+        and maximum <= _MAX_TIMESTAMP * unit
+    ):
+        return (
+            numpy.array(values, dtype=numpy.int64)
+            .astype("datetime64[s]" if unit == 1 else "datetime64[ms]")
+            .tolist()
+        )
+
+    utcfromtimestamp = datetime.utcfromtimestamp
+    if unit == 1:
+        return list(map(utcfromtimestamp, values))
+    if (
+        -_MAX_FLOAT_EXACT_MILLISECONDS < minimum
+        and maximum < _MAX_FLOAT_EXACT_MILLISECONDS
+    ):
+        return [utcfromtimestamp(value / unit) for value in values]
+    return [_from_timestamp(value, unit) for value in values]
+
+
+def _parse_naive(value: Union[int, str], unit: int = 1) -> datetime:
     if isinstance(value, datetime):
         return value
     if isinstance(value, int) and not isinstance(value, bool):
-        return datetime.utcfromtimestamp(value)
+        return _from_timestamp(value, unit)
     if isinstance(value, str):
-        return isoparse(value)
+        return parse_iso_datetime(value)
     raise TypeError(
         f"NaiveDateTime cannot represent values other than strings and ints: < {value} >"
     )
@@ -24,8 +94,26 @@ class NaiveDateTime:
     Scalar which handles date and time objects
     """
 
-    @staticmethod
-    def parse_literal(ast: "ValueNode") -> Union[datetime, "UNDEFINED_VALUE"]:
+    def __init__(
+        self, epoch_unit: str = "seconds", trust_output_strings: bool = False
+    ) -> None:
+        """
+        :param epoch_unit: unit of the integer timestamps, "seconds" or "milliseconds"
+        :type epoch_unit: str
+        :param trust_output_strings: whether the strings returned by the resolvers are dumped without being checked
+        :type trust_output_strings: bool
+        :raises ValueError: if the unit is unknown
+        """
+        if epoch_unit not in _EPOCH_UNITS:
+            raise ValueError(
+                f"NaiveDateTime has an unknown epoch unit: < {epoch_unit} >"
+            )
+        self._unit = _EPOCH_UNITS[epoch_unit]
+        self._trust_output_strings = trust_output_strings
+
+    def parse_literal(
+        self, ast: "ValueNode"
+    ) -> Union[datetime, "UNDEFINED_VALUE"]:
         """
         Loads the input value from an AST node
         :param ast: ast node to coerce
@@ -35,13 +123,12 @@ class NaiveDateTime:
         """
         if isinstance(ast, (IntValueNode, StringValueNode)):
             try:
-                return _parse_naive(ast.value)
+                return _parse_naive(ast.value, self._unit)
             except (ValueError, TypeError, OverflowError):
                 return UNDEFINED_VALUE
         return UNDEFINED_VALUE
 
-    @staticmethod
-    def coerce_input(value: Union[str, int]) -> datetime:
+    def coerce_input(self, value: Union[str, int]) -> datetime:
         """
         Loads the input value
         :param value: the value to coerce
@@ -52,10 +139,27 @@ class NaiveDateTime:
         :raises ValueError: if the value isn't convertible to a datetime
         :raises OverflowError: if the value is an int too large to be a unix timestamp
         """
-        return _parse_naive(value)
+        return _parse_naive(value, self._unit)
 
-    @staticmethod
-    def coerce_output(value: datetime) -> str:
+    def coerce_input_many(self, values: Iterable[Any]) -> List[datetime]:
+        """
+        Loads a list of input values, lists of timestamps being converted
+        at once (with NumPy, if it's installed)
+        :param values: the values to coerce
+        :type values: Iterable[Any]
+        :return: the values as datetime objects if they can be parsed
+        :rtype: List[datetime]
+        :raises TypeError: if a value isn't a string or int
+        :raises ValueError: if a value isn't convertible to a datetime
+        :raises OverflowError: if a value is an int too large to be a unix timestamp
+        """
+        values = list(values)
+        if set(map(type, values)) == {int}:
+            return _from_timestamps(values, self._unit)
+        unit = self._unit
+        return [_parse_naive(value, unit) for value in values]
+
+    def coerce_output(self, value: datetime) -> str:
         """
         Dumps the output value
         :param value: the value to coerce
@@ -67,6 +171,8 @@ class NaiveDateTime:
         if isinstance(value, datetime):
             return value.isoformat()
         if isinstance(value, str):
+            if self._trust_output_strings:
+                return value
             try:
                 datetime.fromisoformat(value)
             except ValueError as err:
@@ -76,3 +182,21 @@ class NaiveDateTime:
             else:
                 return value
         raise TypeError(f"NaiveDateTime cannot represent value: < {value} >")
+
+    def coerce_output_many(self, values: Iterable[Any]) -> List[str]:
+        """
+        Dumps a list of output values
+        :param values: the values to coerce
+        :type values: Iterable[Any]
+        :return: the values as ISO 8601 strings
+        :rtype: List[str]
+        :raises TypeError: if a value isn't a datetime
+        """
+        # pylint: disable=unidiomatic-typecheck
+        coerce_output = self.coerce_output
+        return [
+            value.isoformat()
+            if type(value) is datetime
+            else coerce_output(value)
+            for value in values
+        ]
@@ -0,0 +1,270 @@
+import asyncio
+
+from concurrent.futures import Executor
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional
+
+# name of the directive through which tartiflette awaits the offloaded
+# coercions, applied to the definition of the offloaded scalars
+OFFLOAD_DIRECTIVE = "offloadCoercion"
+OFFLOAD_DIRECTIVE_SDL = (
+    f"directive @{OFFLOAD_DIRECTIVE}(scalar: String!) on SCALAR"
+)
+
+# the size of an output value is estimated from the first keys of its
+# objects and the first item of its arrays, visiting at most this number of
+# nested values
+_SAMPLED_KEYS = 8
+_ESTIMATE_BUDGET = 256
+
+# asyncio.get_running_loop is new in Python 3.7: on 3.6, get_event_loop
+# returns the running loop as well when it's called from a coroutine
+_get_running_loop = getattr(
+    asyncio, "get_running_loop", asyncio.get_event_loop
+)
+
+
+def _estimated_size(value: Any, budget: List[int]) -> int:
+    """
+    Estimates the length of the JSON text of a value without walking it:
+    the items of an array are expected to be alike, and so are the values
+    of an object when it has many keys
+    :param value: the value
+    :type value: Any
+    :param budget: the number of nested values which can still be visited
+    :type budget: List[int]
+    :return: the estimated length, in characters
+    :rtype: int
+    """
+    budget[0] -= 1
+    if isinstance(value, str):
+        return len(value) + 2
+    if budget[0] < 0:
+        return 8
+    if isinstance(value, dict):
+        if not value:
+            return 2
+        size = sum(
+            len(str(key)) + 4 + _estimated_size(item, budget)
+            for key, item in islice(value.items(), _SAMPLED_KEYS)
+        )
+        return size * len(value) // min(len(value), _SAMPLED_KEYS)
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return 2
+        return len(value) * (_estimated_size(value[0], budget) + 1)
+    return 8
+
+
+class _PendingInput:
+    """
+    Input value of an offloaded scalar, coerced once awaited by the offload
+    directive
+    """
+
+    __slots__ = ("scalar", "value")
+
+    def __init__(self, scalar: "OffloadedScalar", value: str) -> None:
+        self.scalar = scalar
+        self.value = value
+
+
+class _CoercedOutput:
+    """
+    Output value of an offloaded scalar, already coerced by the offload
+    directive
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+
+class OffloadedScalar:
+    """
+    Wraps a scalar implementation, coercing its large values in an executor
+    instead of on the event loop
+    """
+
+    def __init__(
+        self,
+        implementation: Any,
+        threshold: int,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        :param implementation: the scalar implementation to wrap
+        :type implementation: Any
+        :param threshold: the length, in characters, of the input strings
+        (or the estimated length of the JSON text of the output values) from
+        which values are coerced in the executor
+        :type threshold: int
+        :param executor: the executor, the default executor of the event
+        loop (a thread pool) if None
+        :type executor: Optional[Executor]
+        :raises ValueError: if the threshold isn't a non negative integer
+        """
+        if (
+            not isinstance(threshold, int)
+            or isinstance(threshold, bool)
+            or threshold < 0
+        ):
+            raise ValueError(
+                f"Offload threshold isn't a non negative integer: < {threshold} >"
+            )
+        self.implementation = implementation
+        self._threshold = threshold
+        self._executor = executor
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.implementation, name)
+
+    def is_large_input(self, value: Any) -> bool:
+        """
+        :param value: the value to coerce
+        :type value: Any
+        :return: whether the input value is coerced in the executor
+        :rtype: bool
+        """
+        return isinstance(value, str) and len(value) >= self._threshold
+
+    def is_large_output(self, value: Any) -> bool:
+        """
+        :param value: the value to coerce
+        :type value: Any
+        :return: whether the output value is coerced in the executor
+        :rtype: bool
+        """
+        return _estimated_size(value, [_ESTIMATE_BUDGET]) >= self._threshold
+
+    def coerce_input(self, value: Any) -> Any:
+        """
+        Loads the input value, or defers the coercion of a large value to
+        the offload directive
+        :param value: the value to coerce
+        :type value: Any
+        :return: the coerced value, or the pending coercion
+        :rtype: Any
+        """
+        if self.is_large_input(value):
+            return _PendingInput(self, value)
+        return self.implementation.coerce_input(value)
+
+    def coerce_output(self, value: Any) -> Any:
+        """
+        Dumps the output value, unless the offload directive already did
+        :param value: the value to coerce
+        :type value: Any
+        :return: the coerced value
+        :rtype: Any
+        """
+        if isinstance(value, _CoercedOutput):
+            return value.value
+        return self.implementation.coerce_output(value)
+
+    async def coerce_input_in_executor(self, value: Any) -> Any:
+        """
+        Loads the input value in the executor, whatever its size
+        :param value: the value to coerce
+        :type value: Any
+        :return: the coerced value
+        :rtype: Any
+        :raises TypeError: if the value has an invalid type
+        :raises ValueError: if the value is invalid
+        """
+        return await _get_running_loop().run_in_executor(
+            self._executor, self.implementation.coerce_input, value
+        )
+
+    async def coerce_output_in_executor(self, value: Any) -> Any:
+        """
+        Dumps the output value in the executor, whatever its size
+        :param value: the value to coerce
+        :type value: Any
+        :return: the coerced value
+        :rtype: Any
+        :raises TypeError: if the value has an invalid type
+        :raises ValueError: if the value is invalid
+        """
+        return await _get_running_loop().run_in_executor(
+            self._executor, self.implementation.coerce_output, value
+        )
+
+    async def coerce_input_async(self, value: Any) -> Any:
+        """
+        Loads the input value, in the executor if it's large
+        :param value: the value to coerce
+        :type value: Any
+        :return: the coerced value
+        :rtype: Any
+        :raises TypeError: if the value has an invalid type
+        :raises ValueError: if the value is invalid
+        """
+        if self.is_large_input(value):
+            return await self.coerce_input_in_executor(value)
+        return self.implementation.coerce_input(value)
+
+    async def coerce_output_async(self, value: Any) -> Any:
+        """
+        Dumps the output value, in the executor if it's large
+        :param value: the value to coerce
+        :type value: Any
+        :return: the coerced value
+        :rtype: Any
+        :raises TypeError: if the value has an invalid type
+        :raises ValueError: if the value is invalid
+        """
+        if self.is_large_output(value):
+            return await self.coerce_output_in_executor(value)
+        return self.implementation.coerce_output(value)
+
+
+class OffloadCoercion:
+    """
+    Implementation of the offload directive: it awaits the coercion of the
+    large input values deferred by the offloaded scalars, and coerces their
+    large output values before tartiflette calls `coerce_output`
+    """
+
+    def __init__(self, scalars: Dict[str, OffloadedScalar]) -> None:
+        """
+        :param scalars: the offloaded scalars of the schema, by name
+        :type scalars: Dict[str, OffloadedScalar]
+        """
+        self._scalars = scalars
+
+    async def on_post_input_coercion(
+        self,
+        directive_args: Dict[str, Any],
+        next_directive: Callable,
+        parent_node: "Node",
+        value: Any,
+        ctx: Optional[Any],
+    ) -> Any:
+        # pylint: disable=unused-argument
+        value = await next_directive(parent_node, value, ctx)
+        if isinstance(value, _PendingInput):
+            try:
+                return await value.scalar.coerce_input_async(value.value)
+            except (TypeError, ValueError) as err:
+                raise ValueError(
+                    f"Expected type < {directive_args['scalar']} >; {err}"
+                ) from err
+        return value
+
+    async def on_pre_output_coercion(
+        self,
+        directive_args: Dict[str, Any],
+        next_directive: Callable,
+        value: Any,
+        ctx: Optional[Any],
+        info: "ResolveInfo",
+    ) -> Any:
+        value = await next_directive(value, ctx, info)
+        scalar = self._scalars[directive_args["scalar"]]
+        if value is not None and scalar.is_large_output(value):
+            return _CoercedOutput(
+                await scalar.coerce_output_in_executor(value)
+            )
+        return value
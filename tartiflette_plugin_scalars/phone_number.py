@@ -1,11 +1,11 @@
-import re
-
 from typing import Union
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import StringValueNode
 
-_PHONE_NUMBER_REGEX = re.compile(r"""^\+\d{11,15}$""")
+from tartiflette_plugin_scalars.lazy_pattern import LazyPattern
+
+_PHONE_NUMBER_REGEX = LazyPattern(r"""^\+\d{11,15}$""")
 
 
 def _check_phone_number(value: str) -> str:
@@ -32,11 +32,12 @@ class PhoneNumber:
         :return: the value if it's a phone number, UNDEFINED_VALUE otherwise
         :rtype: Union[str, UNDEFINED_VALUE]
         """
-        if isinstance(ast, StringValueNode):
-            try:
-                return _check_phone_number(ast.value)
-            except (ValueError, TypeError):
-                return UNDEFINED_VALUE
+        if (
+            isinstance(ast, StringValueNode)
+            and isinstance(ast.value, str)
+            and _PHONE_NUMBER_REGEX.search(ast.value)
+        ):
+            return ast.value
         return UNDEFINED_VALUE
 
     @staticmethod
@@ -1,188 +1,467 @@
-import re
-
-from typing import Union
+from functools import lru_cache
+from typing import (  # pylint: disable=unused-import
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import StringValueNode
 
-_POSTAL_CODE_REGEXES = [  # source : https://gist.github.com/paulredmond/57bcae03e75ffc3256b7e6be100275d3
-    re.compile(
-        r"""GIR[ ]?0AA|((AB|AL|B|BA|BB|BD|BH|BL|BN|BR|BS|BT|CA|CB|CF|CH|CM|CO|CR|CT|CV|CW|DA|DD|DE|DG|DH|DL|DN|DT|DY|E|EC|EH|EN|EX|FK|FY|G|GL|GY|GU|HA|HD|HG|HP|HR|HS|HU|HX|IG|IM|IP|IV|JE|KA|KT|KW|KY|L|LA|LD|LE|LL|LN|LS|LU|M|ME|MK|ML|N|NE|NG|NN|NP|NR|NW|OL|OX|PA|PE|PH|PL|PO|PR|RG|RH|RM|S|SA|SE|SG|SK|SL|SM|SN|SO|SP|SR|SS|ST|SW|SY|TA|TD|TF|TN|TQ|TR|TS|TW|UB|W|WA|WC|WD|WF|WN|WR|WS|WV|YO|ZE)(\d[\dA-Z]?[ ]?\d[ABD-HJLN-UW-Z]{2}))|BFPO[ ]?\d{1,4}$"""
-    ),
-    re.compile(r"""^JE\d[\dA-Z]?[ ]?\d[ABD-HJLN-UW-Z]{2}$"""),
-    re.compile(r"""^GY\d[\dA-Z]?[ ]?\d[ABD-HJLN-UW-Z]{2}$"""),
-    re.compile(r"""^IM\d[\dA-Z]?[ ]?\d[ABD-HJLN-UW-Z]{2}$"""),
-    re.compile(r"""^\d{5}([ \-]\d{4})?$"""),
-    re.compile(
-        r"""^[ABCEGHJKLMNPRSTVXY]\d[ABCEGHJ-NPRSTV-Z][ ]?\d[ABCEGHJ-NPRSTV-Z]\d$"""
-    ),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{3}-\d{4}$"""),
-    re.compile(r"""^\d{2}[ ]?\d{3}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{4}[ ]?[A-Z]{2}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{3}[ ]?\d{2}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{5}[\-]?\d{3}$"""),
-    re.compile(r"""^\d{4}([\-]\d{3})?$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^22\d{3}$"""),
-    re.compile(r"""^\d{3}[\-]\d{3}$"""),
-    re.compile(r"""^\d{6}$"""),
-    re.compile(r"""^\d{3}(\d{2})?$"""),
-    re.compile(r"""^\d{6}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^AD\d{3}$"""),
-    re.compile(r"""^([A-HJ-NP-Z])?\d{4}([A-Z]{3})?$"""),
-    re.compile(r"""^(37)?\d{4}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^((1[0-2]|[2-9])\d{2})?$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^(BB\d{5})?$"""),
-    re.compile(r"""^\d{6}$"""),
-    re.compile(r"""^[A-Z]{2}[ ]?[A-Z0-9]{2}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^BBND 1ZZ$"""),
-    re.compile(r"""^[A-Z]{2}[ ]?\d{4}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{7}$"""),
-    re.compile(r"""^\d{4,5}|\d{3}-\d{4}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{3}[ ]?\d{2}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^([A-Z]\d{4}[A-Z]|(?:[A-Z]{2})?\d{6})?$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{3}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{3}[ ]?\d{2}$"""),
-    re.compile(r"""^39\d{2}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^(?:\d{5})?$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{3}$"""),
-    re.compile(r"""^\d{6}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{6}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^(\d{4}([ ]?\d{4})?)?$"""),
-    re.compile(r"""^(948[5-9])|(949[0-7])$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^[A-Z]{3}[ ]?\d{2,4}$"""),
-    re.compile(r"""^(\d{3}[A-Z]{2}\d{3})?$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^980\d{2}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^((\d{4}-)?\d{3}-\d{3}(-\d{1})?)?$"""),
-    re.compile(r"""^(\d{6})?$"""),
-    re.compile(r"""^(PC )?\d{3}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{2}-\d{3}$"""),
-    re.compile(r"""^00[679]\d{2}([ \-]\d{4})?$"""),
-    re.compile(r"""^\d{6}$"""),
-    re.compile(r"""^\d{6}$"""),
-    re.compile(r"""^4789\d$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{3}[ ]?\d{2}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{6}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{6}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{6}$"""),
-    re.compile(r"""^00120$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^96799$"""),
-    re.compile(r"""^6799$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{6}$"""),
-    re.compile(r"""^8\d{4}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^6798$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^FIQQ 1ZZ$"""),
-    re.compile(r"""^2899$"""),
-    re.compile(r"""^(9694[1-4])([ \-]\d{4})?$"""),
-    re.compile(r"""^9[78]3\d{2}$"""),
-    re.compile(r"""^\d{3}$"""),
-    re.compile(r"""^9[78][01]\d{2}$"""),
-    re.compile(r"""^SIQQ 1ZZ$"""),
-    re.compile(r"""^969[123]\d([ \-]\d{4})?$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^\d{6}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{3}$"""),
-    re.compile(r"""^\d{3}$"""),
-    re.compile(r"""^969[67]\d([ \-]\d{4})?$"""),
-    re.compile(r"""^\d{6}$"""),
-    re.compile(r"""^9695[012]([ \-]\d{4})?$"""),
-    re.compile(r"""^9[78]2\d{2}$"""),
-    re.compile(r"""^988\d{2}$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^008(([0-4]\d)|(5[01]))([ \-]\d{4})?$"""),
-    re.compile(r"""^987\d{2}$"""),
-    re.compile(r"""^\d{3}$"""),
-    re.compile(r"""^9[78]5\d{2}$"""),
-    re.compile(r"""^PCRN 1ZZ$"""),
-    re.compile(r"""^96940$"""),
-    re.compile(r"""^9[78]4\d{2}$"""),
-    re.compile(r"""^(ASCN|STHL) 1ZZ$"""),
-    re.compile(r"""^\d{4}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^[HLMS]\d{3}$"""),
-    re.compile(r"""^TKCA 1ZZ$"""),
-    re.compile(r"""^986\d{2}$"""),
-    re.compile(r"""^\d{5}$"""),
-    re.compile(r"""^976\d{2}$"""),
-]
-
-
-def _check_postal_code(value: str) -> str:
+from tartiflette_plugin_scalars.lazy_pattern import LazyPattern, register
+
+_DIGIT = "digit"
+_UPPER = "upper"
+_OTHER = "other"
+_CLASSES = (_DIGIT, _UPPER, _OTHER)
+
+_POSTAL_CODE_PATTERNS = {  # source : https://gist.github.com/paulredmond/57bcae03e75ffc3256b7e6be100275d3
+    "GB": r"""GIR[ ]?0AA|((AB|AL|B|BA|BB|BD|BH|BL|BN|BR|BS|BT|CA|CB|CF|CH|CM|CO|CR|CT|CV|CW|DA|DD|DE|DG|DH|DL|DN|DT|DY|E|EC|EH|EN|EX|FK|FY|G|GL|GY|GU|HA|HD|HG|HP|HR|HS|HU|HX|IG|IM|IP|IV|JE|KA|KT|KW|KY|L|LA|LD|LE|LL|LN|LS|LU|M|ME|MK|ML|N|NE|NG|NN|NP|NR|NW|OL|OX|PA|PE|PH|PL|PO|PR|RG|RH|RM|S|SA|SE|SG|SK|SL|SM|SN|SO|SP|SR|SS|ST|SW|SY|TA|TD|TF|TN|TQ|TR|TS|TW|UB|W|WA|WC|WD|WF|WN|WR|WS|WV|YO|ZE)(\d[\dA-Z]?[ ]?\d[ABD-HJLN-UW-Z]{2}))|BFPO[ ]?\d{1,4}$""",
+    "JE": r"""^JE\d[\dA-Z]?[ ]?\d[ABD-HJLN-UW-Z]{2}$""",
+    "GG": r"""^GY\d[\dA-Z]?[ ]?\d[ABD-HJLN-UW-Z]{2}$""",
+    "IM": r"""^IM\d[\dA-Z]?[ ]?\d[ABD-HJLN-UW-Z]{2}$""",
+    "US": r"""^\d{5}([ \-]\d{4})?$""",
+    "CA": r"""^[ABCEGHJKLMNPRSTVXY]\d[ABCEGHJ-NPRSTV-Z][ ]?\d[ABCEGHJ-NPRSTV-Z]\d$""",
+    "DE": r"""^\d{5}$""",
+    "JP": r"""^\d{3}-\d{4}$""",
+    "FR": r"""^\d{2}[ ]?\d{3}$""",
+    "AU": r"""^\d{4}$""",
+    "IT": r"""^\d{5}$""",
+    "CH": r"""^\d{4}$""",
+    "AT": r"""^\d{4}$""",
+    "ES": r"""^\d{5}$""",
+    "NL": r"""^\d{4}[ ]?[A-Z]{2}$""",
+    "BE": r"""^\d{4}$""",
+    "DK": r"""^\d{4}$""",
+    "SE": r"""^\d{3}[ ]?\d{2}$""",
+    "NO": r"""^\d{4}$""",
+    "BR": r"""^\d{5}[\-]?\d{3}$""",
+    "PT": r"""^\d{4}([\-]\d{3})?$""",
+    "FI": r"""^\d{5}$""",
+    "AX": r"""^22\d{3}$""",
+    "KR": r"""^\d{3}[\-]\d{3}$""",
+    "CN": r"""^\d{6}$""",
+    "TW": r"""^\d{3}(\d{2})?$""",
+    "SG": r"""^\d{6}$""",
+    "DZ": r"""^\d{5}$""",
+    "AD": r"""^AD\d{3}$""",
+    "AR": r"""^([A-HJ-NP-Z])?\d{4}([A-Z]{3})?$""",
+    "AM": r"""^(37)?\d{4}$""",
+    "AZ": r"""^\d{4}$""",
+    "BH": r"""^((1[0-2]|[2-9])\d{2})?$""",
+    "BD": r"""^\d{4}$""",
+    "BB": r"""^(BB\d{5})?$""",
+    "BY": r"""^\d{6}$""",
+    "BM": r"""^[A-Z]{2}[ ]?[A-Z0-9]{2}$""",
+    "BA": r"""^\d{5}$""",
+    "IO": r"""^BBND 1ZZ$""",
+    "BN": r"""^[A-Z]{2}[ ]?\d{4}$""",
+    "BG": r"""^\d{4}$""",
+    "KH": r"""^\d{5}$""",
+    "CV": r"""^\d{4}$""",
+    "CL": r"""^\d{7}$""",
+    "CR": r"""^\d{4,5}|\d{3}-\d{4}$""",
+    "HR": r"""^\d{5}$""",
+    "CY": r"""^\d{4}$""",
+    "CZ": r"""^\d{3}[ ]?\d{2}$""",
+    "DO": r"""^\d{5}$""",
+    "EC": r"""^([A-Z]\d{4}[A-Z]|(?:[A-Z]{2})?\d{6})?$""",
+    "EG": r"""^\d{5}$""",
+    "EE": r"""^\d{5}$""",
+    "FO": r"""^\d{3}$""",
+    "GE": r"""^\d{4}$""",
+    "GR": r"""^\d{3}[ ]?\d{2}$""",
+    "GL": r"""^39\d{2}$""",
+    "GT": r"""^\d{5}$""",
+    "HT": r"""^\d{4}$""",
+    "HN": r"""^(?:\d{5})?$""",
+    "HU": r"""^\d{4}$""",
+    "IS": r"""^\d{3}$""",
+    "IN": r"""^\d{6}$""",
+    "ID": r"""^\d{5}$""",
+    "IL": r"""^\d{5}$""",
+    "JO": r"""^\d{5}$""",
+    "KZ": r"""^\d{6}$""",
+    "KE": r"""^\d{5}$""",
+    "KW": r"""^\d{5}$""",
+    "LA": r"""^\d{5}$""",
+    "LV": r"""^\d{4}$""",
+    "LB": r"""^(\d{4}([ ]?\d{4})?)?$""",
+    "LI": r"""^(948[5-9])|(949[0-7])$""",
+    "LT": r"""^\d{5}$""",
+    "LU": r"""^\d{4}$""",
+    "MK": r"""^\d{4}$""",
+    "MY": r"""^\d{5}$""",
+    "MV": r"""^\d{5}$""",
+    "MT": r"""^[A-Z]{3}[ ]?\d{2,4}$""",
+    "MU": r"""^(\d{3}[A-Z]{2}\d{3})?$""",
+    "MX": r"""^\d{5}$""",
+    "MD": r"""^\d{4}$""",
+    "MC": r"""^980\d{2}$""",
+    "MA": r"""^\d{5}$""",
+    "NP": r"""^\d{5}$""",
+    "NZ": r"""^\d{4}$""",
+    "NI": r"""^((\d{4}-)?\d{3}-\d{3}(-\d{1})?)?$""",
+    "NG": r"""^(\d{6})?$""",
+    "OM": r"""^(PC )?\d{3}$""",
+    "PK": r"""^\d{5}$""",
+    "PY": r"""^\d{4}$""",
+    "PH": r"""^\d{4}$""",
+    "PL": r"""^\d{2}-\d{3}$""",
+    "PR": r"""^00[679]\d{2}([ \-]\d{4})?$""",
+    "RO": r"""^\d{6}$""",
+    "RU": r"""^\d{6}$""",
+    "SM": r"""^4789\d$""",
+    "SA": r"""^\d{5}$""",
+    "SN": r"""^\d{5}$""",
+    "SK": r"""^\d{3}[ ]?\d{2}$""",
+    "SI": r"""^\d{4}$""",
+    "ZA": r"""^\d{4}$""",
+    "LK": r"""^\d{5}$""",
+    "TJ": r"""^\d{6}$""",
+    "TH": r"""^\d{5}$""",
+    "TN": r"""^\d{4}$""",
+    "TR": r"""^\d{5}$""",
+    "TM": r"""^\d{6}$""",
+    "UA": r"""^\d{5}$""",
+    "UY": r"""^\d{5}$""",
+    "UZ": r"""^\d{6}$""",
+    "VA": r"""^00120$""",
+    "VE": r"""^\d{4}$""",
+    "ZM": r"""^\d{5}$""",
+    "AS": r"""^96799$""",
+    "CC": r"""^6799$""",
+    "CK": r"""^\d{4}$""",
+    "RS": r"""^\d{6}$""",
+    "ME": r"""^8\d{4}$""",
+    "CS": r"""^\d{5}$""",
+    "YU": r"""^\d{5}$""",
+    "CX": r"""^6798$""",
+    "ET": r"""^\d{4}$""",
+    "FK": r"""^FIQQ 1ZZ$""",
+    "NF": r"""^2899$""",
+    "FM": r"""^(9694[1-4])([ \-]\d{4})?$""",
+    "GF": r"""^9[78]3\d{2}$""",
+    "GN": r"""^\d{3}$""",
+    "GP": r"""^9[78][01]\d{2}$""",
+    "GS": r"""^SIQQ 1ZZ$""",
+    "GU": r"""^969[123]\d([ \-]\d{4})?$""",
+    "GW": r"""^\d{4}$""",
+    "HM": r"""^\d{4}$""",
+    "IQ": r"""^\d{5}$""",
+    "KG": r"""^\d{6}$""",
+    "LR": r"""^\d{4}$""",
+    "LS": r"""^\d{3}$""",
+    "MG": r"""^\d{3}$""",
+    "MH": r"""^969[67]\d([ \-]\d{4})?$""",
+    "MN": r"""^\d{6}$""",
+    "MP": r"""^9695[012]([ \-]\d{4})?$""",
+    "MQ": r"""^9[78]2\d{2}$""",
+    "NC": r"""^988\d{2}$""",
+    "NE": r"""^\d{4}$""",
+    "VI": r"""^008(([0-4]\d)|(5[01]))([ \-]\d{4})?$""",
+    "PF": r"""^987\d{2}$""",
+    "PG": r"""^\d{3}$""",
+    "PM": r"""^9[78]5\d{2}$""",
+    "PN": r"""^PCRN 1ZZ$""",
+    "PW": r"""^96940$""",
+    "RE": r"""^9[78]4\d{2}$""",
+    "SH": r"""^(ASCN|STHL) 1ZZ$""",
+    "SJ": r"""^\d{4}$""",
+    "SO": r"""^\d{5}$""",
+    "SZ": r"""^[HLMS]\d{3}$""",
+    "TC": r"""^TKCA 1ZZ$""",
+    "WF": r"""^986\d{2}$""",
+    "XK": r"""^\d{5}$""",
+    "YT": r"""^976\d{2}$""",
+}
+
+
+def _classify_char(char: str) -> str:
+    if char.isdecimal():
+        return _DIGIT
+    if "A" <= char <= "Z":
+        return _UPPER
+    return _OTHER
+
+
+def _split_alternatives(pattern: str) -> List[str]:
+    """
+    Splits a pattern on its top level "|" operators
+    :param pattern: the regular expression to split
+    :type pattern: str
+    :return: the top level alternatives of the pattern
+    :rtype: List[str]
+    """
+    alternatives = []
+    depth = 0
+    start = 0
+    index = 0
+    in_class = False
+    while index < len(pattern):
+        char = pattern[index]
+        if char == "\\":
+            index += 1
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+            if pattern[index + 1 : index + 2] == "^":
+                index += 1
+            if pattern[index + 1 : index + 2] == "]":
+                index += 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            alternatives.append(pattern[start:index])
+            start = index + 1
+        index += 1
+    alternatives.append(pattern[start:])
+    return alternatives
+
+
+def _analyze_alternative(
+    alternative: str,
+) -> Optional[Tuple[Set[str], int, Optional[int]]]:
+    """
+    Analyzes a top level alternative of a pattern with the parser of the re
+    module
+    :param alternative: the alternative
+    :type alternative: str
+    :return: the classes of the characters the values it matches can start
+    with, the minimum length of these values and their maximum length (None
+    if it's unbounded or if the alternative isn't anchored at the end), None
+    if the alternative isn't anchored at the start
+    :rtype: Optional[Tuple[Set[str], int, Optional[int]]]
+    """
+    # the parser of the re module isn't a public API: it's only used here,
+    # where it's imported as re._parser (Python 3.11+, which deprecates the
+    # sre_parse module) or sre_parse
+    # pylint: disable=import-outside-toplevel,too-many-branches
+    try:
+        from re import _constants as sre_constants, _parser as sre_parse
+    except ImportError:  # pragma: no cover
+        import sre_constants
+        import sre_parse
+
+    def first_classes(items) -> Set[str]:
+        # the classes of the characters the parsed pattern (or a part of it)
+        # can start with, every class if it can match an empty string
+        classes = set()
+        for opcode, argument in items:
+            if opcode == sre_constants.AT:
+                continue
+            if opcode == sre_constants.LITERAL:
+                return classes | {_classify_char(chr(argument))}
+            if opcode == sre_constants.IN:
+                for set_opcode, set_argument in argument:
+                    if set_opcode == sre_constants.LITERAL:
+                        classes.add(_classify_char(chr(set_argument)))
+                    elif set_opcode == sre_constants.RANGE:
+                        classes.update(
+                            _classify_char(chr(code))
+                            for code in range(
+                                set_argument[0], set_argument[1] + 1
+                            )
+                        )
+                    elif (
+                        set_opcode == sre_constants.CATEGORY
+                        and set_argument == sre_constants.CATEGORY_DIGIT
+                    ):
+                        classes.add(_DIGIT)
+                    else:
+                        return set(_CLASSES)
+                return classes
+            if opcode == sre_constants.SUBPATTERN:
+                sub_items = argument[-1]
+                classes |= first_classes(sub_items)
+                if sub_items.getwidth()[0] > 0:
+                    return classes
+            elif opcode in (
+                sre_constants.MAX_REPEAT,
+                sre_constants.MIN_REPEAT,
+            ):
+                classes |= first_classes(argument[2])
+                if argument[0] > 0 and argument[2].getwidth()[0] > 0:
+                    return classes
+            elif opcode == sre_constants.BRANCH:
+                for branch in argument[1]:
+                    classes |= first_classes(branch)
+                if min(branch.getwidth()[0] for branch in argument[1]) > 0:
+                    return classes
+            else:
+                return set(_CLASSES)
+        return set(_CLASSES)
+
+    items = sre_parse.parse(alternative)
+    if not items or items[0] != (sre_constants.AT, sre_constants.AT_BEGINNING):
+        return None
+    min_width, max_width = items.getwidth()
+    if (
+        items[-1] != (sre_constants.AT, sre_constants.AT_END)
+        or max_width >= sre_constants.MAXREPEAT - 1
+    ):
+        max_width = None
+    return first_classes(items), min_width, max_width
+
+
+def _merge_alternatives(
+    alternatives: List[str], merged: Dict[str, LazyPattern]
+) -> Optional[LazyPattern]:
+    if not alternatives:
+        return None
+    pattern = "|".join(
+        f"(?:{alternative})" for alternative in dict.fromkeys(alternatives)
+    )
+    if pattern not in merged:
+        merged[pattern] = LazyPattern(pattern)
+    return merged[pattern]
+
+
+class _PostalCodeIndex:
+    """
+    Matches a value against a list of postal code patterns.
+
+    Every top level alternative of the patterns is bucketed by the length of
+    the values it can match and by the class of their first character, and
+    the alternatives of a bucket are merged into a single regular expression.
+    A value is then only checked against the alternatives which could
+    possibly match it, through a single regular expression search.
+
+    Alternatives which aren't anchored at the start of the value can match
+    values of any length or first character, they are added to every bucket.
+    Alternatives anchored at the start only (or with an unbounded length)
+    match every value long enough, they are added to every bucket up to the
+    "overflow" length which is used for every longer value.
+
+    None of the patterns can consume a newline: a trailing one, which "$"
+    tolerates, isn't taken into account when computing the length of a value.
+
+    The index is built on first use, and the regular expression of a bucket
+    is only compiled once a value falls into it.
+    """
+
+    __slots__ = (
+        "search",
+        "_patterns",
+        "_buckets",
+        "_fallback",
+        "_overflow_length",
+    )
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self._patterns = tuple(patterns)
+        self._buckets: Optional[Dict[Tuple[int, str], LazyPattern]] = None
+        self._fallback: Optional[LazyPattern] = None
+        self._overflow_length = 0
+        self.search = self._build_and_search
+        register(self)
+
+    def compile(self) -> None:
+        """
+        Builds the index if it isn't already, and compiles its buckets
+        """
+        self.build()
+        for regex in (self._fallback, *self._buckets.values()):
+            if regex is not None:
+                regex.compile()
+
+    def build(self) -> None:
+        """
+        Builds the index if it isn't already, its buckets are compiled on
+        first use
+        """
+        # pylint: disable=too-many-locals
+        if self._buckets is not None:
+            return
+        anchored = []
+        unbounded = []
+        fallback = []
+        for pattern in self._patterns:
+            for alternative in _split_alternatives(pattern):
+                analysis = _analyze_alternative(alternative)
+                if analysis is None:
+                    fallback.append(alternative)
+                    continue
+                classes, min_width, max_width = analysis
+                if max_width is not None:
+                    anchored.append(
+                        (alternative, classes, min_width, max_width)
+                    )
+                else:
+                    unbounded.append((alternative, classes, min_width))
+
+        self._overflow_length = (
+            max((entry[3] for entry in anchored), default=0) + 1
+        )
+        buckets = {}
+        for alternative, classes, min_width, max_width in anchored:
+            for length in range(min_width, max_width + 1):
+                for char_class in classes:
+                    buckets.setdefault((length, char_class), []).append(
+                        alternative
+                    )
+        for alternative, classes, min_width in unbounded:
+            for length in range(min_width, self._overflow_length + 1):
+                for char_class in classes:
+                    buckets.setdefault((length, char_class), []).append(
+                        alternative
+                    )
+
+        merged = {}
+        self._fallback = _merge_alternatives(fallback, merged)
+        self._buckets = {
+            key: _merge_alternatives(alternatives + fallback, merged)
+            for key, alternatives in buckets.items()
+        }
+        self.search = self._search
+
+    def _build_and_search(self, value: str) -> bool:
+        self.build()
+        return self._search(value)
+
+    def _search(self, value: str) -> bool:
+        """
+        Checks whether the value matches one of the patterns
+        :param value: the value to check
+        :type value: str
+        :return: whether the value matches one of the patterns
+        :rtype: bool
+        """
+        if not value:
+            return False
+        length = len(value)
+        if value[-1:] == "\n":
+            length -= 1
+        regex = self._buckets.get(
+            (
+                min(length, self._overflow_length),
+                _classify_char(value[0]),
+            ),
+            self._fallback,
+        )
+        return regex is not None and regex.search(value) is not None
+
+
+@lru_cache(maxsize=None)
+def _get_postal_code_index(countries: Tuple[str, ...]) -> _PostalCodeIndex:
+    return _PostalCodeIndex(
+        _POSTAL_CODE_PATTERNS[country] for country in countries
+    )
+
+
+def _check_postal_code(value: str, index: _PostalCodeIndex) -> str:
     if not isinstance(value, str):
         raise TypeError(
             f"PostalCode cannot represent a non string value: < {value} >"
         )
-    match = False
-    if value != "":
-        for postal_code_regex in _POSTAL_CODE_REGEXES:
-            if postal_code_regex.search(value):
-                match = True
-                break
-    if not match:
+    if not index.search(value):
         raise ValueError(f"Value is not a valid postal code: < {value} >")
     return value
 
@@ -192,8 +471,24 @@ class PostalCode:
     Scalar which handles postal codes
     """
 
-    @staticmethod
-    def parse_literal(ast: "ValueNode") -> Union[str, "UNDEFINED_VALUE"]:
+    def __init__(self, countries: Optional[Iterable[str]] = None) -> None:
+        """
+        :param countries: ISO 3166-1 alpha-2 codes of the countries whose
+        postal codes are accepted, every known country if not provided
+        :type countries: Optional[Iterable[str]]
+        :raises ValueError: if a country has no known postal code format
+        """
+        if countries is None:
+            countries = _POSTAL_CODE_PATTERNS
+        countries = tuple(country.upper() for country in countries)
+        for country in countries:
+            if country not in _POSTAL_CODE_PATTERNS:
+                raise ValueError(
+                    f"PostalCode has no known format for country: < {country} >"
+                )
+        self._index = _get_postal_code_index(countries)
+
+    def parse_literal(self, ast: "ValueNode") -> Union[str, "UNDEFINED_VALUE"]:
         """
         Loads the input value from an AST node
         :param ast: ast node to coerce
@@ -201,15 +496,15 @@ class PostalCode:
         :return: the value if it's a postal code, UNDEFINED_VALUE otherwise
         :rtype: Union[str, UNDEFINED_VALUE]
         """
-        if isinstance(ast, StringValueNode):
-            try:
-                return _check_postal_code(ast.value)
-            except (ValueError, TypeError):
-                return UNDEFINED_VALUE
+        if (
+            isinstance(ast, StringValueNode)
+            and isinstance(ast.value, str)
+            and self._index.search(ast.value)
+        ):
+            return ast.value
         return UNDEFINED_VALUE
 
-    @staticmethod
-    def coerce_input(value: str) -> str:
+    def coerce_input(self, value: str) -> str:
         """
         Loads the input value
         :param value: the value to coerce
@@ -219,10 +514,9 @@ class PostalCode:
         :raises TypeError: if the value isn't a string
         :raises ValueError: if the value isn't a postal code
         """
-        return _check_postal_code(value)
+        return _check_postal_code(value, self._index)
 
-    @staticmethod
-    def coerce_output(value: str) -> str:
+    def coerce_output(self, value: str) -> str:
         """
         Dumps the output value
         :param value: the value to coerce
@@ -232,4 +526,4 @@ class PostalCode:
         :raises TypeError: if the value isn't a string
         :raises ValueError: if the value isn't a postal code
         """
-        return _check_postal_code(value)
+        return _check_postal_code(value, self._index)
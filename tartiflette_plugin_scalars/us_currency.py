@@ -3,6 +3,8 @@ from typing import Union  # pylint: disable=unused-import
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import StringValueNode
 
+from tartiflette_plugin_scalars.conversion import to_float
+
 
 def _parse_us_currency(value: str) -> int:
     if isinstance(value, str):
@@ -26,11 +28,10 @@ class USCurrency:
         :return: the value in cents if it can be parsed, UNDEFINED_VALUE otherwise
         :rtype: Union[int, UNDEFINED_VALUE]
         """
-        if isinstance(ast, StringValueNode):
-            try:
-                return _parse_us_currency(ast.value)
-            except (ValueError, TypeError):
-                return UNDEFINED_VALUE
+        if isinstance(ast, StringValueNode) and isinstance(ast.value, str):
+            value = to_float(ast.value[1:])
+            if value is not UNDEFINED_VALUE:
+                return value * 100
         return UNDEFINED_VALUE
 
     @staticmethod
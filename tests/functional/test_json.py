@@ -1,5 +1,7 @@
 import datetime
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from tartiflette import Resolver, create_engine
@@ -110,3 +112,130 @@ async def test_json_mutation_nok():
     assert (
         result["errors"][0]["message"] == "Value 1 is not of correct type JSON"
     )
+
+
+@pytest.mark.asyncio
+async def test_json_offloaded():
+    @Resolver("Mutation.json", schema_name="test_json_offloaded")
+    async def json_resolver(_parent, args, *_args, **_kwargs):
+        return {"input": args["input"], "items": args["items"]}
+
+    sdl = """
+    type Query {
+        json: JSON
+    }
+
+    type Mutation {
+        json(input: JSON, items: [JSON]): JSON
+    }
+    """
+
+    with ThreadPoolExecutor(1) as executor:
+        engine = await create_engine(
+            sdl=sdl,
+            modules=[
+                {
+                    "name": "tartiflette_plugin_scalars",
+                    "config": {
+                        "json": {
+                            "options": {
+                                "backend": "json",
+                                "offload_threshold": 16,
+                                "offload_executor": executor,
+                            }
+                        }
+                    },
+                }
+            ],
+            schema_name="test_json_offloaded",
+        )
+
+        query = "mutation json($input: JSON, $items: [JSON]) { json(input: $input, items: $items) }"
+        result = await engine.execute(
+            query,
+            variables={"input": '{"key": [1, 2, 3]}', "items": ["[1]", "[]"]},
+        )
+        assert result == {
+            "data": {
+                "json": '{"input": {"key": [1, 2, 3]}, "items": [[1], []]}'
+            }
+        }
+
+        result = await engine.execute(
+            query, variables={"input": '{"key": [1, 2, 3]', "items": None}
+        )
+        assert result["data"] is None
+        assert result["errors"][0]["message"] == (
+            "Expected type < JSON >; "
+            'Value is not a valid JSON value: < {"key": [1, 2, 3] >'
+        )
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.submitted = 0
+
+    def submit(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        self.submitted += 1
+        return super().submit(*args, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_json_offloaded_list_items():
+    @Resolver("Mutation.json", schema_name="test_json_offloaded_list_items")
+    async def json_resolver(_parent, args, *_args, **_kwargs):
+        return {"items": args["items"]}
+
+    sdl = """
+    type Query {
+        json: JSON
+    }
+
+    type Mutation {
+        json(items: [JSON]): JSON
+    }
+    """
+
+    with _CountingExecutor(1) as executor:
+        engine = await create_engine(
+            sdl=sdl,
+            modules=[
+                {
+                    "name": "tartiflette_plugin_scalars",
+                    "config": {
+                        "json": {
+                            "options": {
+                                "offload_threshold": 16,
+                                "offload_executor": executor,
+                            }
+                        }
+                    },
+                }
+            ],
+            schema_name="test_json_offloaded_list_items",
+        )
+
+        query = "mutation json($items: [JSON]) { json(items: $items) }"
+        result = await engine.execute(
+            query,
+            variables={
+                "items": ['{"key": [1, 2, 3]}', "[1]", '["a long string"]']
+            },
+        )
+        assert result == {
+            "data": {
+                "json": '{"items": [{"key": [1, 2, 3]}, [1], ["a long string"]]}'
+            }
+        }
+        # the two large items, then the output value
+        assert executor.submitted == 3
+
+        result = await engine.execute(
+            query, variables={"items": ["[1]", '{"key": [1, 2, 3]']}
+        )
+        assert result["data"] is None
+        assert result["errors"][0]["message"] == (
+            "Expected type < JSON >; "
+            'Value is not a valid JSON value: < {"key": [1, 2, 3] >'
+        )
@@ -115,3 +115,39 @@ async def test_postal_code_mutation_nok():
         result["errors"][0]["message"]
         == "Value nok is not of correct type PostalCode"
     )
+
+
+@pytest.mark.asyncio
+async def test_postal_code_countries_nok():
+    @Resolver("Query.postalCode", schema_name="test_postal_code_countries_nok")
+    async def postal_code_resolver(*_args, **_kwargs):
+        return "K1N 9N1"
+
+    sdl = """
+    type Query {
+        postalCode: PostalCode
+    }
+    """
+
+    engine = await create_engine(
+        sdl=sdl,
+        modules=[
+            {
+                "name": "tartiflette_plugin_scalars",
+                "config": {
+                    "postal_code": {
+                        "options": {"countries": ["FR", "DE", "GB"]}
+                    }
+                },
+            }
+        ],
+        schema_name="test_postal_code_countries_nok",
+    )
+
+    result = await engine.execute("query postalCodeNok { postalCode }")
+    assert result["data"]["postalCode"] is None
+    assert len(result["errors"]) == 1
+    assert (
+        result["errors"][0]["message"]
+        == "Value is not a valid postal code: < K1N 9N1 >"
+    )
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import pytest
 
 from tartiflette_plugin_scalars import _generate_scalars
@@ -235,7 +238,67 @@ from tartiflette_plugin_scalars import _generate_scalars
                 "scalar MyGeoJSON",
             ],
         ),
+        (
+            "sdl",
+            {
+                "sdl": """
+                type Query {
+                    createdAt: DateTime
+                    tags(first: PositiveInt): [String]
+                }
+                """
+            },
+            ["scalar DateTime", "scalar PositiveInt"],
+        ),
+        (
+            "sdl_renamed_and_enabled",
+            {
+                "sdl": "type Query { createdAt: MyDateTime, id: UUID }",
+                "datetime": {"name": "MyDateTime"},
+                "uuid": {"enabled": False},
+                "url": {"enabled": True},
+            },
+            ["scalar MyDateTime", "scalar URL"],
+        ),
     ],
 )
 def test_generate_scalars(schema_name, config, scalars):
     assert sorted(_generate_scalars(schema_name, config)) == sorted(scalars)
+
+
+def test_generate_scalars_defers_heavy_imports():
+    code = (
+        "import sys\n"
+        "from tartiflette_plugin_scalars import _generate_scalars\n"
+        "_generate_scalars('deferred_imports', {})\n"
+        "assert 'geojson' not in sys.modules\n"
+        "assert 'dateutil.parser' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_generate_scalars_sdl_skips_unused_modules():
+    code = (
+        "import sys\n"
+        "from tartiflette_plugin_scalars import _generate_scalars\n"
+        "_generate_scalars('sdl_imports', {'sdl': 'type Q { a: UUID }'})\n"
+        "assert 'tartiflette_plugin_scalars.uuid' in sys.modules\n"
+        "assert 'tartiflette_plugin_scalars.postal_code' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_generate_scalars_imports_offload_only_when_used():
+    code = (
+        "import sys\n"
+        "from tartiflette_plugin_scalars import _generate_scalars\n"
+        "_generate_scalars('offload_imports', {})\n"
+        "assert 'tartiflette_plugin_scalars.offload' not in sys.modules\n"
+        "assert 'tartiflette_plugin_scalars.cache' not in sys.modules\n"
+        "_generate_scalars(\n"
+        "    'offload_used',\n"
+        "    {'json': {'options': {'offload_threshold': 1024}}},\n"
+        ")\n"
+        "assert 'tartiflette_plugin_scalars.offload' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,100 @@
+import datetime
+import uuid
+
+import pytest
+
+from tartiflette_plugin_scalars.batch import coerce_list
+from tartiflette_plugin_scalars.cache import CachedScalar
+from tartiflette_plugin_scalars.datetime import DateTime
+from tartiflette_plugin_scalars.email_address import EmailAddress
+from tartiflette_plugin_scalars.naive_datetime import NaiveDateTime
+from tartiflette_plugin_scalars.positive_int import PositiveInt
+from tartiflette_plugin_scalars.postal_code import PostalCode
+from tartiflette_plugin_scalars.uuid import UUID
+
+
+@pytest.mark.parametrize(
+    "scalar,values",
+    [
+        (EmailAddress(), ["alice@example.com", "bob@example.org"]),
+        (PostalCode(), ["75017", "K1N 9N1", "SW1A 1AA"]),
+        (PostalCode(countries=["FR"]), ["75017", "75 017"]),
+        (PositiveInt(), [1, "2", 3.0]),
+        (NaiveDateTime(), ["2019-09-20T14:30:28", "2019-09-20T14:30:29"]),
+        (CachedScalar(PositiveInt(), 4), [1, 1, 2]),
+    ],
+)
+def test_coerce_list(scalar, values):
+    assert coerce_list(scalar, values) == [
+        scalar.coerce_output(value) for value in values
+    ]
+    assert coerce_list(scalar, values, output=False) == [
+        scalar.coerce_input(value) for value in values
+    ]
+
+
+@pytest.mark.parametrize(
+    "scalar,values",
+    [
+        (
+            DateTime(),
+            [
+                datetime.datetime(2019, 9, 9, tzinfo=datetime.timezone.utc),
+                "2019-09-20T14:30:28+00:00",
+            ],
+        ),
+        (UUID(), [uuid.UUID(int=1), uuid.UUID(int=2)]),
+    ],
+)
+def test_coerce_list_output(scalar, values):
+    assert coerce_list(scalar, values) == [
+        scalar.coerce_output(value) for value in values
+    ]
+
+
+@pytest.mark.parametrize(
+    "scalar,values,exception",
+    [
+        (EmailAddress(), ["alice@example.com", "nope"], ValueError),
+        (EmailAddress(), ["alice@example.com", 1], TypeError),
+        (PostalCode(countries=["FR"]), ["75017", "K1N 9N1"], ValueError),
+        (PostalCode(), ["75017", ""], ValueError),
+        (PositiveInt(), [1, -1], ValueError),
+        (DateTime(), ["2019-09-20T14:30:28+00:00", 1], TypeError),
+        (UUID(), [uuid.UUID(int=1), "nope"], TypeError),
+        (NaiveDateTime(), ["2019-09-20T14:30:28", "nope"], ValueError),
+    ],
+)
+def test_coerce_list_errors(scalar, values, exception):
+    with pytest.raises(exception):
+        coerce_list(scalar, values)
+
+
+def test_coerce_list_none():
+    scalar = EmailAddress()
+    assert coerce_list(scalar, None) is None
+    assert coerce_list(scalar, []) == []
+    assert coerce_list(
+        scalar, [None, "alice@example.com", None], output=False
+    ) == [None, "alice@example.com", None]
+    assert coerce_list(UUID(), (uuid.UUID(int=1), None)) == [
+        "00000000-0000-0000-0000-000000000001",
+        None,
+    ]
+    assert coerce_list(
+        NaiveDateTime(), [None, 1568988000, None], output=False
+    ) == [None, datetime.datetime(2019, 9, 20, 14), None]
+
+
+def test_coerce_list_batch_methods(monkeypatch):
+    scalar = NaiveDateTime()
+    calls = []
+    coerce_input_many = scalar.coerce_input_many
+
+    def recorded(values):
+        calls.append(values)
+        return coerce_input_many(values)
+
+    monkeypatch.setattr(scalar, "coerce_input_many", recorded)
+    coerce_list(scalar, [1568988000, None, 1568988060], output=False)
+    assert calls == [[1568988000, 1568988060]]
@@ -0,0 +1,168 @@
+import subprocess
+import sys
+
+import pytest
+
+from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.language.ast import (
+    BooleanValueNode,
+    FloatValueNode,
+    IntValueNode,
+    StringValueNode,
+)
+
+from tartiflette_plugin_scalars import _generate_scalars
+from tartiflette_plugin_scalars.bounded_number import BoundedNumber
+from tartiflette_plugin_scalars.long import Long
+from tartiflette_plugin_scalars.negative_float import NegativeFloat
+from tartiflette_plugin_scalars.port import Port
+
+
+def test_bounded_number_slots():
+    for scalar in (BoundedNumber("Int8"), Port()):
+        with pytest.raises(AttributeError):
+            scalar.unknown = 1
+
+
+@pytest.mark.parametrize(
+    "options,input_val,exception,message",
+    [
+        (
+            {"number_type": "float", "minimum": 0, "maximum": 100},
+            101,
+            ValueError,
+            "Percentage cannot represent values above 100: < 101.0 >",
+        ),
+        (
+            {"number_type": "float", "minimum": 0, "maximum": 100},
+            "-0.5",
+            ValueError,
+            "Percentage cannot represent values below 0: < -0.5 >",
+        ),
+        (
+            {"minimum": -128, "maximum": 127},
+            128,
+            ValueError,
+            "Percentage cannot represent values above 127: < 128 >",
+        ),
+        (
+            {"minimum": 0, "exclusive_minimum": True},
+            0,
+            ValueError,
+            "Percentage cannot represent values below or equal to 0: < 0 >",
+        ),
+        (
+            {"maximum": 2**16, "exclusive_maximum": True},
+            2**16,
+            ValueError,
+            "Percentage cannot represent values above or equal to 65536: < 65536 >",
+        ),
+        (
+            {"number_type": "float", "maximum": 1.5},
+            False,
+            TypeError,
+            "Percentage cannot represent values other than strings and numbers: < False >",
+        ),
+    ],
+)
+def test_bounded_number_coerce_input_nok(
+    options, input_val, exception, message
+):
+    with pytest.raises(exception) as excinfo:
+        BoundedNumber("Percentage", **options).coerce_input(input_val)
+    assert str(excinfo.value) == message
+
+
+@pytest.mark.parametrize(
+    "options,input_val,output_val",
+    [
+        ({"number_type": "float", "minimum": 0, "maximum": 100}, 100, 100.0),
+        ({"number_type": "float", "minimum": 0, "maximum": 100}, "0", 0.0),
+        ({"minimum": -128, "maximum": 127}, -128, -128),
+        ({"minimum": -128, "maximum": 127}, "12", 12),
+        ({"minimum": -128, "maximum": 127}, 12.7, 12),
+        ({}, 2**100, 2**100),
+    ],
+)
+def test_bounded_number_coerce_input_ok(options, input_val, output_val):
+    scalar = BoundedNumber("Int8", **options)
+    assert scalar.coerce_input(input_val) == output_val
+    assert scalar.coerce_output(input_val) == output_val
+
+
+@pytest.mark.parametrize(
+    "input_val,output_val",
+    [
+        (IntValueNode(value="127"), 127),
+        (IntValueNode(value="128"), UNDEFINED_VALUE),
+        (StringValueNode(value="-128"), -128),
+        (StringValueNode(value="-129"), UNDEFINED_VALUE),
+        (FloatValueNode(value="1.5"), UNDEFINED_VALUE),
+        (StringValueNode(value="bad_value"), UNDEFINED_VALUE),
+        (BooleanValueNode(value=True), UNDEFINED_VALUE),
+    ],
+)
+def test_bounded_number_parse_literal(input_val, output_val):
+    scalar = BoundedNumber("Int8", minimum=-128, maximum=127)
+    assert scalar.parse_literal(input_val) == output_val
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"number_type": "decimal"},
+        {"minimum": 0.5},
+        {"maximum": float("inf")},
+    ],
+)
+def test_bounded_number_invalid_options(options):
+    with pytest.raises(ValueError):
+        BoundedNumber("Invalid", **options)
+
+
+def test_bounded_number_nan():
+    # NaN isn't comparable to the bounds, as before the bounded numbers were
+    # generated it isn't rejected
+    assert NegativeFloat().coerce_input("nan") != 0.0
+
+
+def test_bounded_number_long_message():
+    with pytest.raises(ValueError) as excinfo:
+        Long().coerce_input(-(2**64))
+    assert str(excinfo.value) == (
+        "Long cannot represent values below -2^63: < -18446744073709551616 >"
+    )
+
+
+def test_generate_scalars_bounded_numbers():
+    scalars = _generate_scalars(
+        "bounded_numbers",
+        {
+            "sdl": "type Query { a: Percentage, b: Port }",
+            "bounded_numbers": {
+                "Percentage": {
+                    "options": {
+                        "number_type": "float",
+                        "minimum": 0,
+                        "maximum": 100,
+                    }
+                },
+                "Int8": {"options": {"minimum": -128, "maximum": 127}},
+            },
+        },
+    )
+    assert sorted(scalars) == ["scalar Percentage", "scalar Port"]
+
+
+def test_bounded_number_defers_conversion():
+    code = (
+        "import sys\n"
+        "from tartiflette.language.ast import IntValueNode\n"
+        "from tartiflette_plugin_scalars.port import Port\n"
+        "scalar = Port()\n"
+        "assert 'tartiflette_plugin_scalars.conversion' not in sys.modules\n"
+        "assert 'tartiflette_plugin_scalars.batch' not in sys.modules\n"
+        "assert scalar.parse_literal(IntValueNode(value='80')) == 80\n"
+        "assert 'tartiflette_plugin_scalars.conversion' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,124 @@
+import datetime
+
+import pytest
+
+from tartiflette_plugin_scalars import _generate_scalars, cache_info
+from tartiflette_plugin_scalars.cache import CachedScalar, CacheInfo, LRUCache
+from tartiflette_plugin_scalars.datetime import DateTime
+from tartiflette_plugin_scalars.json import JSON
+from tartiflette_plugin_scalars.positive_int import PositiveInt
+
+
+def test_lru_cache_hits_and_eviction():
+    calls = []
+
+    def function(value):
+        calls.append(value)
+        return value.upper()
+
+    cache = LRUCache(function, 2)
+    assert cache("a") == "A"
+    assert cache("b") == "B"
+    assert cache("a") == "A"
+    assert cache("c") == "C"
+    assert cache("b") == "B"
+    assert calls == ["a", "b", "c", "b"]
+    assert cache.cache_info() == CacheInfo(
+        hits=1, misses=4, maxsize=2, currsize=2
+    )
+    cache.cache_clear()
+    assert cache.cache_info() == CacheInfo(
+        hits=0, misses=0, maxsize=2, currsize=0
+    )
+
+
+def test_lru_cache_errors():
+    scalar = CachedScalar(PositiveInt(), 16)
+    with pytest.raises(ValueError) as first:
+        scalar.coerce_input(-1)
+    with pytest.raises(ValueError) as second:
+        scalar.coerce_input(-1)
+    assert str(first.value) == str(second.value)
+    assert scalar.cache_info()["coerce_input"].hits == 1
+
+
+def test_lru_cache_keys():
+    scalar = CachedScalar(PositiveInt(), 16)
+    assert scalar.coerce_output(1) == 1
+    with pytest.raises(TypeError):
+        scalar.coerce_output(True)
+    assert scalar.cache_info()["coerce_output"].misses == 2
+
+    cache = LRUCache(lambda value: value.isoformat(), 16)
+    utc = datetime.datetime(2019, 9, 9, 16, tzinfo=datetime.timezone.utc)
+    paris = utc.astimezone(datetime.timezone(datetime.timedelta(hours=2)))
+    assert utc == paris
+    assert cache(utc) == "2019-09-09T16:00:00+00:00"
+    assert cache(paris) == "2019-09-09T18:00:00+02:00"
+
+    cache = LRUCache(repr, 16)
+    assert cache(0.0) == "0.0"
+    assert cache(-0.0) == "-0.0"
+
+
+def test_lru_cache_mutable_results():
+    scalar = CachedScalar(JSON(), 16)
+    first = scalar.coerce_input('{"a": 1}')
+    first["a"] = 2
+    assert scalar.coerce_input('{"a": 1}') == {"a": 1}
+    assert scalar.cache_info()["coerce_input"] == CacheInfo(
+        hits=0, misses=2, maxsize=16, currsize=0
+    )
+    assert scalar.coerce_output({"a": 1}) == '{"a": 1}'
+
+
+def test_generate_scalars_cache_size():
+    _generate_scalars(
+        "cache_size",
+        {
+            "sdl": "type Query { a: URL, b: UUID }",
+            "url": {"options": {"cache_size": 8}},
+        },
+    )
+    assert cache_info("cache_size") == {
+        "URL": {
+            "coerce_input": CacheInfo(0, 0, 8, 0),
+            "coerce_output": CacheInfo(0, 0, 8, 0),
+        }
+    }
+
+
+def test_cache_info_hit_rate():
+    assert CacheInfo(0, 0, 8, 0).hit_rate == 0.0
+    assert CacheInfo(3, 1, 8, 1).hit_rate == 0.75
+
+
+def test_cached_scalar_methods():
+    scalar = CachedScalar(DateTime(), 8, ["coerce_output"])
+    value = datetime.datetime(2019, 9, 9, tzinfo=datetime.timezone.utc)
+    for _ in range(4):
+        assert scalar.coerce_output(value) == "2019-09-09T00:00:00+00:00"
+    assert scalar.coerce_input("2019-09-09T00:00:00Z") == value
+    assert scalar.cache_info() == {"coerce_output": CacheInfo(3, 1, 8, 1)}
+    assert scalar.cache_info()["coerce_output"].hit_rate == 0.75
+
+    with pytest.raises(ValueError):
+        CachedScalar(DateTime(), 8, ["parse_literal"])
+
+
+def test_generate_scalars_cache_methods():
+    _generate_scalars(
+        "cache_methods",
+        {
+            "sdl": "type Query { a: DateTime }",
+            "datetime": {
+                "options": {
+                    "cache_size": 8,
+                    "cache_methods": ["coerce_output"],
+                }
+            },
+        },
+    )
+    assert cache_info("cache_methods") == {
+        "DateTime": {"coerce_output": CacheInfo(0, 0, 8, 0)}
+    }
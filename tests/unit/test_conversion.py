@@ -0,0 +1,89 @@
+# 3RD PARTY
+import pytest
+
+# TARTIFLETTE
+from tartiflette.constants import UNDEFINED_VALUE
+
+from tartiflette_plugin_scalars.conversion import to_float, to_int
+
+_STRINGS = [
+    "",
+    " ",
+    "0",
+    "-12",
+    "+12",
+    " 12\n",
+    "1_000",
+    "1__000",
+    "_1",
+    "1_",
+    "٣",
+    "1.5",
+    ".5",
+    "5.",
+    ".",
+    "1e5",
+    "1E-5",
+    "1e",
+    "1_0.0_1e1_0",
+    "0x10",
+    "inf",
+    "-Infinity",
+    "NaN",
+    "infinit",
+    "1" * 5000,
+    "bad_value",
+]
+
+
+def _reference(function, value):
+    try:
+        return function(value)
+    except (TypeError, ValueError, OverflowError):
+        return UNDEFINED_VALUE
+
+
+@pytest.mark.parametrize("value", _STRINGS)
+def test_to_int_strings(value):
+    assert to_int(value) == _reference(int, value)
+
+
+@pytest.mark.parametrize("value", _STRINGS)
+def test_to_float_strings(value):
+    expected = _reference(float, value)
+    result = to_float(value)
+    if expected == expected:
+        assert result == expected
+    else:  # nan
+        assert result != result
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (12, 12),
+        (1.7, 1),
+        (float("inf"), UNDEFINED_VALUE),
+        (float("nan"), UNDEFINED_VALUE),
+        (True, UNDEFINED_VALUE),
+        (None, UNDEFINED_VALUE),
+        ([1], UNDEFINED_VALUE),
+    ],
+)
+def test_to_int_values(value, expected):
+    assert to_int(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (12, 12.0),
+        (1.5, 1.5),
+        (2 ** 1024, UNDEFINED_VALUE),
+        (False, UNDEFINED_VALUE),
+        (None, UNDEFINED_VALUE),
+        ({}, UNDEFINED_VALUE),
+    ],
+)
+def test_to_float_values(value, expected):
+    assert to_float(value) == expected
@@ -10,7 +10,7 @@ from tartiflette.language.ast import (
 )
 
 from dateutil.tz import tzutc
-from tartiflette_plugin_scalars.datetime import DateTime
+from tartiflette_plugin_scalars.datetime import DateTime, _is_canonical
 
 
 @pytest.mark.parametrize(
@@ -52,6 +52,10 @@ def test_coerce_input(input_val, exception, output_val):
         ),
         ("2018-08-16T00:00:00+00:00", "2018-08-16T00:00:00+00:00"),
         ("2021-07-06 12:56:57.322679", "2021-07-06T12:56:57.322679"),
+        ("2021-07-06T12:56:57Z", "2021-07-06T12:56:57+00:00"),
+        ("2021-07-06T12:56:57-00:00", "2021-07-06T12:56:57+00:00"),
+        ("2021-07-06T12:56:57.000000+01:00", "2021-07-06T12:56:57+01:00"),
+        ("2021-07-06T12:56:57.100+01:00", "2021-07-06T12:56:57.100000+01:00"),
     ],
 )
 def test_coerce_output(input_val, output_val):
@@ -59,6 +63,31 @@ def test_coerce_output(input_val, output_val):
     assert scalar.coerce_output(input_val) == output_val
 
 
+@pytest.mark.parametrize(
+    "input_val,canonical",
+    [
+        ("2021-07-06T12:56:57+00:00", True),
+        ("2021-07-06T12:56:57.322679-05:30", True),
+        ("2021-07-06T12:56:57", True),
+        ("2021-07-06T12:56:57Z", False),
+        ("2021-07-06T12:56:57-00:00", False),
+        ("2021-07-06T12:56:57.000000+00:00", False),
+        ("2021-07-06 12:56:57+00:00", False),
+        ("2021-02-30T12:56:57+00:00", False),
+    ],
+)
+def test_coerce_output_canonical(input_val, canonical):
+    assert _is_canonical(input_val) is canonical
+
+
+@pytest.mark.parametrize(
+    "input_val", ["2021-02-30T12:56:57+00:00", "2021-07-06T24:56:57+00:00"]
+)
+def test_coerce_output_nok(input_val):
+    with pytest.raises(ValueError):
+        DateTime().coerce_output(input_val)
+
+
 @pytest.mark.parametrize(
     "input_val,output_val",
     [
@@ -33,6 +33,17 @@ from tartiflette_plugin_scalars.duration import Duration
             timedelta(days=1, seconds=20),
         ),
         (StringValueNode(value="bad_value"), UNDEFINED_VALUE),
+        (StringValueNode(value=""), UNDEFINED_VALUE),
+        (StringValueNode(value="days=1=2"), UNDEFINED_VALUE),
+        (StringValueNode(value="days=1.5"), UNDEFINED_VALUE),
+        (StringValueNode(value="bad_key=1"), UNDEFINED_VALUE),
+        (StringValueNode(value="days=1000000000"), UNDEFINED_VALUE),
+        (StringValueNode(value="days=1, days=2"), timedelta(days=2)),
+        (StringValueNode(value=None), UNDEFINED_VALUE),
+        (StringValueNode(value="P1DT2H"), timedelta(days=1, hours=2)),
+        (StringValueNode(value="-PT0.5S"), timedelta(seconds=-0.5)),
+        (StringValueNode(value="P1Y"), UNDEFINED_VALUE),
+        (StringValueNode(value="P1000000000D"), UNDEFINED_VALUE),
     ],
 )
 def test_parse_literal(input_value, output_value):
@@ -52,6 +63,12 @@ def test_parse_literal(input_value, output_value):
         ("days=1 seconds=string", ValueError, None),
         (1.2345, TypeError, None),
         (123456, TypeError, None),
+        ("P", ValueError, None),
+        ("PT", ValueError, None),
+        ("P1DT", ValueError, None),
+        ("P1M", ValueError, None),
+        ("PT1.1234567S", ValueError, None),
+        ("days=1, hours=2,", ValueError, None),
         # GOOD VALUES
         ("days=1, seconds=2", None, timedelta(days=1, seconds=2)),
         ("hours=1, weeks=2", None, timedelta(weeks=2, hours=1)),
@@ -68,6 +85,16 @@ def test_parse_literal(input_value, output_value):
                 weeks=1,
             ),
         ),
+        (" days = -1 , hours=+2 ", None, timedelta(days=-1, hours=2)),
+        ("days=1_0", None, timedelta(days=10)),
+        ("days=1, days=2", None, timedelta(days=2)),
+        ("PT0S", None, timedelta(0)),
+        ("P2W", None, timedelta(weeks=2)),
+        ("P1DT2H3M4S", None, timedelta(days=1, hours=2, minutes=3, seconds=4)),
+        ("PT36H", None, timedelta(hours=36)),
+        ("PT1.5S", None, timedelta(seconds=1, microseconds=500000)),
+        ("PT0,000001S", None, timedelta(microseconds=1)),
+        ("-P1DT1M", None, -timedelta(days=1, minutes=1)),
     ],
 )
 def test_coerce_input(input_value, exception, output_value):
@@ -90,3 +117,48 @@ def test_coerce_input(input_value, exception, output_value):
 )
 def test_coerce_output(input_value, output_value):
     assert Duration().coerce_output(input_value) == output_value
+
+
+@pytest.mark.parametrize(
+    "input_value,output_value",
+    [
+        (timedelta(0), "PT0S"),
+        (timedelta(days=1), "P1D"),
+        (timedelta(seconds=5, microseconds=399774), "PT5.399774S"),
+        (timedelta(weeks=2, hours=3), "P14DT3H"),
+        (timedelta(hours=25, milliseconds=500), "P1DT1H0.5S"),
+        (timedelta(microseconds=-1), "-PT0.000001S"),
+        (-timedelta(days=2, minutes=5), "-P2DT5M"),
+    ],
+)
+def test_coerce_output_iso8601(input_value, output_value):
+    scalar = Duration(output_format="iso8601")
+    assert scalar.coerce_output(input_value) == output_value
+    assert scalar.coerce_input(output_value) == input_value
+
+
+@pytest.mark.parametrize(
+    "output_format,input_value,output_value",
+    [
+        ("str", timedelta(days=1, hours=2), "1 day, 2:00:00"),
+        ("milliseconds", timedelta(days=1, hours=2), 93600000),
+        ("milliseconds", timedelta(seconds=1, microseconds=999), 1000),
+        ("milliseconds", timedelta(microseconds=-1), -1),
+        ("seconds", timedelta(days=1, hours=2), 93600.0),
+        ("seconds", timedelta(milliseconds=-1500), -1.5),
+    ],
+)
+def test_coerce_output_formats(output_format, input_value, output_value):
+    result = Duration(output_format=output_format).coerce_output(input_value)
+    assert result == output_value
+    assert type(result) is type(output_value)
+
+
+def test_coerce_output_type_error():
+    with pytest.raises(TypeError):
+        Duration().coerce_output("P1D")
+
+
+def test_unknown_output_format():
+    with pytest.raises(ValueError):
+        Duration(output_format="bad")
@@ -0,0 +1,100 @@
+import json
+
+import pytest
+
+from tartiflette_plugin_scalars.geo_json import GeoJSON
+from tartiflette_plugin_scalars.geo_json_coordinates import (
+    Positions,
+    pack_coordinates,
+)
+
+_STORAGES = ["array", "numpy"]
+
+_DOCUMENTS = [
+    '{"type": "Point", "coordinates": [1.5, -2.25]}',
+    '{"type": "LineString", "coordinates": [[1.5, 2.0], [3.0, 4.25, 1.0]]}',
+    '{"type": "MultiPoint", "coordinates": [[1.5, 2.0, 0.5], [3.0, 4.0, 1.5]]}',
+    '{"type": "Polygon", "coordinates": [[[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], '
+    "[0.0, 0.0]], [[0.1, 0.1], [0.2, 0.1], [0.1, 0.1]]]}",
+    '{"type": "MultiPolygon", "coordinates": [[[[0.0, 0.0], [1.0, 0.0], '
+    "[0.0, 0.0]]], [[[5.0, 5.0], [6.0, 5.0], [5.0, 5.0]]]]}",
+    '{"type": "Feature", "properties": {"coordinates": [1, 2]}, '
+    '"geometry": {"type": "MultiLineString", "coordinates": [[], '
+    "[[1.0, 2.0], [3.0, 4.0]]]}}",
+    '{"type": "FeatureCollection", "features": [{"type": "Feature", '
+    '"properties": null, "geometry": {"type": "GeometryCollection", '
+    '"geometries": [{"type": "Point", "coordinates": [1.0, 2.0]}, '
+    '{"type": "LineString", "coordinates": []}]}}]}',
+    '{"type": "LineString", "coordinates": [1.0, 2.0]}',
+    '{"type": "Polygon", "coordinates": [[[0.0, [1.0]]]]}',
+]
+
+
+@pytest.fixture(params=_STORAGES)
+def storage(request):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    return request.param
+
+
+@pytest.mark.parametrize("document", _DOCUMENTS)
+def test_packed_coordinates_output(storage, document):
+    scalar = GeoJSON(coordinates=storage)
+    expected = GeoJSON().coerce_output(GeoJSON().coerce_input(document))
+    assert scalar.coerce_output(scalar.coerce_input(document)) == expected
+
+
+def test_pack_coordinates_array():
+    coordinates = [[[0.0, 0.0], [1.0, 0.0], [0.0, 0.0]], [[2.0, 2.0]] * 3]
+    first, second = pack_coordinates(coordinates, "Polygon", "array")
+    assert isinstance(first, Positions)
+    assert first == coordinates[0] and second == coordinates[1]
+    # the rings are views of the same buffer
+    assert first.memoryview.obj is second.memoryview.obj
+    assert first.memoryview.tolist() == [0.0, 0.0, 1.0, 0.0, 0.0, 0.0]
+    assert len(first) == 3 and first.dimension == 2
+    assert first[-1] == [0.0, 0.0] and first[1] == [1.0, 0.0]
+    assert first[1:] == [[1.0, 0.0], [0.0, 0.0]]
+    assert first[::2] == [[0.0, 0.0], [0.0, 0.0]]
+    assert first[3:1].tolist() == []
+    assert list(second) == [[2.0, 2.0]] * 3
+    with pytest.raises(IndexError):
+        first[3]
+
+
+def test_pack_coordinates_numpy():
+    numpy = pytest.importorskip("numpy")
+    coordinates = [[[0.0, 0.0, 1.0], [1.0, 0.0, 1.0]], [[2.0, 2.0, 2.0]]]
+    first, second = pack_coordinates(coordinates, "MultiLineString", "numpy")
+    assert first.shape == (2, 3) and second.shape == (1, 3)
+    assert first.base is second.base
+    assert numpy.array_equal(first, coordinates[0])
+
+
+@pytest.mark.parametrize(
+    "coordinates,geometry_type",
+    [
+        ([[0.0, 0.0], [1.0, 0.0, 2.0]], "LineString"),
+        ([0.0, 0.0], "LineString"),
+        ([[[0.0, 0.0]]], "Unknown"),
+        ([], "Polygon"),
+    ],
+)
+def test_pack_coordinates_unpacked(coordinates, geometry_type):
+    assert pack_coordinates(coordinates, geometry_type, "array") is coordinates
+
+
+def test_unknown_storage():
+    with pytest.raises(ValueError):
+        GeoJSON(coordinates="tuple")
+
+
+def test_packed_coordinates_integers(storage):
+    # coordinates are stored as doubles
+    value = GeoJSON(coordinates=storage).coerce_input(
+        '{"type": "LineString", "coordinates": [[1, 2], [3, 4]]}'
+    )
+    assert json.loads(GeoJSON().coerce_output(value)) == {
+        "type": "LineString",
+        "coordinates": [[1.0, 2.0], [3.0, 4.0]],
+    }
@@ -0,0 +1,259 @@
+import json
+
+import pytest
+
+from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.language.ast import StringValueNode
+
+from tartiflette_plugin_scalars.geo_json import GeoJSON
+from tartiflette_plugin_scalars.geo_json_decoding import (
+    GeoJSONDecoding,
+    round_coordinates,
+)
+
+_POLYGON = {
+    "type": "Polygon",
+    "coordinates": [
+        [[0.1234567, 0.0], [1.0, 0.0], [1.0, 1.0], [0.1234567, 0.0]]
+    ],
+}
+_FEATURE_COLLECTION = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "geometry": _POLYGON,
+            "properties": {"type": "park", "area": 0.1234567},
+        },
+        {"type": "Feature", "geometry": None, "properties": {}},
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "GeometryCollection",
+                "geometries": [
+                    {"type": "Point", "coordinates": [1.1234567, 2, 3.5]},
+                    {
+                        "type": "MultiLineString",
+                        "coordinates": [[[0, 0], [1, 1]]],
+                    },
+                ],
+            },
+            "properties": None,
+        },
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        _POLYGON,
+        _FEATURE_COLLECTION,
+        {"type": "MultiPoint", "coordinates": [], "bbox": [0, 0, 1, 1]},
+        {"type": "LineString", "coordinates": [[1, 2], [3, [4]]]},
+        {"type": "Point"},
+        {"type": "Unknown", "coordinates": [1.1234567]},
+        [1.1234567, {"type": "Point", "coordinates": [1.1234567, 2]}],
+    ],
+)
+def test_decoding_as_geojson(document):
+    # the geometries built by the object hook are those of geojson
+    document = json.dumps(document)
+    assert GeoJSON(precision=6).coerce_input(document) == (
+        GeoJSON().coerce_input(document)
+    )
+
+
+def test_precision():
+    scalar = GeoJSON(precision=2)
+    value = scalar.coerce_input(json.dumps(_FEATURE_COLLECTION))
+    features = value["features"]
+    assert features[0]["geometry"]["coordinates"][0][0] == [0.12, 0.0]
+    assert features[0]["properties"]["area"] == 0.1234567
+    assert features[2]["geometry"]["geometries"][0]["coordinates"] == [
+        1.12,
+        2,
+        3.5,
+    ]
+
+    output = json.loads(scalar.coerce_output(_FEATURE_COLLECTION))
+    assert output["features"][0]["geometry"]["coordinates"][0][0] == [
+        0.12,
+        0.0,
+    ]
+    assert output["features"][0]["properties"]["area"] == 0.1234567
+    # the output value isn't modified
+    assert _POLYGON["coordinates"][0][0] == [0.1234567, 0.0]
+    assert json.loads(GeoJSON().coerce_output(_POLYGON)) == _POLYGON
+
+
+@pytest.mark.parametrize("storage", ["array", "numpy"])
+def test_precision_packed(storage):
+    if storage == "numpy":
+        pytest.importorskip("numpy")
+    scalar = GeoJSON(coordinates=storage, precision=3, validate=True)
+    value = scalar.coerce_input(json.dumps(_POLYGON))
+    assert json.loads(scalar.coerce_output(value))["coordinates"][0] == [
+        [0.123, 0.0],
+        [1.0, 0.0],
+        [1.0, 1.0],
+        [0.123, 0.0],
+    ]
+    assert json.loads(GeoJSON(precision=1).coerce_output(value))[
+        "coordinates"
+    ][0][0] == [0.1, 0.0]
+
+
+def test_round_coordinates():
+    assert round_coordinates(
+        {"type": "Point", "coordinates": (1.25, 2.5, True)}, 1
+    ) == {"type": "Point", "coordinates": [1.2, 2.5, True]}
+    assert round_coordinates({"type": "Feature", "geometry": None}, 1) == {
+        "type": "Feature",
+        "geometry": None,
+    }
+    assert round_coordinates([1.25], 1) == [1.25]
+    assert round_coordinates({"type": "FeatureCollection"}, 1) == {
+        "type": "FeatureCollection"
+    }
+
+
+@pytest.mark.parametrize(
+    "document,message",
+    [
+        (
+            {"type": "Point", "coordinates": [1]},
+            "GeoJSON Point is invalid: "
+            "a position must have exactly 2 or 3 values",
+        ),
+        (
+            {"type": "Point"},
+            "GeoJSON Point is invalid: "
+            "a position must have exactly 2 or 3 values",
+        ),
+        (
+            {"type": "MultiPoint", "coordinates": [[1, 2, 3, 4]]},
+            "GeoJSON MultiPoint is invalid: "
+            "a position must have exactly 2 or 3 values",
+        ),
+        (
+            {"type": "LineString", "coordinates": [[1, 2]]},
+            "GeoJSON LineString is invalid: "
+            "a line must have at least 2 positions",
+        ),
+        (
+            {"type": "MultiLineString", "coordinates": [[1, 2], [3, 4]]},
+            "GeoJSON MultiLineString is invalid: "
+            "a position must have exactly 2 or 3 values",
+        ),
+        (
+            {"type": "MultiLineString", "coordinates": [1, 2]},
+            "GeoJSON MultiLineString is invalid: positions must be in a list",
+        ),
+        (
+            {"type": "LineString", "coordinates": [[1, "2"], [3, 4]]},
+            "GeoJSON LineString is invalid: coordinates must be numbers",
+        ),
+        (
+            {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [0, 0]]]},
+            "GeoJSON Polygon is invalid: "
+            "each linear ring must contain at least 4 positions",
+        ),
+        (
+            {
+                "type": "Polygon",
+                "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1]]],
+            },
+            "GeoJSON Polygon is invalid: "
+            "each linear ring must end where it started",
+        ),
+        (
+            {"type": "MultiPolygon", "coordinates": {"a": 1}},
+            "GeoJSON MultiPolygon is invalid: "
+            "the geometries must be in a list",
+        ),
+        ({"a": 1}, "Value isn't a GeoJSON object: < None >"),
+        ([1, 2], "Value isn't a GeoJSON object: < None >"),
+        (
+            {"type": "FeatureCollection", "features": [_POLYGON]},
+            "Value isn't a GeoJSON Feature: < Polygon >",
+        ),
+        (
+            {"type": "FeatureCollection", "features": {}},
+            "GeoJSON FeatureCollection has no list of features",
+        ),
+        (
+            {
+                "type": "GeometryCollection",
+                "geometries": [{"type": "Feature", "geometry": None}],
+            },
+            "Value isn't a GeoJSON geometry: < Feature >",
+        ),
+    ],
+)
+def test_validate_value_error(document, message):
+    document = json.dumps(document)
+    with pytest.raises(ValueError, match="^" + message):
+        GeoJSON(validate=True).coerce_input(document)
+    assert (
+        GeoJSON(validate=True).parse_literal(StringValueNode(value=document))
+        is UNDEFINED_VALUE
+    )
+
+
+def test_validate():
+    value = GeoJSON(validate=True).coerce_input(
+        json.dumps(_FEATURE_COLLECTION)
+    )
+    assert value == GeoJSON().coerce_input(json.dumps(_FEATURE_COLLECTION))
+    assert value.is_valid
+
+
+def test_allowed_types():
+    scalar = GeoJSON(allowed_types=["FeatureCollection", "Feature", "Polygon"])
+    assert scalar.coerce_input(json.dumps({"type": "Feature"})) == {
+        "type": "Feature",
+        "geometry": None,
+        "properties": {},
+    }
+    scalar.coerce_input(json.dumps(_FEATURE_COLLECTION["features"][0]))
+    with pytest.raises(
+        ValueError,
+        match=r"^GeoJSON type isn't allowed: < GeometryCollection >$",
+    ):
+        scalar.coerce_input(json.dumps(_FEATURE_COLLECTION))
+    with pytest.raises(
+        ValueError, match=r"^GeoJSON type isn't allowed: < None >$"
+    ):
+        scalar.coerce_input("[]")
+
+    assert GeoJSON(allowed_types="Point").coerce_input(
+        '{"type": "Point", "coordinates": [1, 2]}'
+    ) == {"type": "Point", "coordinates": [1, 2]}
+
+
+@pytest.mark.parametrize(
+    "options,message",
+    [
+        ({"precision": -1}, "GeoJSON precision isn't a non negative integer"),
+        ({"precision": 1.5}, "GeoJSON precision isn't a non negative integer"),
+        (
+            {"precision": True},
+            "GeoJSON precision isn't a non negative integer",
+        ),
+        (
+            {"allowed_types": ["Point", "Circle", "Curve"]},
+            r"Unknown GeoJSON type: < Circle, Curve >",
+        ),
+    ],
+)
+def test_invalid_options(options, message):
+    with pytest.raises(ValueError, match=message):
+        GeoJSON(**options)
+
+
+def test_from_options():
+    assert GeoJSONDecoding.from_options() is None
+    assert GeoJSONDecoding.from_options(
+        allowed_types=["Point"]
+    ) == GeoJSONDecoding(allowed_types=frozenset({"Point"}))
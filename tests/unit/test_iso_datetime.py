@@ -0,0 +1,84 @@
+import pytest
+
+from tartiflette.language.ast import StringValueNode
+
+from dateutil.parser import isoparse
+from tartiflette_plugin_scalars.datetime import DateTime
+from tartiflette_plugin_scalars.iso_datetime import (
+    _parse_common_layout,
+    parse_iso_datetime,
+)
+
+
+@pytest.mark.parametrize(
+    "value,common",
+    [
+        ("2019-09-09T16:42:07", True),
+        ("2019-09-09 16:42:07", True),
+        ("2019-09-09T16:42:07Z", True),
+        ("2019-09-09T16:42:07z", True),
+        ("2019-09-09T16:42:07.1Z", True),
+        ("2019-09-09T16:42:07.12345+01:00", True),
+        ("2019-09-09T16:42:07.123456-05:30", True),
+        ("2019-09-09T16:42:07+00:00", True),
+        ("2019-09-09T16:42:07-00:00", True),
+        ("2019-09-09T24:00:00Z", False),
+        ("2019-09-09T16:42:07.1234567Z", False),
+        ("2019-09-09T16:42:07,5Z", False),
+        ("2019-09-09T16:42:07+0100", False),
+        ("2019-09-09T16:42:07+01", False),
+        ("2019-09-09T16:42Z", False),
+        ("2019-09-09", False),
+        ("20190909T164207Z", False),
+        ("2019-W37-1T16:42:07Z", False),
+    ],
+)
+def test_parse_iso_datetime(value, common):
+    expected = isoparse(value)
+    result = parse_iso_datetime(value)
+    assert result == expected
+    assert result.tzinfo == expected.tzinfo
+    assert type(result.tzinfo) is type(expected.tzinfo)
+    assert (_parse_common_layout(value) is not None) is common
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "2019-13-09T16:42:07Z",
+        "2019-02-30T16:42:07Z",
+        "2019-09-09T25:42:07Z",
+        "2019-09-09T16:42:07+24:00",
+        "2019-09-09T16:42:07+01:60",
+        "٢٠١٩-09-09T16:42:07Z",
+        "2019-09-09T16:42:07Zbad",
+    ],
+)
+def test_parse_iso_datetime_nok(value):
+    with pytest.raises(ValueError):
+        isoparse(value)
+    with pytest.raises(ValueError):
+        parse_iso_datetime(value)
+
+
+def test_parse_iso_datetime_shares_tzinfo():
+    values = [
+        parse_iso_datetime("2019-09-09T16:42:07+02:00"),
+        parse_iso_datetime("2020-01-01 00:00:00.5+02:00"),
+        parse_iso_datetime("2019-09-09T16:42:07+0200"),
+        parse_iso_datetime("20190909T164207+02"),
+    ]
+    assert all(value.tzinfo is values[0].tzinfo for value in values)
+    assert (
+        parse_iso_datetime("2019-09-09T16:42:07Z").tzinfo
+        is parse_iso_datetime("20190909T164207-00:00").tzinfo
+    )
+
+
+def test_datetime_shares_tzinfo():
+    literal = DateTime.parse_literal(
+        StringValueNode(value="2019-09-09T16:42:07-07:00")
+    )
+    value = DateTime.coerce_input("2019-W37-1T16:42:07-0700")
+    assert literal.tzinfo is value.tzinfo
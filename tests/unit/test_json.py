@@ -1,9 +1,13 @@
+import subprocess
+import sys
+
 import pytest
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import DirectiveDefinitionNode, StringValueNode
 
 from tartiflette_plugin_scalars.json import JSON
+from tartiflette_plugin_scalars.json_backend import RawJSON
 
 
 @pytest.mark.parametrize(
@@ -60,3 +64,41 @@ def test_coerce_output(input_val, output_val):
 )
 def test_parse_literal(input_val, output_val):
     assert JSON().parse_literal(input_val) == output_val
+
+
+@pytest.mark.parametrize(
+    "input_val,exception",
+    [
+        ('{"key": [1, 2.5]}', None),
+        ("[1,2]", None),
+        ('"ok"', None),
+        (" null ", None),
+        ('{"key": }', ValueError),
+        ("ok", ValueError),
+        ("", ValueError),
+    ],
+)
+def test_coerce_output_raw(input_val, exception):
+    value = RawJSON(input_val)
+    output_val = JSON().coerce_output(value)
+    assert output_val == input_val and type(output_val) is str
+    scalar = JSON(validate_raw=True)
+    if exception:
+        with pytest.raises(exception):
+            scalar.coerce_output(value)
+    else:
+        assert scalar.coerce_output(value) == input_val
+
+
+def test_json_imports_backend_on_first_coercion():
+    code = (
+        "import sys\n"
+        "from tartiflette_plugin_scalars.json import JSON\n"
+        "from tartiflette_plugin_scalars.json_object import JSONObject\n"
+        "scalar = JSON()\n"
+        "JSONObject()\n"
+        "assert 'tartiflette_plugin_scalars.json_backend' not in sys.modules\n"
+        "assert scalar.coerce_output({'key': 1}) == '{\"key\": 1}'\n"
+        "assert 'tartiflette_plugin_scalars.json_backend' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
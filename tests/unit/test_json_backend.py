@@ -0,0 +1,142 @@
+import json
+import math
+
+from datetime import datetime
+
+import pytest
+
+from tartiflette_plugin_scalars import json_backend
+from tartiflette_plugin_scalars.json import JSON
+from tartiflette_plugin_scalars.json_backend import get_json_backend
+from tartiflette_plugin_scalars.json_object import JSONObject
+
+_BACKENDS = ["json", "orjson", "ujson", "simdjson"]
+
+
+@pytest.fixture(params=_BACKENDS)
+def backend(request):
+    if request.param != "json":
+        pytest.importorskip(request.param)
+    return get_json_backend(request.param)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        '{"key": "value", "list": [1, 2.5, true, null], "nested": {}}',
+        '"été"',
+        "18446744073709551615",
+        "-9223372036854775808",
+        "1e308",
+        " [] ",
+        "123456789012345678901234567890",
+        '{"id": -18446744073709551616}',
+    ],
+)
+def test_loads(backend, value):
+    result = backend.loads(value)
+    assert result == json.loads(value)
+    assert repr(result) == repr(json.loads(value))
+
+
+@pytest.mark.parametrize("value", ["NaN", "-Infinity", "1e400"])
+def test_loads_standard_library_extensions(backend, value):
+    result = backend.loads(value)
+    expected = json.loads(value)
+    assert result == expected or (math.isnan(result) and math.isnan(expected))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        "ok",
+        "[1, 2",
+        '{"a"}',
+        "[1,]",
+        # accepted by some of the libraries
+        "01",
+        "[-01]",
+        "1.",
+        "1.e5",
+        "-",
+        '"a\nb"',
+        '["a\x01"]',
+        "\ufeff[]",
+    ],
+)
+def test_loads_value_error(backend, value):
+    with pytest.raises(ValueError):
+        backend.loads(value)
+    with pytest.raises(ValueError):
+        backend.validate(value)
+
+
+@pytest.mark.parametrize("value", ['{"key": [1, 2.5, null]}', "NaN", " [] "])
+def test_validate(backend, value):
+    backend.validate(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"key": "value", "list": [1, 2.5, True, None], "nested": {}},
+        "été/",
+        2 ** 70,
+        {1: "int key"},
+    ],
+)
+def test_dumps(backend, value):
+    assert json.loads(backend.dumps(value)) == json.loads(json.dumps(value))
+
+
+@pytest.mark.parametrize("value", [datetime(2019, 9, 23), object(), {1, 2}])
+def test_dumps_type_error(backend, value):
+    with pytest.raises(TypeError):
+        backend.dumps(value)
+
+
+def test_scalars_backend(backend):
+    for scalar in (JSON(backend.name), JSONObject(backend.name)):
+        assert scalar.coerce_input('{"a": [1]}') == {"a": [1]}
+        assert json.loads(scalar.coerce_output({"a": [1]})) == {"a": [1]}
+        with pytest.raises(ValueError):
+            scalar.coerce_input("{")
+        with pytest.raises(TypeError):
+            scalar.coerce_input(1)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        get_json_backend("yaml")
+    with pytest.raises(ValueError):
+        JSON(backend="yaml")
+
+
+def test_auto_backend(monkeypatch):
+    def missing():
+        raise ImportError
+
+    monkeypatch.setattr(json_backend, "_BACKENDS", {})
+    monkeypatch.setattr(
+        json_backend,
+        "_BACKEND_FACTORIES",
+        {
+            **json_backend._BACKEND_FACTORIES,
+            "orjson": missing,
+            "ujson": missing,
+            "simdjson": missing,
+        },
+    )
+    assert get_json_backend("auto").name == "json"
+    with pytest.raises(ValueError):
+        get_json_backend("orjson")
+
+
+def test_default_backend():
+    # the faster libraries are only used when selected
+    assert get_json_backend().name == "json"
+    for scalar in (JSON(), JSONObject()):
+        assert scalar.coerce_output({"a": ["é", float("nan")]}) == (
+            '{"a": ["\\u00e9", NaN]}'
+        )
@@ -0,0 +1,150 @@
+import json
+
+import pytest
+
+from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.language.ast import StringValueNode
+
+from tartiflette_plugin_scalars.json import JSON
+from tartiflette_plugin_scalars.json_lazy import (
+    LazyJSON,
+    LazyJSONArray,
+    LazyJSONObject,
+    lazy_json,
+)
+from tartiflette_plugin_scalars.json_object import JSONObject
+
+_DOCUMENT = """
+{
+    "name": "bulk import",
+    "count": 3,
+    "items": [{"id": 1, "tags": ["a", "b"]}, {"id": 2}, {"id": 3.5}],
+    "options": {"dry_run": false, "mode": null},
+    "escaped \\"key\\"": "value with ] and }",
+    "name": "repeated"
+}
+"""
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        _DOCUMENT,
+        "[]",
+        " {} ",
+        "[1, [2, [3, {}]], -0.5e3]",
+        '"string"',
+        "12",
+        "NaN",
+        " null ",
+        '{"a": 1, "a": [2]}',
+    ],
+)
+def test_lazy_json(value):
+    result = lazy_json(value)
+    assert result == json.loads(value) or value == "NaN"
+    if isinstance(result, (LazyJSONObject, LazyJSONArray)):
+        assert result.materialize() == json.loads(value)
+        assert json.loads(result.raw) == json.loads(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "",
+        " ",
+        "{",
+        "[1, 2",
+        "[1,]",
+        '{"a": 1,}',
+        '{"a" 1}',
+        '{"a": 1 "b": 2}',
+        "{1: 2}",
+        "[1] 2",
+        '{"a": tru}',
+        '["\\x"]',
+        '["\n"]',
+    ],
+)
+def test_lazy_json_value_error(value):
+    with pytest.raises(ValueError):
+        json.loads(value)
+    with pytest.raises(ValueError):
+        lazy_json(value)
+
+
+def test_lazy_json_object():
+    result = lazy_json(_DOCUMENT)
+    assert isinstance(result, LazyJSONObject)
+    assert list(result) == [
+        "name",
+        "count",
+        "items",
+        "options",
+        'escaped "key"',
+    ]
+    assert len(result) == 5
+    assert result["name"] == "repeated"
+    assert "count" in result and "missing" not in result
+    assert result.get("missing") is None
+    with pytest.raises(KeyError):
+        result["missing"]
+
+    items = result["items"]
+    assert isinstance(items, LazyJSONArray)
+    # the members of nested values are only located once accessed
+    assert items._items is None
+    assert items[-1] == {"id": 3.5}
+    assert items[0]["tags"][1:] == ["b"]
+    assert items[0] is result["items"][0]
+    with pytest.raises(IndexError):
+        items[3]
+    with pytest.raises(IndexError):
+        items[-4]
+    assert items[-3] == {"id": 1, "tags": ["a", "b"]}
+    assert result["options"].raw == '{"dry_run": false, "mode": null}'
+    assert result["options"]._members is None
+
+
+def test_json_lazy_scalar():
+    scalar = JSON(lazy=True)
+    result = scalar.coerce_input(_DOCUMENT)
+    assert isinstance(result, LazyJSONObject)
+    assert isinstance(result["items"], LazyJSON)
+    assert result["items"][1]["id"] == 2
+    assert scalar.coerce_output(result["options"]) == (
+        '{"dry_run": false, "mode": null}'
+    )
+    assert scalar.coerce_input("[1, 2]") == [1, 2]
+    assert scalar.coerce_input("true") is True
+    assert scalar.parse_literal(StringValueNode(value="[1")) is UNDEFINED_VALUE
+    with pytest.raises(ValueError):
+        scalar.coerce_input('{"a": }')
+    with pytest.raises(TypeError):
+        scalar.coerce_input(1)
+
+
+def test_json_lazy_output_only_passes_proxies():
+    class Payload(dict):
+        pass
+
+    # only the proxies are output as their text, not every class of the
+    # json_lazy module
+    Payload.__module__ = "tartiflette_plugin_scalars.json_lazy"
+    assert JSON().coerce_output(Payload(key=1)) == '{"key": 1}'
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson", "ujson", "simdjson"])
+def test_nested_lazy_json_output(backend):
+    if backend != "json":
+        pytest.importorskip(backend)
+    result = lazy_json(_DOCUMENT)
+    output = {"items": result["items"], "options": [result["options"]]}
+    expected = {
+        "items": json.loads(_DOCUMENT)["items"],
+        "options": [{"dry_run": False, "mode": None}],
+    }
+    for scalar in (JSON(backend=backend), JSONObject(backend=backend)):
+        assert json.loads(scalar.coerce_output(output)) == expected
+        with pytest.raises(TypeError):
+            scalar.coerce_output({"items": [object()]})
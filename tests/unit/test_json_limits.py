@@ -0,0 +1,64 @@
+import pytest
+
+from tartiflette.constants import UNDEFINED_VALUE
+from tartiflette.language.ast import StringValueNode
+
+from tartiflette_plugin_scalars.json import JSON
+from tartiflette_plugin_scalars.json_limits import JSONLimits
+from tartiflette_plugin_scalars.json_object import JSONObject
+
+
+@pytest.mark.parametrize(
+    "limits,value,accepted",
+    [
+        ({"max_bytes": 8}, '"abcdef"', True),
+        ({"max_bytes": 7}, '"abcdef"', False),
+        ({"max_bytes": 7}, '"été"', True),
+        ({"max_bytes": 6}, '"été"', False),
+        ({"max_depth": 0}, "1", True),
+        ({"max_depth": 0}, "[]", False),
+        ({"max_depth": 2}, '{"a": [1, 2], "b": {}}', True),
+        ({"max_depth": 1}, '{"a": [1, 2], "b": {}}', False),
+        ({"max_depth": 2}, '[[[]], "[[[", "\\"[["]', False),
+        ({"max_depth": 3}, '[[[]], "[[[", "\\"[["]', True),
+        ({"max_depth": 1}, '["]]", "\\\\", "{{"]', True),
+        ({"max_keys": 3}, '{"a": {"b": 1, "c": ":"}}', True),
+        ({"max_keys": 2}, '{"a": {"b": 1, "c": ":"}}', False),
+        ({"max_keys": 1}, '{"a:b": "c:d", "e\\":": []}', False),
+        ({"max_keys": 2}, '{"a:b": "c:d", "e\\":": []}', True),
+        (
+            {"max_bytes": 100, "max_depth": 2, "max_keys": 2},
+            '{"a": [{"b": 1}]}',
+            False,
+        ),
+    ],
+)
+def test_check(limits, value, accepted):
+    if accepted:
+        JSONLimits.from_options(**limits).check(value)
+    else:
+        with pytest.raises(ValueError):
+            JSONLimits.from_options(**limits).check(value)
+
+
+def test_from_options():
+    assert JSONLimits.from_options() is None
+    assert JSONLimits.from_options(max_depth=3) == JSONLimits(max_depth=3)
+    for limits in ({"max_bytes": -1}, {"max_depth": 1.5}, {"max_keys": True}):
+        with pytest.raises(ValueError):
+            JSONLimits.from_options(**limits)
+
+
+@pytest.mark.parametrize("scalar_class", [JSON, JSONObject])
+def test_scalars_limits(scalar_class):
+    scalar = scalar_class(max_bytes=20, max_depth=1, max_keys=2)
+    assert scalar.coerce_input('{"a": 1, "b": 2}') == {"a": 1, "b": 2}
+    for value in ('{"a": 1, "b": 2, "c": 3}', '{"a": [1]}', " " * 21 + "{}"):
+        with pytest.raises(ValueError):
+            scalar.coerce_input(value)
+        assert (
+            scalar.parse_literal(StringValueNode(value=value))
+            is UNDEFINED_VALUE
+        )
+    with pytest.raises(TypeError):
+        scalar.coerce_input(1)
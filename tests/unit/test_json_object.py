@@ -3,6 +3,8 @@ import pytest
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import DirectiveDefinitionNode, StringValueNode
 
+from tartiflette_plugin_scalars import json_backend
+from tartiflette_plugin_scalars.json_backend import RawJSON
 from tartiflette_plugin_scalars.json_object import JSONObject
 
 
@@ -65,3 +67,79 @@ def test_coerce_output(input_val, exception, output_val):
 )
 def test_parse_literal(input_val, output_val):
     assert JSONObject().parse_literal(input_val) == output_val
+
+
+@pytest.mark.parametrize(
+    "input_val,message",
+    [
+        ("[1, 2, 3]", "not a valid JSON object"),
+        ('"{}"', "not a valid JSON object"),
+        (" \n 1", "not a valid JSON object"),
+        ("-1", "not a valid JSON object"),
+        ("null", "not a valid JSON object"),
+        ("true", "not a valid JSON object"),
+        ("", "not a valid JSON value"),
+        ("xyz", "not a valid JSON value"),
+        (" \n x", "not a valid JSON value"),
+        ("\ufeff{}", "not a valid JSON value"),
+    ],
+)
+def test_coerce_input_rejected_without_decoding(
+    monkeypatch, input_val, message
+):
+    def get_json_backend(_name):
+        raise AssertionError("the value shouldn't be decoded")
+
+    monkeypatch.setattr(json_backend, "get_json_backend", get_json_backend)
+    with pytest.raises(ValueError, match=message):
+        JSONObject().coerce_input(input_val)
+
+
+@pytest.mark.parametrize(
+    "input_val,exception",
+    [
+        ('{"key": [1, 2.5, "value", null, {"nested": NaN}]}', None),
+        (' \t\r\n{"key": "value"}\n', None),
+        ("{}", None),
+        ('{"key": }', ValueError),
+        ('{"key": "value"} []', ValueError),
+        ("[{}]", ValueError),
+        (1, TypeError),
+    ],
+)
+def test_coerce_input_not_materialized(input_val, exception):
+    scalar = JSONObject(materialize=False)
+    if exception:
+        with pytest.raises(exception):
+            scalar.coerce_input(input_val)
+        assert (
+            scalar.parse_literal(StringValueNode(value=input_val))
+            is UNDEFINED_VALUE
+        )
+    else:
+        assert scalar.coerce_input(input_val) is input_val
+        assert (
+            scalar.parse_literal(StringValueNode(value=input_val)) is input_val
+        )
+
+
+@pytest.mark.parametrize(
+    "input_val,exception",
+    [
+        ('{"key": [1, 2.5]}', None),
+        (' \n{"key":"value"}', None),
+        ("[{}]", ValueError),
+        ('"{}"', ValueError),
+        ('{"key": }', ValueError),
+        ("{} {}", ValueError),
+    ],
+)
+def test_coerce_output_raw(input_val, exception):
+    value = RawJSON(input_val)
+    assert JSONObject().coerce_output(value) == input_val
+    scalar = JSONObject(validate_raw=True)
+    if exception:
+        with pytest.raises(exception):
+            scalar.coerce_output(value)
+    else:
+        assert scalar.coerce_output(value) == input_val
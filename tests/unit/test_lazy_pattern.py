@@ -0,0 +1,27 @@
+from tartiflette_plugin_scalars import warmup
+from tartiflette_plugin_scalars.lazy_pattern import LazyPattern
+from tartiflette_plugin_scalars.postal_code import _PostalCodeIndex
+
+
+def test_lazy_pattern_compiled_on_first_use():
+    regex = LazyPattern(r"^\d{3}$")
+    assert regex._compiled is None
+    assert regex.search("123") is not None
+    assert regex._compiled is not None
+    assert regex.search == regex._compiled.search
+    assert regex.search("1234") is None
+
+
+def test_warmup():
+    regex = LazyPattern(r"^[a-z]+$")
+    index = _PostalCodeIndex([r"^\d{5}$", r"^\d{4}$"])
+    assert regex._compiled is None
+    assert index._buckets is None
+    warmup()
+    assert regex._compiled is not None
+    assert index._buckets is not None
+    assert all(
+        bucket._compiled is not None for bucket in index._buckets.values()
+    )
+    assert index.search("12345")
+    assert not index.search("123")
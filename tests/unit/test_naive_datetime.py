@@ -10,6 +10,7 @@ from tartiflette.language.ast import (
 )
 
 from dateutil.tz import tzutc
+from tartiflette_plugin_scalars import naive_datetime
 from tartiflette_plugin_scalars.naive_datetime import NaiveDateTime
 
 
@@ -78,3 +79,100 @@ def test_coerce_output(input_val, output_val):
 )
 def test_parse_literal(input_val, output_val):
     assert NaiveDateTime().parse_literal(input_val) == output_val
+
+
+@pytest.mark.parametrize(
+    "epoch_unit,input_val,output_val",
+    [
+        ("seconds", 1568988000, datetime.datetime(2019, 9, 20, 14, 0, 0)),
+        (
+            "milliseconds",
+            1568988000123,
+            datetime.datetime(2019, 9, 20, 14, 0, 0, 123000),
+        ),
+        (
+            "milliseconds",
+            -1,
+            datetime.datetime(1969, 12, 31, 23, 59, 59, 999000),
+        ),
+        (
+            "milliseconds",
+            253402300799999,
+            datetime.datetime(9999, 12, 31, 23, 59, 59, 999000),
+        ),
+    ],
+)
+def test_epoch_unit(epoch_unit, input_val, output_val):
+    scalar = NaiveDateTime(epoch_unit=epoch_unit)
+    assert scalar.coerce_input(input_val) == output_val
+    assert scalar.parse_literal(IntValueNode(value=input_val)) == output_val
+
+
+def test_epoch_unit_nok():
+    with pytest.raises(ValueError):
+        NaiveDateTime(epoch_unit="minutes")
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+@pytest.mark.parametrize("epoch_unit", ["seconds", "milliseconds"])
+@pytest.mark.parametrize(
+    "values",
+    [
+        [],
+        [1568988000],
+        list(range(-(10 ** 9), 10 ** 12, 10 ** 10)),
+        list(range(-62135596800000, 253402300799999, 10 ** 13)),
+    ],
+)
+def test_coerce_input_many_timestamps(monkeypatch, numpy, epoch_unit, values):
+    if not numpy:
+        monkeypatch.setattr(naive_datetime, "_numpy", lambda: None)
+    scalar = NaiveDateTime(epoch_unit=epoch_unit)
+    if epoch_unit == "seconds":
+        values = [value // 1000 for value in values]
+    results = scalar.coerce_input_many(values)
+    assert results == [scalar.coerce_input(value) for value in values]
+    assert all(type(result) is datetime.datetime for result in results)
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_coerce_input_many_timestamps_nok(monkeypatch, numpy):
+    if not numpy:
+        monkeypatch.setattr(naive_datetime, "_numpy", lambda: None)
+    with pytest.raises(OverflowError):
+        NaiveDateTime(epoch_unit="milliseconds").coerce_input_many(
+            list(range(100)) + [2 ** 70]
+        )
+    with pytest.raises((ValueError, OverflowError)):
+        NaiveDateTime().coerce_input_many(list(range(100)) + [2 ** 40])
+
+
+def test_coerce_input_many_mixed():
+    assert (
+        NaiveDateTime().coerce_input_many([1568988000, "2019-09-20T14:00:00"])
+        == [datetime.datetime(2019, 9, 20, 14, 0, 0)] * 2
+    )
+
+
+@pytest.mark.parametrize(
+    "input_val,output_val",
+    [
+        ("2019-09-20T14:30:28", "2019-09-20T14:30:28"),
+        ("not a date", "not a date"),
+        (
+            datetime.datetime(2019, 9, 20, 14, 30, 28),
+            "2019-09-20T14:30:28",
+        ),
+    ],
+)
+def test_coerce_output_trusted_strings(input_val, output_val):
+    scalar = NaiveDateTime(trust_output_strings=True)
+    assert scalar.coerce_output(input_val) == output_val
+    assert scalar.coerce_output_many([input_val]) == [output_val]
+
+
+def test_coerce_output_untrusted_strings():
+    with pytest.raises(ValueError):
+        NaiveDateTime().coerce_output_many(["2019-09-20T14:30:28", "nok"])
+    with pytest.raises(TypeError):
+        NaiveDateTime(trust_output_strings=True).coerce_output(12)
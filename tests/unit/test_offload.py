@@ -0,0 +1,160 @@
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from tartiflette_plugin_scalars import _generate_scalars
+from tartiflette_plugin_scalars.json import JSON
+from tartiflette_plugin_scalars.offload import (
+    OFFLOAD_DIRECTIVE_SDL,
+    OffloadCoercion,
+    OffloadedScalar,
+    _estimated_size,
+)
+
+
+class _ThreadRecorder:
+    def __init__(self, implementation):
+        self.implementation = implementation
+        self.threads = []
+
+    def coerce_input(self, value):
+        self.threads.append(threading.current_thread())
+        return self.implementation.coerce_input(value)
+
+    def coerce_output(self, value):
+        self.threads.append(threading.current_thread())
+        return self.implementation.coerce_output(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"key": "value", "list": [1, 2.5, True, None], "nested": {}},
+        [{"id": index, "name": f"item {index}"} for index in range(100)],
+        {str(index): [index] * 10 for index in range(50)},
+        [[[1.5, 2.5]] * 20] * 5,
+        "a" * 100,
+        [],
+        3.141592653589793,
+    ],
+)
+def test_estimated_size(value):
+    size = len(JSON(backend="json").coerce_output(value))
+    # within a factor of 4, the numbers being estimated to 8 characters
+    assert size / 4 <= _estimated_size(value, [256]) <= size * 4
+
+
+def test_estimated_size_budget():
+    value = [[index] for index in range(10)]
+    for _ in range(500):
+        value = {"a": value, "b": value}
+    assert _estimated_size(value, [256]) > 0
+
+
+def test_offloaded_scalar_threshold():
+    for threshold in (-1, 1.5, True, None):
+        with pytest.raises(ValueError):
+            OffloadedScalar(JSON(), threshold)
+
+
+@pytest.mark.asyncio
+async def test_offloaded_scalar_async():
+    recorder = _ThreadRecorder(JSON(backend="json"))
+    with ThreadPoolExecutor(1) as executor:
+        scalar = OffloadedScalar(recorder, 16, executor)
+        assert await scalar.coerce_input_async("[1, 2]") == [1, 2]
+        assert await scalar.coerce_input_async("[1, 2, 3, 4, 5, 6]") == [
+            1,
+            2,
+            3,
+            4,
+            5,
+            6,
+        ]
+        assert await scalar.coerce_output_async([1]) == "[1]"
+        assert await scalar.coerce_output_async(list(range(8))) == (
+            "[0, 1, 2, 3, 4, 5, 6, 7]"
+        )
+        with pytest.raises(ValueError):
+            await scalar.coerce_input_async("[1, 2, 3, 4, 5, 6")
+    main_thread = threading.current_thread()
+    assert [thread is main_thread for thread in recorder.threads] == [
+        True,
+        False,
+        True,
+        False,
+        False,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_offloaded_scalar_in_executor():
+    recorder = _ThreadRecorder(JSON(backend="json"))
+    with ThreadPoolExecutor(1) as executor:
+        scalar = OffloadedScalar(recorder, 1024, executor)
+        assert await scalar.coerce_input_in_executor("[1]") == [1]
+        assert await scalar.coerce_output_in_executor([1]) == "[1]"
+    main_thread = threading.current_thread()
+    assert [thread is main_thread for thread in recorder.threads] == [
+        False,
+        False,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_offload_coercion():
+    scalar = OffloadedScalar(JSON(backend="json"), 16)
+    directive = OffloadCoercion({"JSON": scalar})
+    arguments = {"scalar": "JSON"}
+
+    async def post_input(parent_node, value, ctx):
+        return value
+
+    async def pre_output(value, ctx, info):
+        return value
+
+    pending = scalar.coerce_input("[1, 2, 3, 4, 5, 6]")
+    assert await directive.on_post_input_coercion(
+        arguments, post_input, None, pending, None
+    ) == [1, 2, 3, 4, 5, 6]
+    assert scalar.coerce_input("[1]") == [1]
+    with pytest.raises(ValueError, match="Expected type < JSON >"):
+        await directive.on_post_input_coercion(
+            arguments,
+            post_input,
+            None,
+            scalar.coerce_input("[1, 2, 3, 4, 5, 6"),
+            None,
+        )
+
+    for value in (list(range(8)), [1], None):
+        result = await directive.on_pre_output_coercion(
+            arguments, pre_output, value, None, None
+        )
+        if value is None:
+            assert result is None
+        else:
+            assert scalar.coerce_output(result) == (
+                JSON(backend="json").coerce_output(value)
+            )
+
+
+def test_generate_scalars_offload():
+    scalars = _generate_scalars(
+        "offload",
+        {
+            "sdl": "type Query { a: JSON, b: GeoJSON, c: URL }",
+            "json": {"options": {"offload_threshold": 2 ** 20}},
+            "geo_json": {
+                "options": {"offload_threshold": 2 ** 20, "cache_size": 8}
+            },
+        },
+    )
+    assert scalars == [
+        "scalar URL",
+        'scalar JSON @offloadCoercion(scalar: "JSON")',
+        'scalar GeoJSON @offloadCoercion(scalar: "GeoJSON")',
+        OFFLOAD_DIRECTIVE_SDL,
+    ]
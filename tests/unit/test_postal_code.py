@@ -1,9 +1,15 @@
+import re
+
 import pytest
 
 from tartiflette.constants import UNDEFINED_VALUE
 from tartiflette.language.ast import DirectiveDefinitionNode, StringValueNode
 
-from tartiflette_plugin_scalars.postal_code import PostalCode
+from tartiflette_plugin_scalars.postal_code import (
+    _POSTAL_CODE_PATTERNS,
+    PostalCode,
+    _PostalCodeIndex,
+)
 
 
 @pytest.mark.parametrize(
@@ -46,3 +52,71 @@ def test_coerce_input_output(input_val, exception, output_val):
 )
 def test_parse_literal_email_address(input_val, output_val):
     assert PostalCode().parse_literal(input_val) == output_val
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "75017",
+        "75017\n",
+        "\n",
+        "K1N 9N1",
+        "SW1A 1AA",
+        "GIR 0AA",
+        "xxGIR0AAxx",
+        "BFPO 12",
+        "1234abcdef",
+        "9485",
+        "99999-123",
+        "BBND 1ZZ",
+        "\u0667\u0665\u0660\u0661\u0667",
+        "nope",
+        "K1N-9N1",
+        "ABCDEFGH",
+        "#75017",
+        "1" * 20,
+    ],
+)
+def test_postal_code_index_matches_linear_scan(value):
+    regexes = [
+        re.compile(pattern) for pattern in _POSTAL_CODE_PATTERNS.values()
+    ]
+    assert _PostalCodeIndex(_POSTAL_CODE_PATTERNS.values()).search(
+        value
+    ) == any(regex.search(value) for regex in regexes)
+
+
+@pytest.mark.parametrize(
+    "countries,input_val,exception",
+    [
+        (["FR", "DE", "GB"], "75017", None),
+        (["fr"], "75 017", None),
+        (["GB"], "SW1A 1AA", None),
+        (["FR", "DE", "GB"], "K1N 9N1", ValueError),
+        (["FR"], "1017 XN", ValueError),
+        ([], "75017", ValueError),
+        (["FR"], 75017, TypeError),
+    ],
+)
+def test_coerce_input_output_countries(countries, input_val, exception):
+    scalar = PostalCode(countries=countries)
+    if exception:
+        with pytest.raises(exception):
+            scalar.coerce_input(input_val)
+        with pytest.raises(exception):
+            scalar.coerce_output(input_val)
+        assert (
+            scalar.parse_literal(StringValueNode(value=input_val))
+            is UNDEFINED_VALUE
+        )
+    else:
+        assert scalar.coerce_input(input_val) == input_val
+        assert scalar.coerce_output(input_val) == input_val
+        assert (
+            scalar.parse_literal(StringValueNode(value=input_val)) == input_val
+        )
+
+
+def test_unknown_country():
+    with pytest.raises(ValueError):
+        PostalCode(countries=["FR", "XX"])